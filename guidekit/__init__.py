@@ -0,0 +1,39 @@
+"""Shared build tooling for the Zero-to-Hero guide PDFs.
+
+The story toolkit is re-exported here but imported lazily: ``import guidekit``
+costs nothing until a helper is first used, so the build driver and cache tools
+don't pay for ReportLab's platypus import in processes that never lay out a page.
+
+    from guidekit import code_block, callout, std_table, th, td, tdc
+"""
+import importlib
+
+_EXPORTS = {
+    "guidekit.styles": ("S", "sTitle", "sSubtitle", "sAuthor", "sH1", "sH2", "sH3", "sBody",
+                        "sBullet", "sCode", "sCodeCmt", "sLabel", "sNote", "sFormula",
+                        "sCaption", "sTOC", "sTOCSub", "sTag"),
+    "guidekit.blocks": ("P", "code_block", "callout", "section_divider", "std_table",
+                        "th", "td", "tdc", "badge", "page_background"),
+    "guidekit.flowables": ("ColorRect", "HRule"),
+    "guidekit.visuals.arrays": ("pointer_vis", "window_vis"),
+    "guidekit.visuals.linked": ("node_chain",),
+    "guidekit.visuals.stacks": ("stack_vis", "queue_vis", "mono_stack_vis"),
+    "guidekit.story": ("section", "LazyStory", "build_story", "toc"),
+    "guidekit.toc": ("table_of_contents",),
+}
+_LAZY = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'guidekit' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,64 @@
+"""python -m guidekit [guide ...] [-o DIR] [-j N] [-f FORMAT] [--scratch DIR] [--stream] [--no-optimize] [--incremental] [--profile DIR] [--site | --combined | --snippets [--verify-max-n N]]"""
+import argparse
+import sys
+import time
+
+from guidekit.combined import build_combined
+from guidekit.driver import FORMATS, OUT_DIR, build_all, format_report, select_guides
+from guidekit.site import SITE_DIR, build_site
+from guidekit.snippets import SNIPPET_DIR, build_snippets
+from guidekit.verify import MIN_MAX_N, verify_guides
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m guidekit",
+        description="Build the guides (PDF, HTML or Markdown) concurrently.")
+    ap.add_argument("guides", nargs="*", help="guide names (default: all)")
+    ap.add_argument("-o", "--out-dir", default=None,
+        help=f"directory the outputs are written to (default: {OUT_DIR}, {SITE_DIR} with --site, "
+             f"{SNIPPET_DIR} with --snippets)")
+    ap.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    ap.add_argument("-f", "--format", choices=FORMATS, default="pdf", help="output format")
+    ap.add_argument("--scratch", metavar="DIR", default=None,
+        help="write outputs here first (e.g. a tmpfs like /dev/shm), then move them into place")
+    ap.add_argument("--stream", action="store_true",
+        help="write each page to the output as soon as it is laid out (flat memory use)")
+    ap.add_argument("--no-optimize", action="store_true",
+        help="skip the content-stream optimization pass")
+    ap.add_argument("-i", "--incremental", action="store_true",
+        help="skip guides whose story fingerprint matches the last build")
+    ap.add_argument("-p", "--profile", metavar="DIR", default=None,
+        help="profile layout per section and helper; write <guide>.json/.txt reports to DIR")
+    ap.add_argument("--site", action="store_true",
+        help="build the static HTML site: guide pages, an index page and a search index")
+    ap.add_argument("--combined", action="store_true",
+        help="build one cross-linked PDF of all the guides with a master problem index")
+    ap.add_argument("--snippets", action="store_true",
+        help="extract each guide's code blocks into an importable module and check that it compiles")
+    ap.add_argument("--verify-max-n", type=int, default=10 ** 5, metavar="N",
+        help=f"with --snippets, then run guidekit.verify up to input size N (at least {MIN_MAX_N}; 0 to skip)")
+    args = ap.parse_args(argv)
+    if args.verify_max_n and args.verify_max_n < MIN_MAX_N:
+        ap.error(f"--verify-max-n must be 0 or at least {MIN_MAX_N}")
+
+    t0 = time.perf_counter()
+    if args.site:
+        results = build_site(select_guides(args.guides), args.out_dir or SITE_DIR, scratch=args.scratch)
+    elif args.snippets:
+        paths, out_dir = select_guides(args.guides), args.out_dir or SNIPPET_DIR
+        results = build_snippets(paths, out_dir, scratch=args.scratch)
+        if args.verify_max_n and not any("error" in r for r in results):
+            results += verify_guides(paths, out_dir, max_n=args.verify_max_n)
+    elif args.combined:
+        results = [build_combined(select_guides(args.guides), args.out_dir or OUT_DIR,
+                                  scratch=args.scratch, optimize=not args.no_optimize)]
+    else:
+        results = build_all(select_guides(args.guides), args.out_dir or OUT_DIR, jobs=args.jobs,
+                            fmt=args.format, incremental=args.incremental, profile_dir=args.profile,
+                            scratch=args.scratch, stream=args.stream, optimize=not args.no_optimize)
+    print(format_report(results, time.perf_counter() - t0))
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
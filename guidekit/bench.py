@@ -0,0 +1,234 @@
+"""Benchmark suite: ``python -m guidekit.bench [guide ...] [-n RUNS] [--save | --check]``.
+
+Each guide is built `runs` times in this process, from a fresh run of its script
+(story construction plus layout), into memory rather than onto disk and with
+the driver's default output optimization. For each guide the suite records
+the median, p95 and min wall time, the output size, the page count and the
+tracemalloc peak of one extra, untimed build. The
+micro-benchmarks time the hot story helpers: build, wrap and draw one
+representative flowable, many times over.
+
+Timings are machine-specific, so the baseline lives in the local cache
+(``.guide-cache/bench-baseline.json``). ``--save`` records the current results
+as the baseline. ``--check`` compares against it and exits non-zero when a
+guide's median time, allocation peak or output size grows by more than
+``--threshold`` (10% by default), or a helper's min time by more than
+``--micro-threshold`` (25%). A helper call takes microseconds, so its median
+moves with whatever else the machine is doing; the min of many runs does not.
+"""
+import argparse
+import io
+import json
+import math
+import os
+import runpy
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from guidekit.cache import CACHE_DIR
+from guidekit.driver import select_guides
+from guidekit.optimize import optimizing
+from guidekit.story import LazyStory
+
+BASELINE = CACHE_DIR / "bench-baseline.json"
+
+
+def _p95(samples):
+    s = sorted(samples)
+    return s[max(0, math.ceil(0.95 * len(s)) - 1)]
+
+
+def _summary(samples):
+    return {"median": statistics.median(samples), "p95": _p95(samples), "min": min(samples)}
+
+
+# ── Guide builds ───────────────────────────────────────────────────────────────
+def _build_once(path):
+    g = runpy.run_path(str(path), run_name="__guide__")
+    doc, out = g["doc"], io.BytesIO()
+    doc.filename = out
+    doc.build(LazyStory(g["SECTIONS"]), onFirstPage=g["add_page_bg"], onLaterPages=g["add_page_bg"],
+              canvasmaker=optimizing())
+    return len(out.getvalue()), doc.page
+
+
+def bench_guide(path, runs=5, warmup=1):
+    """Build one guide `runs` times (after `warmup` untimed builds) and summarise."""
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    for _ in range(warmup):
+        _build_once(path)
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        size, pages = _build_once(path)
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        _build_once(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return dict(_summary(times), runs=runs, bytes=size, pages=pages, alloc_peak=peak)
+
+
+# ── Helper micro-benchmarks ────────────────────────────────────────────────────
+def _micro_cases():
+    from guidekit.blocks import code_block, std_table, td, tdc, th
+    from guidekit.palette import C_ACCENT, C_GREEN, CW
+    from guidekit.visuals.arrays import pointer_vis
+    from guidekit.visuals.linked import node_chain
+    from guidekit.visuals.stacks import mono_stack_vis
+
+    snippet = [
+        "## ■■■ Variable-size window ■■■",
+        "def min_window(s, t):",
+        "    need, have = Counter(t), {}",
+        "    left = formed = 0",
+        "    best = (float('inf'), 0, 0)",
+        "    for right, ch in enumerate(s):",
+        "        have[ch] = have.get(ch, 0) + 1",
+        "        if ch in need and have[ch] == need[ch]:",
+        "            formed += 1",
+        "        while formed == len(need):",
+        "            if right - left + 1 < best[0]:",
+        "                best = (right - left + 1, left, right)",
+        "            have[s[left]] -= 1  ## shrink",
+        "            left += 1",
+        "    return \"\" if best[0] == float('inf') else s[best[1]:best[2] + 1]",
+    ]
+    rows = [[th("#"), th("Problem"), th("Pattern"), th("Key idea")]] + [
+        [tdc(str(i), C_ACCENT), td(f"LC {100 + i}. Example problem {i}"), td("Prefix + HashMap", C_GREEN),
+         td("Store first index of each running sum; answer is i - first[sum - k].")]
+        for i in range(12)]
+    return {
+        "code_block": lambda: code_block(snippet)[0],
+        "std_table": lambda: std_table(rows, [30, 170, 110, CW - 310]),
+        "pointer_vis": lambda: pointer_vis([1, 2, 3, 4, 6, 8, 9, 11], 1, 6, mid_idx=3)[0],
+        "node_chain": lambda: node_chain([1, 2, 3, 4, 5, 6], highlight=[0, 3],
+                                         pointer_labels={0: "head", 3: "slow"})[0],
+        "mono_stack_vis": lambda: mono_stack_vis([9, 7, 4], current=5, action="pop 4 → next greater = 5",
+                                                 arr=[2, 9, 7, 4, 5, 1], arr_highlight=[4])[0],
+    }
+
+
+def bench_helpers(runs=1000, warmup=20):
+    """Median/p95/min microseconds to build, wrap and draw each hot helper's flowable.
+
+    The first `warmup` iterations, which fill the helpers' caches, are not timed.
+    """
+    from reportlab.pdfgen.canvas import Canvas
+    from guidekit.palette import CW
+    canvas = Canvas(io.BytesIO())
+    out = {}
+    for name, make in _micro_cases().items():
+        samples = []
+        for i in range(warmup + runs):
+            t0 = time.perf_counter()
+            f = make()
+            f.wrap(CW, 10_000)
+            f.drawOn(canvas, 0, 0)
+            if i >= warmup:
+                samples.append((time.perf_counter() - t0) * 1e6)
+        canvas._code.clear()
+        out[name] = dict(_summary(samples), runs=runs)
+    return out
+
+
+# ── Baseline ───────────────────────────────────────────────────────────────────
+def load_baseline(path=BASELINE):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(results, path=BASELINE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1)
+    os.replace(tmp, path)
+
+
+def regressions(current, baseline, threshold=0.10, micro_threshold=0.25):
+    """List the metrics in `current` that exceed `baseline` by more than `threshold`.
+
+    Helpers are compared by min time, against `micro_threshold`.
+    """
+    found = []
+    def check(label, now, then, threshold=threshold):
+        if then and now > then * (1 + threshold):
+            found.append(f"{label}: {then:.4g} -> {now:.4g} (+{(now / then - 1) * 100:.0f}%)")
+    for guide, r in current.get("guides", {}).items():
+        b = baseline.get("guides", {}).get(guide)
+        if b:
+            for key in ("median", "alloc_peak", "bytes"):
+                check(f"{guide} {key}", r[key], b[key])
+    for name, r in current.get("helpers", {}).items():
+        b = baseline.get("helpers", {}).get(name)
+        if b:
+            check(f"{name} min_us", r["min"], b["min"], micro_threshold)
+    return found
+
+
+def format_results(results):
+    lines = [f"{'guide':<20} {'median':>8} {'p95':>8} {'min':>8} {'alloc peak':>11} {'bytes':>9} {'pages':>6}"]
+    for guide, r in results["guides"].items():
+        lines.append(f"{guide:<20} {r['median']:>7.3f}s {r['p95']:>7.3f}s {r['min']:>7.3f}s "
+                     f"{r['alloc_peak']/2**20:>9.1f}MB {r['bytes']:>9} {r['pages']:>6}")
+    if results.get("helpers"):
+        lines += ["", f"{'helper':<20} {'median':>9} {'p95':>9} {'min':>9}"]
+        for name, r in results["helpers"].items():
+            lines.append(f"{name:<20} {r['median']:>7.0f}us {r['p95']:>7.0f}us {r['min']:>7.0f}us")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m guidekit.bench",
+        description="Benchmark guide builds and the hot story helpers.")
+    ap.add_argument("guides", nargs="*", help="guide names (default: all)")
+    ap.add_argument("-n", "--runs", type=int, default=5, help="timed builds per guide")
+    ap.add_argument("--micro-runs", type=int, default=1000, help="iterations per helper micro-benchmark")
+    ap.add_argument("--no-micro", action="store_true", help="skip the helper micro-benchmarks")
+    ap.add_argument("--baseline", default=str(BASELINE), help="baseline JSON file")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="record these results as the baseline")
+    mode.add_argument("--check", action="store_true", help="fail on regressions against the baseline")
+    ap.add_argument("--threshold", type=float, default=0.10,
+        help="allowed relative growth before --check fails (default 0.10)")
+    ap.add_argument("--micro-threshold", type=float, default=0.25,
+        help="the same for the helpers' min times (default 0.25)")
+    args = ap.parse_args(argv)
+
+    results = {"guides": {}, "helpers": {}}
+    for path in select_guides(args.guides):
+        results["guides"][path.stem] = bench_guide(path, args.runs)
+    if not args.no_micro:
+        results["helpers"] = bench_helpers(args.micro_runs)
+    print(format_results(results))
+
+    baseline_path = Path(args.baseline)
+    if args.save:
+        save_baseline(results, baseline_path)
+        print(f"baseline saved to {baseline_path}")
+    elif args.check:
+        baseline = load_baseline(baseline_path)
+        if baseline is None:
+            print(f"no baseline at {baseline_path}; run with --save first")
+            return 2
+        found = regressions(results, baseline, args.threshold, args.micro_threshold)
+        for line in found:
+            print("REGRESSION", line)
+        if found:
+            return 1
+        print(f"no regressions beyond {args.threshold:.0%} ({args.micro_threshold:.0%} for helpers)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Story building blocks shared by every guide: code blocks, callouts, tables, page template."""
+import functools
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from guidekit.flowables import CodeBlock, LazyParagraph
+from guidekit.palette import (
+    C_ACCENT, C_BG, C_BODY, C_BORDER, C_CARD, C_DARK2, C_HEADING, C_MUTED,
+    CW, MARGIN_X, PAGE_H, PAGE_W,
+)
+from guidekit.styles import S
+
+P = LazyParagraph   # shorthand
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+def helper(fn):
+    """Tag every flowable `fn` returns with its name (``f._helper``).
+
+    The first flowable also keeps the call's arguments (``f._call``), so other
+    output formats can render the helper from its inputs rather than from the
+    ReportLab layout. The profiler uses the name.
+    """
+    @functools.wraps(fn)
+    def tagged(*args, **kw):
+        out = fn(*args, **kw)
+        many = out if isinstance(out, list) else (out,)
+        for f in many:
+            f._helper = fn.__name__
+        many[0]._call = (args, kw)
+        return out
+    return tagged
+
+@helper
+def code_block(lines, lang="python", highlight=True):
+    """Render a styled code block, syntax-highlighted unless `highlight` is off."""
+    return [CodeBlock(lines, lang, highlight=highlight, width=CW), Spacer(1,8)]
+
+@helper
+def callout(text, color=C_ACCENT, icon="💡"):
+    tbl = Table([[P(f"{icon}  {text}", S("_", fontName="Helvetica", fontSize=9.5, leading=14, textColor=color))]],
+        colWidths=[CW], style=TableStyle([
+            ("BACKGROUND",(0,0),(-1,-1),colors.HexColor("#0C1F35")),
+            ("LEFTPADDING",(0,0),(-1,-1),14),("RIGHTPADDING",(0,0),(-1,-1),14),
+            ("TOPPADDING",(0,0),(-1,-1),9),("BOTTOMPADDING",(0,0),(-1,-1),9),
+            ("LINEBEFORE",(0,0),(0,-1),3,color)]))
+    return [tbl, Spacer(1,6)]
+
+@helper
+def section_divider(num, title):
+    lbl = f"{num:02d}" if num > 0 else "  "
+    head = Spacer(1,10)
+    head._section = f"{lbl.strip()} {title}".strip()   # profiler: a new section starts here
+    return [
+        head,
+        Table([[
+            P(f"<b>{lbl}</b>", S("_", fontName="Helvetica-Bold", fontSize=22, textColor=C_ACCENT)),
+            P(f"<b>{title}</b>", S("_", fontName="Helvetica-Bold", fontSize=18, textColor=C_HEADING, leading=24)),
+        ]], colWidths=[40, CW-40], style=TableStyle([
+            ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+            ("LEFTPADDING",(0,0),(0,-1),0),("RIGHTPADDING",(0,0),(-1,-1),0),
+            ("LINEBELOW",(0,0),(-1,-1),2,C_ACCENT),("BOTTOMPADDING",(0,0),(-1,-1),6)])),
+        Spacer(1,8)]
+
+@helper
+def std_table(data, col_widths, row_colors=None):
+    """Render a styled data table: dark header row, alternating body rows."""
+    return Table(data, colWidths=col_widths, style=TableStyle([
+        ("BACKGROUND",(0,0),(-1,0),C_BG),
+        ("ROWBACKGROUNDS",(0,1),(-1,-1),row_colors or [C_CARD, C_DARK2]),
+        ("BOX",(0,0),(-1,-1),1,C_BORDER),("INNERGRID",(0,0),(-1,-1),0.5,C_BORDER),
+        ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+        ("TOPPADDING",(0,0),(-1,-1),7),("BOTTOMPADDING",(0,0),(-1,-1),7),
+        ("LEFTPADDING",(0,0),(-1,-1),8)]))
+
+def th(t, c=C_MUTED): return P(f"<b>{t}</b>", S("_", fontName="Helvetica-Bold", fontSize=9, textColor=c))
+def td(t, c=C_BODY, f="Helvetica", sz=9): return P(t, S("_", fontName=f, fontSize=sz, textColor=c, leading=13))
+def tdc(t, c=C_BODY): return P(t, S("_", fontName="Courier", fontSize=9, textColor=c))
+
+@helper
+def badge(text, bg=C_ACCENT, fg=C_BG):
+    return Table([[P(f"<b>{text}</b>", S("_", fontName="Helvetica-Bold", fontSize=8, textColor=fg))]],
+        colWidths=[len(text)*6+14], style=TableStyle([
+            ("BACKGROUND",(0,0),(-1,-1),bg),("ROUNDEDCORNERS",[4]),
+            ("TOPPADDING",(0,0),(-1,-1),3),("BOTTOMPADDING",(0,0),(-1,-1),3),
+            ("LEFTPADDING",(0,0),(-1,-1),7),("RIGHTPADDING",(0,0),(-1,-1),7)]))
+
+
+# ── Page background ────────────────────────────────────────────────────────────
+PAGE_FORM = "BG"
+
+
+def _draw_page_form(canvas):
+    """Record the static page background (fill and footer rule) as a form XObject."""
+    canvas.beginForm(PAGE_FORM)
+    canvas.setFillColor(C_BG)
+    canvas.rect(0, 0, PAGE_W, PAGE_H, fill=1, stroke=0)
+    canvas.setStrokeColor(C_BORDER)
+    canvas.setLineWidth(0.5)
+    canvas.line(MARGIN_X, 0.55*inch, PAGE_W - MARGIN_X, 0.55*inch)
+    canvas.endForm()
+
+
+def page_background(footer):
+    """Return the `add_page_bg(canvas, doc)` callback that paints every page.
+
+    `footer` is the guide name shown before the page number, e.g.
+    "Prefix Sum — Zero to Hero". The background and footer rule are drawn
+    once per document as a form and referenced from each page; only the
+    footer text is drawn per page.
+    """
+    def add_page_bg(canvas, doc):
+        if not canvas.hasForm(PAGE_FORM):
+            _draw_page_form(canvas)
+        canvas.saveState()
+        canvas.doForm(PAGE_FORM)
+        canvas.setFillColor(C_MUTED)
+        canvas.setFont("Helvetica", 8)
+        canvas.drawCentredString(PAGE_W/2, 0.35*inch, f"{footer}  ·  Page {doc.page}")
+        canvas.restoreState()
+    add_page_bg.footer = footer
+    return add_page_bg
@@ -0,0 +1,57 @@
+"""Build manifest for incremental rebuilds.
+
+The manifest maps each output PDF to the fingerprint of the story and toolkit
+sources that produced it (`guidekit.fingerprint.guide_fingerprint`) and the
+SHA-256 of the file written. A guide is up to date when both match.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".guide-cache"
+MANIFEST = CACHE_DIR / "manifest.json"
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_manifest(path=MANIFEST):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def is_fresh(entry, output, fingerprint):
+    """True when `output` exists and was produced from exactly `fingerprint`."""
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    if not os.path.exists(output):
+        return False
+    return file_sha256(output) == entry.get("sha256")
+
+
+def record(manifest, result):
+    """Store a successful build result in the manifest."""
+    manifest[result["output"]] = {
+        "guide":       result["guide"],
+        "fingerprint": result["fingerprint"],
+        "sha256":      result["sha256"],
+        "pages":       result["pages"],
+    }
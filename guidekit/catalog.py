@@ -0,0 +1,237 @@
+"""Problem catalog: every LeetCode problem the guides cover, indexed for lookup.
+
+``python -m guidekit.catalog [LC ...]``
+
+The catalog is read from the document model (`guidekit.model`) of every
+guide. Each row of a "LeetCode Problem Roadmap" table becomes a `Problem`:
+
+* difficulty from the marker on the table's heading (🟢 easy, 🟡 medium,
+  🔴 hard);
+* pattern from the table's Pattern/Technique column. The sliding-window
+  roadmap groups by window kind instead and gives the window state in that
+  column, so there the heading ("Fixed-Size Window") is the pattern.
+
+Every other "LC 560" in the text, tables or code comments becomes a
+`Reference`.
+
+`Catalog` keeps dicts by id, pattern and guide, so "which guides cover LC 560"
+is a dict lookup. Building it means running all six guide scripts. `load()`
+caches the result as JSON in ``.guide-cache/catalog.json``, keyed by the
+scripts' hashes and the guidekit sources (`guidekit.fingerprint.toolkit_digest`),
+so later lookups (cross-linking, the practice scheduler) skip the scripts
+until one of them or the extraction code changes::
+
+    from guidekit.catalog import load
+    load().guides_for(560)        # frozenset({'hashing-patterns', 'prefixsum'})
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+
+from guidekit import cache
+from guidekit.driver import discover_guides, run_guide
+from guidekit.fingerprint import toolkit_digest
+from guidekit.model import (
+    Callout, Code, Grid, Heading, Para, Visual, cell_text, document, plain, problem_numbers,
+)
+
+CATALOG = cache.CACHE_DIR / "catalog.json"
+VERSION = 1                 # bump when the JSON layout changes
+
+Problem = namedtuple("Problem", "id title pattern difficulty guide section insight anchor details")
+Reference = namedtuple("Reference", "id guide section anchor")
+
+DIFFICULTY = {"🟢": "easy", "🟡": "medium", "🔴": "hard"}
+_PATTERN_COLUMNS = ("Pattern", "Technique")
+_INSIGHT_COLUMN = "Key Insight"
+_LC = re.compile(r"\bLC\s*(\d+(?:(?:\s*,\s*(?:and\s+)?|\s+and\s+)\d+)*)")
+
+
+def _difficulty(heading):
+    for mark, level in DIFFICULTY.items():
+        if heading.startswith(mark):
+            return level
+    return None
+
+
+def _roadmap(guide, sec, heading, grid):
+    """The `Problem`s on the rows of roadmap table `grid`."""
+    header = [cell_text(c) for c in grid.rows[0]]
+    title = heading.lstrip("".join(DIFFICULTY)).strip()
+    for row, num, anchor in zip(grid.rows, problem_numbers(grid), grid.row_ids):
+        if num is None:
+            continue
+        cells = dict(zip(header, (cell_text(c) for c in row)))
+        pattern = next((cells[h] for h in _PATTERN_COLUMNS if h in cells), None)
+        if pattern is None:
+            pattern = title.split(" — ")[0]
+        details = tuple((h, v) for h, v in cells.items()
+                        if h not in ("#", "Problem", _INSIGHT_COLUMN, *_PATTERN_COLUMNS))
+        yield Problem(num, cells.get("Problem", ""), pattern, _difficulty(heading), guide,
+                      sec.title, cells.get(_INSIGHT_COLUMN, ""), anchor, details)
+
+
+def _texts(b):
+    """The text of model node `b` and of anything nested in it."""
+    if type(b) in (Para, Heading, Callout):
+        yield b.text
+    elif type(b) is Code:
+        yield from b.lines
+    elif type(b) in (Grid, Visual):
+        for row in (b if type(b) is Grid else b.table).rows:
+            for cell in row:
+                for inner in cell.blocks:
+                    yield from _texts(inner)
+
+
+def lc_numbers(text):
+    """The problem numbers an "LC 303, 560 and 304"-style reference in `text` names."""
+    return [int(n) for m in _LC.finditer(plain(text)) for n in re.findall(r"\d+", m.group(1))]
+
+
+def extract(doc):
+    """The roadmap `Problem`s and the `Reference`s elsewhere in model document `doc`."""
+    problems, refs, seen = [], [], set()
+    for sec in doc.sections:
+        heading, anchor = "", sec.id
+        for b in sec.blocks:
+            if type(b) is Heading:
+                heading, anchor = plain(b.text), b.id
+            if type(b) is Grid and b.row_ids:
+                problems.extend(_roadmap(doc.name, sec, heading, b))
+                continue
+            for text in _texts(b):
+                for n in lc_numbers(text):
+                    if (n, anchor) not in seen:      # once per heading is enough
+                        seen.add((n, anchor))
+                        refs.append(Reference(n, doc.name, sec.title, anchor))
+    return problems, refs
+
+
+class Catalog:
+    """The guides' problems, indexed by id, pattern and guide.
+
+    A problem on several roadmaps has one `Problem` per guide. Patterns are
+    matched case-insensitively.
+    """
+
+    def __init__(self, problems, references=()):
+        self.problems = tuple(problems)
+        self.references = tuple(references)
+        self.by_id, self.by_pattern, self.by_guide = {}, {}, {}
+        self._covered = {}
+        for p in self.problems:
+            self.by_id.setdefault(p.id, []).append(p)
+            self.by_pattern.setdefault(p.pattern.lower(), []).append(p)
+            self.by_guide.setdefault(p.guide, []).append(p)
+            self._covered.setdefault(p.id, set()).add(p.guide)
+        self._mentions = {}
+        for r in self.references:
+            self._mentions.setdefault(r.id, []).append(r)
+            self._covered.setdefault(r.id, set()).add(r.guide)
+        self._covered = {k: frozenset(v) for k, v in self._covered.items()}
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, problem_id):
+        return int(problem_id) in self.by_id
+
+    def get(self, problem_id):
+        """The roadmap entries for `problem_id` (one per guide listing it)."""
+        return self.by_id.get(int(problem_id), [])
+
+    def guides_for(self, problem_id):
+        """The guides that cover `problem_id`, on their roadmap or in the text."""
+        return self._covered.get(int(problem_id), frozenset())
+
+    def mentions(self, problem_id):
+        """Where the text refers to `problem_id` outside the roadmaps."""
+        return self._mentions.get(int(problem_id), [])
+
+    def with_pattern(self, pattern):
+        return self.by_pattern.get(pattern.lower(), [])
+
+    def in_guide(self, guide):
+        return self.by_guide.get(guide, [])
+
+    def patterns(self):
+        return sorted({p.pattern for p in self.problems})
+
+    def to_json(self):
+        return {"version": VERSION,
+                "problems": [p._replace(details=[list(d) for d in p.details])._asdict()
+                             for p in self.problems],
+                "references": [r._asdict() for r in self.references]}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls((Problem(**dict(p, details=tuple(map(tuple, p["details"]))))
+                    for p in data["problems"]),
+                   (Reference(**r) for r in data["references"]))
+
+
+def build(paths=None):
+    """Build the catalog by reading the guide scripts in `paths` (default: all)."""
+    problems, refs = [], []
+    for path in paths or discover_guides():
+        p, r = extract(document(run_guide(path), path.stem))
+        problems += p
+        refs += r
+    return Catalog(problems, refs)
+
+
+def load(paths=None, path=CATALOG):
+    """The catalog for the guides in `paths`, from the cache while they and guidekit are unchanged."""
+    paths = list(paths or discover_guides())
+    key = {"version": VERSION, "toolkit": toolkit_digest(),
+           "guides": {p.stem: cache.file_sha256(p) for p in paths}}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key") == key:
+            return Catalog.from_json(data["catalog"])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+    catalog = build(paths)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "catalog": catalog.to_json()}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+    return catalog
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m guidekit.catalog",
+        description="Look up LeetCode problems in the guides' catalog.")
+    ap.add_argument("ids", nargs="*", type=int, help="problem numbers (default: list every problem)")
+    ap.add_argument("--pattern", help="list the problems with this pattern")
+    ap.add_argument("--guide", help="list the problems on this guide's roadmap")
+    args = ap.parse_args(argv)
+
+    catalog = load()
+    if args.pattern or args.guide:
+        found = catalog.with_pattern(args.pattern) if args.pattern else catalog.problems
+        found = [p for p in found if not args.guide or p.guide == args.guide]
+    elif args.ids:
+        for n in args.ids:
+            guides = ", ".join(sorted(catalog.guides_for(n))) or "-"
+            print(f"LC {n}: {guides}")
+            for p in catalog.get(n):
+                print(f"  {p.guide:<18} {p.difficulty or '-':<7} {p.pattern:<22} {p.title}")
+            for r in catalog.mentions(n):
+                print(f"  {r.guide:<18} mentioned in {r.section}")
+        return 0
+    else:
+        found = catalog.problems
+    for p in found:
+        print(f"{p.id:>5}  {p.guide:<18} {p.difficulty or '-':<7} {p.pattern:<22} {p.title}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
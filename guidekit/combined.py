@@ -0,0 +1,208 @@
+"""Combined edition: all six guides in one cross-linked PDF.
+
+    python -m guidekit --combined
+
+The guides' stories are laid out one after another into a single document,
+each under its own page footer, followed by a master problem index built from
+the catalog (`guidekit.catalog`):
+
+* the outline has an entry per guide and, under it, per section;
+* every "LC 560" in a paragraph and every roadmap number links to the
+  problem's entry in the master index;
+* each index entry links back to the roadmap rows that list the problem, or
+  to the guides that mention it.
+
+One document means one copy of each font and of the page-background form, and
+one process laying out all the stories without a merge step afterwards.
+"""
+import re
+import time
+from html import escape
+from pathlib import Path
+
+from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak, SimpleDocTemplate, Spacer
+from reportlab.platypus.doctemplate import ActionFlowable
+
+from guidekit.blocks import P, page_background, std_table, td, tdc, th
+from guidekit.catalog import Catalog, extract
+from guidekit.driver import OUT_DIR, _peak_rss_kb, run_guide
+from guidekit.flowables import Bookmark
+from guidekit.model import document, plain
+from guidekit.optimize import optimizing
+from guidekit.output import atomic_output
+from guidekit.palette import C_ACCENT, C_BODY, C_GREEN, C_MUTED, C_RED, C_YELLOW
+from guidekit.story import LazyStory
+from guidekit.styles import S, sAuthor, sBody, sSubtitle, sTitle
+from guidekit.toc import front_matter
+
+FILENAME = "All_Patterns_Zero_To_Hero.pdf"
+TITLE = "All Patterns — Zero to Hero"
+INDEX_KEY = "problem-index"
+
+_LC = re.compile(r"\bLC(\s*)(\d+(?:(?:\s*,\s*(?:and\s+)?|\s+and\s+)\d+)*)")
+_NUM = re.compile(r"\d+")
+_LINK = '<a href="#lc-{0}" color="#38BDF8">{1}</a>'
+_DIFFICULTY_COLORS = {"easy": C_GREEN, "medium": C_YELLOW, "hard": C_RED}
+
+
+def _short(title):
+    return title.split(" — ")[0]
+
+
+# ── Links ──────────────────────────────────────────────────────────────────────
+class _Footer(ActionFlowable):
+    """Switch the page callback from the next page on (placed before a page break)."""
+
+    def __init__(self, pages, callback):
+        ActionFlowable.__init__(self)
+        self.pages, self.callback = pages, callback
+
+    def apply(self, doc):
+        self.pages[0] = self.callback
+
+
+def _set_text(p, text):
+    if "_pending" in vars(p):           # a LazyParagraph that has not parsed yet
+        p.text = text
+    else:
+        p.__init__(text, p.style)
+
+
+def _link_refs(text, known):
+    """`text` with each problem number of an "LC ..." reference linked to the index."""
+    def numbers(m):
+        return _NUM.sub(lambda n: _LINK.format(n.group(), n.group()) if int(n.group()) in known
+                        else n.group(), m.group())
+    return _LC.sub(numbers, text)
+
+
+def _is_roadmap(rows):
+    head = rows[0][0] if rows and rows[0] else None
+    return getattr(head, "text", None) is not None and plain(head.text) == "#"
+
+
+def link(f, guide, known):
+    """Rewrite flowable `f` (in place) so its LC references link to the master index.
+
+    A roadmap table's numbers also become the destinations ``<guide>/lc-<n>``
+    that the index links back to.
+    """
+    text = getattr(f, "text", None)
+    if isinstance(text, str) and hasattr(f, "style"):
+        if "LC" in text:
+            _set_text(f, _link_refs(text, known))
+        return f
+    rows = getattr(f, "_cellvalues", None)
+    if rows is not None:
+        roadmap = _is_roadmap(rows)
+        for r, row in enumerate(rows):
+            for c, v in enumerate(row):
+                if roadmap and r and c == 0 and plain(getattr(v, "text", "")).isdigit():
+                    n = int(plain(v.text))
+                    _set_text(v, f'<a name="{guide}/lc-{n}"/>' + _LINK.format(n, v.text))
+                    continue
+                for inner in v if isinstance(v, (list, tuple)) else (v,):
+                    link(inner, guide, known)
+        return f
+    for inner in getattr(f, "_content", None) or ():
+        link(inner, guide, known)
+    return f
+
+
+# ── Story ──────────────────────────────────────────────────────────────────────
+def _cover(guides):
+    yield Spacer(1, 1.2*inch)
+    yield P("ALL PATTERNS", sTitle)
+    yield P("Zero to Hero: The Complete LeetCode Guide Collection", sSubtitle)
+    yield Spacer(1, 0.15*inch)
+    yield P(" · ".join(_short(g["add_page_bg"].footer) for _, g in guides), sAuthor)
+    yield Spacer(1, 0.3*inch)
+    for n, (stem, g) in enumerate(guides, 1):
+        yield P(f'<b>{n:02d}</b>&nbsp;&nbsp;&nbsp;<a href="#{stem}">{g["add_page_bg"].footer}</a>',
+                S("_", fontName="Helvetica", fontSize=13, leading=24, textColor=C_BODY))
+    yield P(f'<b>{len(guides) + 1:02d}</b>&nbsp;&nbsp;&nbsp;<a href="#{INDEX_KEY}">Master Problem Index</a>',
+            S("_", fontName="Helvetica", fontSize=13, leading=24, textColor=C_BODY))
+
+
+def _guide_story(stem, g, known):
+    title = g["add_page_bg"].footer
+    yield Bookmark(stem, title, 0)
+    # The guide's own contents page is left out: the outline does its job here.
+    contents = [s for s in front_matter(g["SECTIONS"]) if s.num == 0]
+    for i, sec in enumerate(s for s in g["SECTIONS"] if s not in contents):
+        if i:
+            yield PageBreak()
+        if sec.num is not None:
+            label = f"{sec.num:02d} · {sec.title}" if sec.num else sec.title
+            yield Bookmark(f"{stem}/{sec.__name__}", label, 1)
+        for f in sec():
+            yield link(f, stem, known)
+
+
+def _index(catalog, titles):
+    yield Bookmark(INDEX_KEY, "Master Problem Index", 0)
+    yield P("Master Problem Index", sTitle)
+    yield P("Every problem on a roadmap or mentioned in the text, once. Follow a guide name "
+            "to the roadmap row (or the guide) that covers it.", sBody)
+    yield Spacer(1, 8)
+    rows = [[th("#"), th("Problem"), th("Pattern"), th("Covered in")]]
+    for n in sorted(catalog.by_id.keys() | {r.id for r in catalog.references}):
+        entries = catalog.get(n)
+        first = entries[0] if entries else None
+        where = [f'<a href="#{p.guide}/lc-{n}">{_short(titles[p.guide])}</a>' for p in entries]
+        where += [f'<a href="#{g}">{_short(titles[g])}</a>'
+                  for g in sorted(catalog.guides_for(n) - {p.guide for p in entries})]
+        color = _DIFFICULTY_COLORS.get(first.difficulty, C_MUTED) if first else C_MUTED
+        rows.append([tdc(f'<a name="lc-{n}"/>{n}', color),
+                     td(escape(first.title, quote=False) if first else "<i>mentioned only</i>",
+                        C_BODY if first else C_MUTED),
+                     td(escape(" / ".join(dict.fromkeys(p.pattern for p in entries)), quote=False) or "—",
+                        C_ACCENT),
+                     td(" · ".join(where), C_MUTED)])
+    table = std_table(rows, [38, 190, 120, 132])
+    table.repeatRows = 1
+    yield table
+
+
+def combined_story(guides, catalog, pages):
+    """The combined story for `guides` (``[(stem, namespace)]``), switching footers via `pages`."""
+    titles = {stem: g["add_page_bg"].footer for stem, g in guides}
+    known = catalog.by_id.keys() | {r.id for r in catalog.references}
+    yield from _cover(guides)
+    for stem, g in guides:
+        yield _Footer(pages, g["add_page_bg"])
+        yield PageBreak()
+        yield from _guide_story(stem, g, known)
+    yield _Footer(pages, page_background("Master Problem Index"))
+    yield PageBreak()
+    yield from _index(catalog, titles)
+
+
+def build_combined(paths, out_dir=OUT_DIR, scratch=None, optimize=True):
+    """Build the combined edition of the guides in `paths`; returns a build_all-style result."""
+    t0 = time.perf_counter()
+    guides = [(Path(p).stem, run_guide(p)) for p in paths]
+    problems, refs = [], []
+    for stem, g in guides:
+        p, r = extract(document(g, stem))
+        problems += p
+        refs += r
+    catalog = Catalog(problems, refs)
+
+    first = guides[0][1]["doc"]
+    output = Path(out_dir).resolve() / FILENAME
+    pages = [page_background(TITLE)]
+
+    def on_page(canvas, doc):
+        pages[0](canvas, doc)
+
+    with atomic_output(output, scratch) as tmp:
+        doc = SimpleDocTemplate(str(tmp), pagesize=first.pagesize, title=TITLE,
+                                leftMargin=first.leftMargin, rightMargin=first.rightMargin,
+                                topMargin=first.topMargin, bottomMargin=first.bottomMargin)
+        doc.build(LazyStory(combined_story(guides, catalog, pages)), onFirstPage=on_page,
+                  onLaterPages=on_page, canvasmaker=optimizing(Canvas) if optimize else Canvas)
+    return {"guide": "combined", "output": str(output), "skipped": False,
+            "seconds": time.perf_counter() - t0, "rss_kb": _peak_rss_kb(), "pages": doc.page}
@@ -0,0 +1,223 @@
+"""Parallel build driver: discovers the guide scripts and renders them across a process pool."""
+import os
+import re
+import resource
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from reportlab.pdfgen.canvas import Canvas
+
+from guidekit import cache, export
+from guidekit.fingerprint import guide_fingerprint
+from guidekit.model import document
+from guidekit.optimize import optimizing
+from guidekit.output import atomic_output
+from guidekit.profiler import Profiler
+from guidekit.sections import SectionRecorder
+from guidekit.story import LazyStory, build_story
+from guidekit.stream import streaming
+
+ROOT = Path(__file__).resolve().parent.parent
+OUT_DIR = ROOT / "build"
+FORMATS = ("pdf",) + tuple(export.BACKENDS)
+
+# A guide is any top-level script that lays out a story into a SimpleDocTemplate.
+_GUIDE_MARKER = re.compile(r"^doc\s*=\s*SimpleDocTemplate\(", re.M)
+
+
+# ── Discovery ──────────────────────────────────────────────────────────────────
+def discover_guides(root=ROOT):
+    """Return the guide scripts under `root`, sorted by name."""
+    found = []
+    for path in sorted(Path(root).glob("*.py")):
+        if _GUIDE_MARKER.search(path.read_text(encoding="utf-8")):
+            found.append(path)
+    return found
+
+
+def select_guides(names, root=ROOT):
+    """Resolve guide names (`prefixsum`, `linked-list.py`, ...) to script paths."""
+    guides = {p.stem: p for p in discover_guides(root)}
+    if not names:
+        return list(guides.values())
+    picked = []
+    for name in names:
+        stem = Path(name).stem
+        if stem not in guides:
+            raise SystemExit(f"unknown guide {name!r} (have: {', '.join(guides)})")
+        picked.append(guides[stem])
+    return picked
+
+
+# ── Worker ─────────────────────────────────────────────────────────────────────
+def _peak_rss_kb():
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if os.uname().sysname == "Darwin" else rss
+
+
+def run_guide(path):
+    """Run guide script `path` and return its namespace (story, `doc`, `SECTIONS`, ...)."""
+    path = Path(path)
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))     # guides import guidekit from their own dir
+    return runpy.run_path(str(path), run_name="__guide__")
+
+
+def build_guide(path, out_dir=OUT_DIR, manifest=None, profile_dir=None, scratch=None, stream=False,
+                optimize=True, fmt="pdf"):
+    """Run one guide script and lay out its story. Executed inside a pool worker.
+
+    For a `fmt` other than "pdf" the guide is read into the document model
+    and rendered by that format's backend (see `guidekit.export`) instead;
+    nothing is laid out, and the layout options below do not apply.
+
+    The PDF is written to `out_dir` under the file name the guide gives its
+    `doc`, through a temporary file (in `scratch` if given) that is renamed
+    into place once complete. With `stream` each page is written out as soon
+    as it is finished (see `guidekit.stream`) instead of at the end. Unless
+    `optimize` is off, page content goes through `guidekit.optimize`.
+
+    A full build pulls flowables from the guide's section generators as the
+    layout consumes them (see `guidekit.story`), so the whole story never sits
+    in memory at once. Incremental mode needs every flowable to fingerprint
+    the story, so it builds the list up front.
+
+    With a `manifest` (incremental mode) the layout is skipped when the story
+    fingerprint matches the one recorded for the existing output file; otherwise
+    unchanged sections are replayed from the section layout cache.
+
+    With a `profile_dir` the whole story is laid out under the build profiler
+    and its report is written there; incremental mode is ignored.
+    """
+    path = Path(path)
+    t0 = time.perf_counter()
+    g = run_guide(path)
+    doc = g["doc"]
+    if fmt != "pdf":
+        return _export_guide(path, g, fmt, out_dir, scratch, t0)
+    output = Path(out_dir).resolve() / Path(doc.filename).name
+    result = {"guide": path.stem, "output": str(output)}
+    add_page_bg = g["add_page_bg"]
+    if profile_dir is not None:
+        manifest = None
+    if manifest is not None:
+        story = build_story(g["SECTIONS"])
+        fp = result["fingerprint"] = guide_fingerprint(g, story, optimize)
+        entry = manifest.get(result["output"])
+        if cache.is_fresh(entry, result["output"], fp):
+            result.update(skipped=True, seconds=time.perf_counter() - t0,
+                          rss_kb=_peak_rss_kb(), pages=entry["pages"], sha256=entry["sha256"])
+            return result
+
+    def wrap(maker):
+        maker = streaming(maker) if stream else maker
+        return optimizing(maker) if optimize else maker
+
+    with atomic_output(output, scratch) as tmp:
+        doc.filename = str(tmp)
+        if profile_dir is not None:
+            prof = Profiler()
+            prof.build(doc, g["SECTIONS"], onFirstPage=add_page_bg, onLaterPages=add_page_bg,
+                       canvasmaker=wrap(Canvas))
+            prof.write(profile_dir, path.stem)
+            result["profile"] = str(profile_dir)
+        elif manifest is None:
+            doc.build(LazyStory(g["SECTIONS"]), onFirstPage=add_page_bg, onLaterPages=add_page_bg,
+                      canvasmaker=wrap(Canvas))
+        else:
+            rec = SectionRecorder(doc)
+            story = rec.prepare(story)
+            on_page = rec.on_page(add_page_bg)
+            doc.build(story, onFirstPage=on_page, onLaterPages=on_page, canvasmaker=wrap(rec.canvasmaker))
+            rec.commit()
+            result["sections"] = (rec.hits, rec.hits + rec.misses)
+    result.update(skipped=False, seconds=time.perf_counter() - t0,
+                  rss_kb=_peak_rss_kb(), pages=doc.page)
+    if manifest is not None:
+        result["sha256"] = cache.file_sha256(result["output"])
+    return result
+
+
+def _export_guide(path, g, fmt, out_dir, scratch, t0):
+    backend = export.backend(fmt)
+    output = Path(out_dir).resolve() / Path(g["doc"].filename).with_suffix(backend.SUFFIX).name
+    text = backend.render(document(g, path.stem))
+    with atomic_output(output, scratch) as tmp:
+        tmp.write_text(text, encoding="utf-8")
+    return {"guide": path.stem, "output": str(output), "skipped": False,
+            "seconds": time.perf_counter() - t0, "rss_kb": _peak_rss_kb(), "pages": "-"}
+
+
+# ── Pool ───────────────────────────────────────────────────────────────────────
+def build_all(paths, out_dir=OUT_DIR, jobs=None, fmt="pdf", incremental=False,
+              profile_dir=None, scratch=None, stream=False, optimize=True):
+    """Build every guide in `paths` into `out_dir` concurrently; returns one result dict per guide.
+
+    `fmt` is one of `FORMATS`. A `scratch` directory (ideally a tmpfs) holds
+    the files while they are written; each is renamed into `out_dir` when done.
+    `stream` writes every page out as soon as it is laid out, which keeps a
+    build's memory flat however long the guide is. `optimize` runs the
+    content-stream optimization pass (on by default).
+
+    In incremental mode unchanged guides are skipped and the manifest is
+    updated with the guides that were rebuilt. A `profile_dir` turns on the
+    build profiler for every guide (and turns incremental mode off).
+
+    The text formats need no layout and take a fraction of a second per
+    guide, less than starting a worker costs, so they are built in-process;
+    so is everything when there is only one job to run at a time. Workers
+    are reused from guide to guide, so a guide's peak RSS is that of the
+    process that built it, which may have built others before.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r} (have: {', '.join(FORMATS)})")
+    paths = list(paths)
+    jobs = jobs or min(len(paths), os.cpu_count() or 1)
+    incremental = incremental and profile_dir is None and fmt == "pdf"
+    manifest = cache.load_manifest() if incremental else None
+    args = (out_dir, manifest, profile_dir, scratch, stream, optimize, fmt)
+    results = []
+    if fmt != "pdf" or jobs == 1:
+        for p in paths:
+            try:
+                results.append(build_guide(p, *args))
+            except Exception as exc:
+                results.append({"guide": p.stem, "error": repr(exc)})
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(build_guide, p, *args): p for p in paths}
+            for fut in as_completed(futures):
+                try:
+                    results.append(fut.result())
+                except Exception as exc:
+                    results.append({"guide": futures[fut].stem, "error": repr(exc)})
+    order = {p.stem: i for i, p in enumerate(paths)}
+    results.sort(key=lambda r: order[r["guide"]])
+    if incremental:
+        for r in results:
+            if "error" not in r and not r["skipped"]:
+                cache.record(manifest, r)
+        cache.save_manifest(manifest)
+    return results
+
+
+def format_report(results, wall):
+    """Render the per-guide timing table printed at the end of a build."""
+    lines = [f"{'guide':<20} {'time':>8} {'peak rss':>10} {'pages':>6}"]
+    for r in results:
+        if "error" in r:
+            lines.append(f"{r['guide']:<20} FAILED  {r['error']}")
+            continue
+        note = "  (up to date)" if r.get("skipped") else ""
+        if "sections" in r:
+            note = "  (%d/%d sections cached)" % r["sections"]
+        if "note" in r:
+            note += f"  ({r['note']})"
+        lines.append(f"{r['guide']:<20} {r['seconds']:>7.2f}s {r['rss_kb']/1024:>8.1f}MB {r['pages']:>6}{note}")
+    serial = sum(r.get("seconds", 0.0) for r in results)
+    lines.append(f"wall {wall:.2f}s  (serial sum {serial:.2f}s)")
+    return "\n".join(lines)
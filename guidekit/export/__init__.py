@@ -0,0 +1,28 @@
+"""Text output backends for the document model (`guidekit.model`).
+
+Each backend is a module with a ``SUFFIX`` (the output file extension) and a
+``render(doc)`` function returning the whole file as a string. PDF is not in
+this table: it is laid out by ReportLab from the story itself.
+
+    from guidekit.export import backend
+    html = backend("html").render(document(g))
+"""
+import importlib
+
+BACKENDS = {
+    "html": "guidekit.export.html",
+    "md":   "guidekit.export.markdown",
+}
+
+
+def backend(fmt):
+    """Return the backend module for output format `fmt`."""
+    try:
+        return importlib.import_module(BACKENDS[fmt])
+    except KeyError:
+        raise ValueError(f"unknown format {fmt!r} (have: {', '.join(BACKENDS)})") from None
+
+
+def register(fmt, module):
+    """Add (or replace) the backend for `fmt`: a module name with SUFFIX and render()."""
+    BACKENDS[fmt] = module
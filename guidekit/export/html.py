@@ -0,0 +1,220 @@
+"""HTML backend: one self-contained page per guide.
+
+The page carries its own stylesheet (the guides' dark palette) and needs no
+scripts. Paragraph markup is ReportLab's, which is already nearly HTML; only
+``<font>``, ``<super>`` and ``<strike>`` need translating. Code blocks are
+highlighted with the same token cache as the PDF, and the visualisers are
+drawn as inline SVG (`guidekit.export.svg`). Sections, headings and roadmap
+rows get the model's anchors as ``id``s. The page's own linked section list
+stands in for the guide's contents page, which is left out.
+"""
+import functools
+import re
+from html import escape
+
+from guidekit import highlight
+from guidekit.export.svg import RENDERERS
+from guidekit.model import Badge, Callout, Code, Grid, Heading, Para, Rule, Visual
+
+SUFFIX = ".html"
+
+CSS = """\
+:root{--bg:#0f172a;--card:#1e293b;--dark2:#141e2e;--border:#334155;--body:#cbd5e1;
+--heading:#f1f5f9;--muted:#64748b;--accent:#38bdf8;--accent2:#818cf8;--green:#34d399;
+--code-fg:#e2e8f0;--code-hdr:#0d1929}
+*{box-sizing:border-box}
+body{margin:0;background:var(--bg);color:var(--body);font:15px/1.55 Helvetica,Arial,sans-serif}
+main{max-width:820px;margin:0 auto;padding:24px 20px 64px}
+nav.toc{max-width:820px;margin:0 auto;padding:16px 20px 0}
+nav.toc ol{margin:0;padding-left:1.4em;columns:2}
+nav.toc a{color:var(--accent);text-decoration:none}
+a{color:var(--accent)}
+section{margin:0 0 48px}
+h2{color:var(--heading);font-size:24px;border-bottom:2px solid var(--accent);padding-bottom:6px}
+h2 .num{color:var(--accent);margin-right:.6em}
+h3{color:var(--accent2);font-size:18px;margin:22px 0 6px}
+h4{color:var(--green);font-size:15px;margin:16px 0 4px}
+p{margin:0 0 8px}
+p.body{text-align:justify}
+p.bullet{margin-left:16px}
+p.title{color:var(--heading);font-size:40px;font-weight:bold;text-align:center;margin:24px 0 6px}
+p.subtitle{color:var(--accent);font-size:17px;text-align:center}
+p.author{color:var(--muted);font-style:italic;text-align:center}
+p.note,p.caption{color:var(--muted);font-size:13px}
+p.code,p.formula{font-family:Courier,monospace}
+.mono{font-family:Courier,monospace}
+table{border-collapse:collapse;width:100%;margin:0 0 12px}
+td,th{padding:6px 8px;vertical-align:middle;text-align:left}
+td p,th p{margin:0}
+table.std{border:1px solid var(--border)}
+table.std td,table.std th{border:.5px solid var(--border)}
+table.std tr:nth-child(odd) td{background:var(--card)}
+table.std tr:nth-child(even) td{background:var(--dark2)}
+table.std th{background:var(--bg);color:var(--muted)}
+figure.vis{margin:0 0 12px}
+figure.vis table{width:auto;margin:0 auto}
+figure.vis svg{display:block;margin:0 auto;max-width:100%;height:auto}
+.v-val{font:bold 11px Courier,monospace}.v-idx{font:8px Courier,monospace}
+.v-small{font:bold 9px Courier,monospace}.v-null{font:bold 9px Courier,monospace}
+.v-empty{font:italic 9px Courier,monospace}.v-ptr{font:bold 7.5px Helvetica,Arial,sans-serif}
+.v-note{font:8px Helvetica,Arial,sans-serif}.v-arrow{font:bold 14px Helvetica,Arial,sans-serif}
+.code{border:1px solid var(--border);border-radius:4px;overflow:hidden;margin:0 0 12px;background:var(--card)}
+.code .hdr{background:var(--code-hdr);color:var(--muted);font:11px Courier,monospace;padding:4px 12px}
+.code pre{margin:0;padding:8px 12px;color:var(--code-fg);font:13px/1.5 Courier,monospace;overflow-x:auto}
+.kw{color:#c084fc;font-weight:bold}.bi{color:#38bdf8}.str{color:#34d399}.num{color:#fb923c}
+.cmt{color:var(--muted);font-style:italic}
+aside.callout{background:#0c1f35;border-left:3px solid;padding:9px 14px;margin:0 0 10px;font-size:14px}
+.badge{display:inline-block;border-radius:4px;padding:2px 7px;font-size:11px;font-weight:bold}
+hr{border:0;border-top:1px solid var(--border)}
+"""
+
+_FONT = re.compile(r"<font\b([^>]*)>")
+_ATTR = re.compile(r"""(\w+)\s*=\s*["']([^"']*)["']""")
+_TAGS = {"<super>": "<sup>", "</super>": "</sup>", "<strike>": "<s>", "</strike>": "</s>",
+         "</font>": "</span>", "<br/>": "<br>"}
+_TAG = re.compile("|".join(map(re.escape, _TAGS)))
+
+
+def _font(m):
+    css = []
+    for k, v in _ATTR.findall(m.group(1)):
+        if k == "color":
+            css.append(f"color:{v}")
+        elif k in ("name", "face"):
+            css.append("font-family:Courier,monospace" if v.startswith("Courier") else f"font-family:{v}")
+        elif k == "size":
+            css.append(f"font-size:{v}pt")
+    return f'<span style="{";".join(css)}">'
+
+
+def inline(text):
+    """Translate ReportLab paragraph markup into HTML."""
+    if "<" not in text:
+        return text
+    return _FONT.sub(_font, _TAG.sub(lambda m: _TAGS[m.group()], text))
+
+
+@functools.lru_cache(maxsize=None)
+def _style_attr(style):
+    if style is None:
+        return ""
+    css = [f"color:{style.color}"] if style.color else []
+    if style.bold:
+        css.append("font-weight:bold")
+    if style.italic:
+        css.append("font-style:italic")
+    if style.mono:
+        css.append("font-family:Courier,monospace")
+    css.append(f"font-size:{style.size}pt")
+    if style.align:
+        css.append(f"text-align:{style.align}")
+    return f' style="{";".join(css)}"'
+
+
+# ── Blocks ─────────────────────────────────────────────────────────────────────
+def _code(node, out):
+    out.append(f'<div class="code"><div class="hdr">{escape(node.lang)}</div><pre>')
+    runs = highlight.tokens(node.lines) if node.highlight else [[] for _ in node.lines]
+    for line, line_runs in zip(node.lines, runs):
+        for kind, s, e in highlight.fill(line_runs, len(line)):
+            piece = escape(line[s:e], quote=False)
+            out.append(piece if kind == highlight.TEXT else f'<span class="{kind}">{piece}</span>')
+        out.append("\n")
+    out.append("</pre></div>")
+
+
+def _grid(node, out, cls=None):
+    out.append(f'<table class="{cls}">' if cls else "<table>")
+    widths = node.widths
+    if widths and all(widths):
+        total = sum(widths)
+        out.append("<colgroup>" + "".join(f'<col style="width:{w / total:.1%}">' for w in widths)
+                   + "</colgroup>")
+    ids = node.row_ids or ()
+    for r, row in enumerate(node.rows):
+        tag = "th" if node.header and r == 0 else "td"
+        out.append(f'<tr id="{ids[r]}">' if r < len(ids) and ids[r] else "<tr>")
+        for cell in row:
+            bg = f' style="background:{cell.bg}"' if cell.bg and not node.header else ""
+            out.append(f"<{tag}{bg}>")
+            render_blocks(cell.blocks, out)
+            out.append(f"</{tag}>")
+        out.append("</tr>")
+    out.append("</table>")
+
+
+def _visual(node, out):
+    out.append(f'<figure class="vis vis-{node.kind}">')
+    draw = RENDERERS.get(node.kind)
+    if draw is not None:
+        out.append(draw(*node.args, **node.kw))
+    else:
+        _grid(node.table, out)
+    out.append("</figure>")
+
+
+def render_blocks(blocks, out):
+    """Append the HTML for model `blocks` to the list `out`."""
+    for b in blocks:
+        t = type(b)
+        if t is Para:
+            cls = f' class="{b.role}"' if b.role else ""
+            out.append(f"<p{cls}{'' if b.role else _style_attr(b.style)}>{inline(b.text)}</p>")
+        elif t is Heading:
+            anchor = f' id="{b.id}"' if b.id else ""
+            out.append(f"<h{b.level + 1}{anchor}>{inline(b.text)}</h{b.level + 1}>")
+        elif t is Code:
+            _code(b, out)
+        elif t is Grid:
+            _grid(b, out, "std" if b.header else None)
+        elif t is Visual:
+            _visual(b, out)
+        elif t is Callout:
+            out.append(f'<aside class="callout" style="border-color:{b.color};color:{b.color}">'
+                       f"{b.icon}&nbsp; {inline(b.text)}</aside>")
+        elif t is Badge:
+            out.append(f'<span class="badge" style="background:{b.bg};color:{b.fg}">{escape(b.text)}</span>')
+        elif t is Rule:
+            out.append("<hr>")
+
+
+def render_section(sec, out):
+    out.append(f'<section id="{sec.id}">')
+    if sec.num is not None:
+        num = f'<span class="num">{sec.num:02d}</span>' if sec.num else ""
+        out.append(f"<h2>{num}{escape(sec.title)}</h2>")
+    render_blocks(sec.blocks, out)
+    out.append("</section>")
+
+
+def _body(sections):
+    """`sections` without the guide's contents page: the front-matter section numbered 0."""
+    out, front = [], True
+    for sec in sections:
+        front = front and not sec.num
+        if not (front and sec.num == 0):
+            out.append(sec)
+    return out
+
+
+def render(doc, head=None, header=""):
+    """The complete HTML page for model document `doc`.
+
+    The page embeds its stylesheet unless `head` gives the markup to use
+    instead (a site links a shared one); `header` goes at the top of the body.
+    """
+    if head is None:
+        head = f"<style>{CSS}</style>"
+    out = ["<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\">"
+           '<meta name="viewport" content="width=device-width,initial-scale=1">'
+           f"<title>{escape(doc.title)}</title>{head}</head><body>{header}"]
+    sections = _body(doc.sections)
+    out.append('<nav class="toc"><ol>')
+    for sec in sections:
+        if sec.num is not None:
+            out.append(f'<li><a href="#{sec.id}">{escape(sec.title)}</a></li>')
+    out.append("</ol></nav><main>")
+    for sec in sections:
+        render_section(sec, out)
+    out.append("</main></body></html>\n")
+    return "".join(out)
@@ -0,0 +1,93 @@
+"""Markdown backend (GitHub-flavoured): one ``.md`` file per guide.
+
+Bold and italic become ``**``/``*``, line breaks become hard breaks (``<br>``
+inside table cells), superscripts stay inline HTML and other markup is dropped.
+Every table -- visualisers included -- becomes a pipe table with its first row
+as the header.
+"""
+import re
+from html import unescape
+
+from guidekit.model import Badge, Callout, Code, Grid, Heading, Para, Rule, Visual
+
+SUFFIX = ".md"
+
+_MARKUP = re.compile(r"</?(b|strong|i|em|super|sup|br)\s*/?>|<[^>]+>")
+_MD = {"b": "**", "strong": "**", "i": "*", "em": "*"}
+
+
+def inline(text, br="  \n"):
+    """Translate ReportLab paragraph markup into Markdown."""
+    def sub(m):
+        tag = m.group(1)
+        if tag in _MD:
+            return _MD[tag]
+        if tag == "br":
+            return br
+        if tag in ("super", "sup"):
+            return "</sup>" if m.group().startswith("</") else "<sup>"
+        return ""
+    return unescape(_MARKUP.sub(sub, text)).replace("\xa0", " ").strip()
+
+
+def _cell(blocks):
+    parts = []
+    for b in blocks:
+        if type(b) in (Para, Heading, Callout):
+            parts.append(inline(b.text, "<br>"))
+        elif type(b) is Code:
+            parts.append("<br>".join(f"`{ln}`" for ln in b.lines if ln.strip()))
+        elif type(b) is Badge:
+            parts.append(f"`{b.text}`")
+        elif type(b) in (Grid, Visual):
+            grid = b if type(b) is Grid else b.table
+            parts.append("<br>".join(" · ".join(filter(None, (_cell(c.blocks) for c in row)))
+                                     for row in grid.rows))
+    return "<br>".join(p for p in parts if p).replace("|", "\\|").replace("\n", " ")
+
+
+def _grid(node, out):
+    rows = [[_cell(c.blocks) for c in row] for row in node.rows]
+    if not rows or not any(any(r) for r in rows):
+        return
+    width = max(len(r) for r in rows)
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    out.append("| " + " | ".join(rows[0]) + " |")
+    out.append("|" + "---|" * width)
+    out.extend("| " + " | ".join(r) + " |" for r in rows[1:])
+    out.append("")
+
+
+def render_blocks(blocks, out):
+    """Append the Markdown lines for model `blocks` to the list `out`."""
+    for b in blocks:
+        t = type(b)
+        if t is Para:
+            text = inline(b.text)
+            if text:
+                out += [f"**{text}**" if b.role == "title" else text, ""]
+        elif t is Heading:
+            out += ["#" * (b.level + 1) + " " + inline(b.text).replace("**", ""), ""]
+        elif t is Code:
+            out += [f"```{b.lang}", *b.lines, "```", ""]
+        elif t is Grid:
+            _grid(b, out)
+        elif t is Visual:
+            _grid(b.table, out)
+        elif t is Callout:
+            out += [f"> {b.icon} {inline(b.text)}", ""]
+        elif t is Badge:
+            out += [f"`{b.text}`", ""]
+        elif t is Rule:
+            out += ["---", ""]
+
+
+def render(doc):
+    """The complete Markdown file for model document `doc`."""
+    out = [f"# {doc.title}", ""]
+    for sec in doc.sections:
+        if sec.num is not None:
+            label = f"{sec.num:02d} · " if sec.num else ""
+            out += [f"## {label}{sec.title}", ""]
+        render_blocks(sec.blocks, out)
+    return "\n".join(out)
@@ -0,0 +1,224 @@
+"""Inline SVG for the visualisers, drawn from the arguments they were called with.
+
+Each function here mirrors the helper of the same name in `guidekit.visuals`
+-- same signature, same colours and labelling rules -- but returns an
+``<svg>`` element instead of a table, so the HTML pages show the diagram
+itself rather than a grid approximating it. Text uses the ``v-*`` classes of
+the page stylesheet (`guidekit.export.html.CSS`).
+
+    svg = RENDERERS[node.kind](*node.args, **node.kw)
+"""
+from html import escape
+
+from guidekit.model import hex_color, plain
+from guidekit.palette import (
+    C_ACCENT, C_ACCENT2, C_BODY, C_BORDER, C_CARD, C_DARK2, C_GREEN, C_HEADING, C_MUTED,
+    C_ORANGE, C_PURPLE, C_RED, C_TEAL, C_YELLOW, CW, PAGE_W,
+)
+
+ACCENT, ACCENT2, BODY, BORDER, CARD, DARK2, GREEN, HEADING, MUTED, ORANGE, YELLOW = map(
+    hex_color, (C_ACCENT, C_ACCENT2, C_BODY, C_BORDER, C_CARD, C_DARK2, C_GREEN, C_HEADING,
+                C_MUTED, C_ORANGE, C_YELLOW))
+
+LABEL_H, CELL_H, INDEX_H = 16, 32, 14
+
+# Pointer name -> colour, as node_chain colours the labels below its nodes.
+_POINTER_COLORS = {name: hex_color(c) for name, c in {
+    "slow": C_GREEN, "fast": C_RED, "prev": C_ACCENT, "curr": C_ACCENT2, "next": C_YELLOW,
+    "left": C_ACCENT, "right": C_ACCENT2, "dummy": C_PURPLE, "head": C_ACCENT, "mid": C_GREEN,
+    "p1": C_ORANGE, "p2": C_TEAL, "k-group": C_PURPLE}.items()}
+
+
+def _svg(w, h, parts):
+    return (f'<svg class="vis" xmlns="http://www.w3.org/2000/svg" width="{w:g}" height="{h:g}" '
+            f'viewBox="0 0 {w:g} {h:g}">' + "".join(parts) + "</svg>")
+
+
+def _rect(x, y, w, h, fill, stroke=BORDER, width=1):
+    return (f'<rect x="{x:g}" y="{y:g}" width="{w:g}" height="{h:g}" fill="{fill}" '
+            f'stroke="{stroke}" stroke-width="{width:g}"/>')
+
+
+def _text(x, y, text, cls, color, anchor="middle"):
+    text = plain(str(text)) if text is not None else ""
+    if not text:
+        return ""
+    return (f'<text x="{x:g}" y="{y:g}" class="{cls}" fill="{color}" text-anchor="{anchor}" '
+            f'dominant-baseline="central">{escape(text, quote=False)}</text>')
+
+
+def _row(parts, y, widths, values, fills, colors, cls, x=0):
+    """A row of boxed cells; `fills`/`colors` give each cell's background and text colour."""
+    x0 = x
+    for w, v, fill, color in zip(widths, values, fills, colors):
+        parts.append(_rect(x, y, w, CELL_H, fill, width=.5))
+        parts.append(_text(x + w / 2, y + CELL_H / 2, v, cls, color))
+        x += w
+    parts.append(_rect(x0, y, x - x0, CELL_H, "none"))
+
+
+# ── Arrays ─────────────────────────────────────────────────────────────────────
+def pointer_vis(cells, left_idx=0, right_idx=None, labels=None, mid_idx=None, extra_idx=None):
+    n = len(cells)
+    if right_idx is None:
+        right_idx = n - 1
+    col_w = min(52, int((PAGE_W - 108) / n))
+    fills, colors, names = [], [], []
+    for i in range(n):
+        if i == left_idx:
+            fill, color = "#0a2e3a", ACCENT
+        elif i == right_idx and right_idx != left_idx:
+            fill, color = "#1a1040", ACCENT2
+        elif mid_idx is not None and i == mid_idx:
+            fill, color = "#1a2e0a", GREEN
+        elif extra_idx is not None and i == extra_idx:
+            fill, color = "#2e1a0a", ORANGE
+        else:
+            fill, color = CARD, BODY
+        fills.append(fill)
+        colors.append(color)
+        pts = []
+        if i == left_idx:
+            pts.append(labels[0] if labels else "L")
+        if i == right_idx and right_idx != left_idx:
+            pts.append(labels[1] if labels and len(labels) > 1 else "R")
+        if mid_idx is not None and i == mid_idx:
+            pts.append(labels[2] if labels and len(labels) > 2 else "M")
+        if extra_idx is not None and i == extra_idx:
+            pts.append(labels[3] if labels and len(labels) > 3 else "E")
+        names.append("/".join(pts))
+    parts = []
+    for i, name in enumerate(names):
+        color = ACCENT if i == left_idx else ACCENT2 if i == right_idx else \
+            GREEN if i == mid_idx else ORANGE
+        parts.append(_text(col_w * (i + .5), LABEL_H / 2, name, "v-ptr", color))
+    _row(parts, LABEL_H, [col_w] * n, cells, fills, colors, "v-val")
+    for i in range(n):
+        parts.append(_text(col_w * (i + .5), LABEL_H + CELL_H + INDEX_H / 2, i, "v-idx", MUTED))
+    return _svg(col_w * n, LABEL_H + CELL_H + INDEX_H, parts)
+
+
+def window_vis(cells, left, right, highlight_color=C_ACCENT, labels=("left", "right"), extra=None):
+    n = len(cells)
+    col_w = min(50, int(CW / n))
+    fills, colors, parts = [], [], []
+    for i in range(n):
+        in_win, is_left, is_right = left <= i <= right, i == left, i == right
+        fill = hex_color(highlight_color) if in_win else CARD
+        if is_left:
+            fill = "#0a2e3a"
+        if is_right:
+            fill = "#0a1a3a"
+        if in_win and not is_left and not is_right:
+            fill = "#0a1e2e"
+        fills.append(fill)
+        colors.append(HEADING if in_win else MUTED)
+        pts = []
+        if is_left:
+            pts.append(labels[0])
+        if is_right and not (is_left and left == right):
+            pts.append(labels[1])
+        if extra is not None and i == extra:
+            pts.append("mid")
+        color = ACCENT if is_left else ACCENT2 if is_right else GREEN
+        parts.append(_text(col_w * (i + .5), LABEL_H / 2, "/".join(pts), "v-ptr", color))
+        parts.append(_text(col_w * (i + .5), LABEL_H + CELL_H + INDEX_H / 2, i, "v-idx", MUTED))
+    _row(parts, LABEL_H, [col_w] * n, cells, fills, colors, "v-val")
+    return _svg(col_w * n, LABEL_H + CELL_H + INDEX_H, parts)
+
+
+# ── Linked lists ───────────────────────────────────────────────────────────────
+def node_chain(values, highlight=None, null_end=True, labels=None, null_label="None",
+               pointer_labels=None):
+    highlight = highlight or []
+    pointer_labels = pointer_labels or {}
+    node_w, arrow_w, null_w = 52, 28, 46
+    n = len(values)
+    parts, x, y = [], 0, LABEL_H
+    for i, v in enumerate(values):
+        cx = x + node_w / 2
+        label = labels[i] if labels and i < len(labels) else ""
+        parts.append(_text(cx, LABEL_H / 2, label, "v-ptr",
+                           ACCENT if i == 0 else ACCENT2 if i == n - 1 else GREEN))
+        hl = i in highlight
+        parts.append(_rect(x, y, node_w, CELL_H, "#0a2e3a" if hl else CARD))
+        parts.append(_text(cx, y + CELL_H / 2, v, "v-val", HEADING if hl else BODY))
+        below = pointer_labels.get(i)
+        if below:
+            color = _POINTER_COLORS.get(below.lower().split("/")[0], MUTED)
+            parts.append(_text(cx, y + CELL_H + INDEX_H / 2, below, "v-ptr", color))
+        x += node_w
+        if i < n - 1:
+            parts.append(_text(x + arrow_w / 2, y + CELL_H / 2, "→", "v-arrow", ACCENT))
+            x += arrow_w
+    if null_end:
+        parts.append(_text(x + null_w / 2, y + CELL_H / 2, null_label, "v-null", MUTED))
+        x += null_w
+    return _svg(x, LABEL_H + CELL_H + INDEX_H, parts)
+
+
+# ── Stacks and queues ──────────────────────────────────────────────────────────
+def _empty(width):
+    return _svg(width, CELL_H, [_rect(.5, .5, width - 1, CELL_H - 1, CARD),
+                                _text(width / 2, CELL_H / 2, "(empty)", "v-empty", MUTED)])
+
+
+def stack_vis(items, label="Stack", highlight_top=True, direction="vertical"):
+    if not items:
+        return _empty(90)
+    parts = []
+    for i, v in enumerate(reversed(items)):
+        top = i == 0 and highlight_top
+        y = i * CELL_H
+        parts.append(_rect(0, y, 130, CELL_H, "#0a2e3a" if top else CARD, width=.5))
+        parts.append(_text(35, y + CELL_H / 2, v, "v-val", ACCENT if top else BODY))
+        if top:
+            parts.append(_text(78, y + CELL_H / 2, "← top", "v-note", ACCENT, anchor="start"))
+    parts.append(_rect(0, 0, 130, CELL_H * len(items), "none"))
+    parts.append(f'<line x1="70" y1="0" x2="70" y2="{CELL_H * len(items)}" stroke="{BORDER}" '
+                 'stroke-width=".5"/>')
+    return _svg(130, CELL_H * len(items), parts)
+
+
+def queue_vis(items, label="Queue"):
+    if not items:
+        return _empty(100)
+    n = len(items)
+    col_w = min(55, int(CW / (n + 2)))
+    fills, colors, parts = [], [], []
+    for i in range(n):
+        front, rear = i == 0, i == n - 1
+        color = ACCENT if front else GREEN if rear else BODY
+        fills.append("#0a2e3a" if front else "#0a2e1a" if rear else CARD)
+        colors.append(color)
+        parts.append(_text(col_w * (i + .5), LABEL_H / 2,
+                           "front" if front else "rear" if rear else "", "v-ptr", color))
+    _row(parts, LABEL_H, [col_w] * n, items, fills, colors, "v-val")
+    return _svg(col_w * n, LABEL_H + CELL_H, parts)
+
+
+def mono_stack_vis(stack_vals, current=None, action="", result_map=None, arr=None,
+                   arr_highlight=None):
+    parts, y = [], 0
+    if arr is not None:
+        hl = arr_highlight or []
+        _row(parts, 0, [28] * len(arr), arr, [DARK2] * len(arr),
+             [YELLOW if i in hl else MUTED for i in range(len(arr))], "v-small")
+        y = CELL_H + 6
+    x = 50
+    if stack_vals:
+        parts.append(_text(0, y + CELL_H / 2, "stack →", "v-note", MUTED, anchor="start"))
+        _row(parts, y, [30] * len(stack_vals), stack_vals, ["#0a1e3a"] * len(stack_vals),
+             [ACCENT] * len(stack_vals), "v-val", x=x)
+        x += min(len(stack_vals) * 30 + 10, 200)
+    else:
+        parts.append(_text(x, y + CELL_H / 2, "stack: []", "v-small", MUTED, anchor="start"))
+        x += 60
+    if current is not None:
+        parts.append(_text(x, y + CELL_H / 2, f"curr={current}", "v-small", YELLOW, anchor="start"))
+    parts.append(_text(x + 70, y + CELL_H / 2, action, "v-note", GREEN, anchor="start"))
+    return _svg(CW, y + CELL_H, parts)
+
+
+RENDERERS = {fn.__name__: fn for fn in (pointer_vis, window_vis, node_chain, stack_vis,
+                                        queue_vis, mono_stack_vis)}
@@ -0,0 +1,188 @@
+"""Structural content hashing for stories, flowables and page callbacks.
+
+Two stories built from the same source produce the same digest: objects are
+hashed by class and attribute values (never by id), functions by bytecode,
+constants and the module globals they read. A guide's fingerprint also covers
+the toolkit's source files, so editing any guidekit module rebuilds it.
+"""
+import functools
+import hashlib
+import types
+from pathlib import Path, PurePath
+
+# Attributes ReportLab attaches while laying a flowable out; never part of its content.
+_TRANSIENT = frozenset({"canv", "_frame", "_doctemplate", "_fingerprint"})
+# Entries of a class's __dict__ that Python fills in, not the class's content.
+_CLASS_BOOKKEEPING = frozenset({"__dict__", "__weakref__", "__module__", "__qualname__", "__doc__"})
+
+
+class Memo(dict):
+    """An in-process cache or intern table: its contents depend on what ran
+    before, not on the content being hashed, so fingerprints skip it."""
+
+
+class _Hasher:
+    def __init__(self):
+        self.h = hashlib.blake2b(digest_size=16)
+        self.seen = {}          # id(obj) -> position of first visit (handles sharing & cycles)
+        self.keep = []          # keep visited objects alive so ids stay unique
+
+    def w(self, *parts):
+        for p in parts:
+            self.h.update(p.encode("utf-8", "surrogatepass"))
+            self.h.update(b"\x00")
+
+    def feed(self, obj):
+        if obj is None or isinstance(obj, (bool, int, float, complex)):
+            self.w(type(obj).__name__, repr(obj))
+            return
+        if isinstance(obj, str):
+            self.w("s", obj)
+            return
+        if isinstance(obj, bytes):
+            self.w("b", obj.hex())
+            return
+        if isinstance(obj, PurePath):       # its slots fill in lazily (_str, _hash...)
+            self.w("path", str(obj))
+            return
+
+        key = id(obj)
+        if key in self.seen:
+            self.w("ref", str(self.seen[key]))
+            return
+        self.seen[key] = len(self.seen)
+        self.keep.append(obj)
+
+        if isinstance(obj, Memo):
+            self.w("memo")
+        elif isinstance(obj, (list, tuple)):
+            self.w(type(obj).__name__, str(len(obj)))
+            for x in obj:
+                self.feed(x)
+        elif isinstance(obj, dict):
+            self.w("dict", str(len(obj)))
+            for k in sorted(obj, key=repr):
+                self.feed(k)
+                self.feed(obj[k])
+        elif isinstance(obj, (set, frozenset)):
+            self.w("set", str(len(obj)))
+            for x in sorted(obj, key=repr):
+                self.feed(x)
+        elif isinstance(obj, types.FunctionType):
+            self._feed_function(obj)
+        elif isinstance(obj, types.CodeType):
+            self._feed_code(obj)
+        elif isinstance(obj, type):
+            self._feed_class(obj)
+        elif isinstance(obj, (types.ModuleType, types.BuiltinFunctionType)):
+            self.w("name", getattr(obj, "__module__", "") or "", getattr(obj, "__qualname__", obj.__name__))
+        else:
+            self._feed_object(obj)
+
+    def _feed_code(self, code):
+        self.w("code", code.co_name, code.co_code.hex(), repr(code.co_names))
+        for c in code.co_consts:
+            self.feed(c)
+
+    def _feed_function(self, fn):
+        self.w("fn", fn.__qualname__)
+        self._feed_code(fn.__code__)
+        self.feed(fn.__defaults__)
+        for cell in fn.__closure__ or ():
+            self.feed(cell.cell_contents)
+        # Globals the function reads (palette colours, page size, titles...).
+        names = _global_names(fn.__code__)
+        for name in sorted(names):
+            if name in fn.__globals__:
+                val = fn.__globals__[name]
+                if isinstance(val, (types.ModuleType, type)):
+                    continue
+                self.w("g", name)
+                self.feed(val)
+
+    def _feed_class(self, cls):
+        self.w("cls", cls.__module__, cls.__qualname__)
+        # Library classes are pinned by the ReportLab version; our own flowables are
+        # hashed by their methods -- code and the globals it reads -- and their class
+        # attributes, so editing ColorRect.draw, CodeBlock.LEADING or CODE_SIZE
+        # invalidates caches.
+        if cls.__module__.split(".")[0] in ("builtins", "reportlab"):
+            return
+        for name in sorted(vars(cls)):
+            if name in _CLASS_BOOKKEEPING:
+                continue
+            val = vars(cls)[name]
+            if isinstance(val, (staticmethod, classmethod)):
+                val = val.__func__
+            elif isinstance(val, property):
+                val = (val.fget, val.fset, val.fdel)
+            self.w(name)
+            self.feed(val)
+        for base in cls.__bases__:
+            self.feed(base)
+
+    def _feed_object(self, obj):
+        cls = type(obj)
+        self.w("obj")
+        self.feed(cls)
+        state = getattr(obj, "__dict__", None)
+        if state is None:
+            slots = [s for c in cls.__mro__ for s in getattr(c, "__slots__", ())]
+            state = {s: getattr(obj, s) for s in slots if hasattr(obj, s)}
+        for k in sorted(state):
+            if k in _TRANSIENT:
+                continue
+            self.w(k)
+            self.feed(state[k])
+
+
+def _global_names(code):
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names |= _global_names(c)
+    return names
+
+
+def fingerprint(*objs):
+    """Hex digest of the structural content of `objs`."""
+    hs = _Hasher()
+    for o in objs:
+        hs.feed(o)
+    return hs.h.hexdigest()
+
+
+def source_digest(root):
+    """Hex digest of the ``.py`` files under directory `root`: their paths and bytes."""
+    h = hashlib.blake2b(digest_size=16)
+    root = Path(root)
+    for path in sorted(root.rglob("*.py")):
+        h.update(path.relative_to(root).as_posix().encode("utf-8"))
+        h.update(b"\x00")
+        h.update(path.read_bytes())
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def toolkit_digest():
+    """`source_digest` of the guidekit package, read once per process.
+
+    The structural walk only reaches code through objects in the story; a
+    toolkit function called by module attribute (``highlight.tokens``), or
+    code it reaches that way, is invisible to it.
+    """
+    return source_digest(Path(__file__).resolve().parent)
+
+
+def guide_fingerprint(g, story, *options):
+    """Fingerprint everything that shapes a guide's PDF: story, page template, geometry
+    and the toolkit's sources.
+
+    `g` is the guide script's namespace and `story` its built flowable list;
+    `options` are any build settings that change the output bytes.
+    """
+    import reportlab
+    doc = g["doc"]
+    geometry = (doc.pagesize, doc.leftMargin, doc.rightMargin, doc.topMargin, doc.bottomMargin)
+    return fingerprint(reportlab.Version, toolkit_digest(), geometry, g["add_page_bg"], story, options)
@@ -0,0 +1,247 @@
+"""Custom flowables drawn straight onto the canvas."""
+from reportlab.lib import colors
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFDictionary, PDFObject, PDFString, format
+from reportlab.platypus.flowables import Flowable
+from reportlab.platypus.paragraph import Paragraph, cleanBlockQuotedText
+
+from guidekit.highlight import fill, tokens
+from guidekit.palette import (
+    C_ACCENT, C_BORDER, C_CODE_BG, C_CODE_FG, C_GREEN, C_MUTED, C_ORANGE, C_PURPLE,
+)
+from guidekit.sections import replayable
+
+C_CODE_HDR = colors.HexColor("#0D1929")   # code block label strip
+CODE_SIZE = 8.5
+CODE_TXT = ("Courier", C_CODE_FG)
+CODE_CMT = ("Courier-Oblique", C_MUTED)
+CODE_STYLES = {                           # highlight run kind -> (font, colour)
+    "text": CODE_TXT,
+    "kw":   ("Courier-Bold", C_PURPLE),
+    "bi":   ("Courier", C_ACCENT),
+    "str":  ("Courier", C_GREEN),
+    "num":  ("Courier", C_ORANGE),
+    "cmt":  CODE_CMT,
+}
+
+
+class LazyParagraph(Paragraph):
+    """A Paragraph that parses its markup the first time layout needs it.
+
+    Parsing is most of the cost of building a story. Deferring it means that
+    reading a story without laying it out -- the document model, the HTML and
+    Markdown exports -- never parses at all; `text` and `style` are available
+    immediately (the text uncleaned until the parse).
+    """
+    _PARSED = frozenset(("frags", "bulletText", "debug"))
+
+    def __init__(self, text, style=None, bulletText=None, frags=None, caseSensitive=1, encoding="utf8"):
+        if frags is not None:               # split pieces arrive pre-parsed
+            Paragraph.__init__(self, text, style, bulletText, frags, caseSensitive, encoding)
+            return
+        self.caseSensitive, self.encoding = caseSensitive, encoding
+        self.text, self.style = text, style
+        self._pending = bulletText or getattr(style, "bulletText", None)
+
+    def __getattr__(self, name):
+        if name in self._PARSED and "_pending" in self.__dict__:
+            bullet = self.__dict__.pop("_pending")
+            self._setup(self.text, self.style, bullet, None, cleanBlockQuotedText)
+            return getattr(self, name)
+        raise AttributeError(name)
+
+
+class ColorRect(Flowable):
+    def __init__(self, w, h, color, radius=4):
+        self.w, self.h, self.color, self.r = w, h, color, radius
+    def draw(self):
+        self.canv.setFillColor(self.color)
+        self.canv.roundRect(0, 0, self.w, self.h, self.r, fill=1, stroke=0)
+    def wrap(self, *args): return self.w, self.h
+
+
+class HRule(Flowable):
+    def __init__(self, color=C_BORDER, thickness=1, spaceB=6):
+        self.color, self.t, self.spaceB = color, thickness, spaceB
+    def draw(self):
+        self.canv.setStrokeColor(self.color)
+        self.canv.setLineWidth(self.t)
+        self.canv.line(0, 0, self.width, 0)
+    def wrap(self, avail_w, avail_h):
+        self.width = avail_w
+        return avail_w, self.t + self.spaceB
+
+
+class _Destinations(PDFObject):
+    """The document's name tree of destinations (the catalog's ``/Names``).
+
+    ReportLab resolves destination names for its own links and outline but
+    does not publish them; listed here, ``guide.pdf#lc-239`` opens a viewer
+    at that destination.
+    """
+    def __init__(self):
+        self.dests = {}
+    def format(self, document):
+        names = []
+        for key in sorted(self.dests):
+            names += [PDFString(key), self.dests[key]]
+        return format(PDFDictionary({"Dests": PDFDictionary({"Names": PDFArray(names)})}), document)
+
+
+@replayable
+def bookmark(canvas, key, x, y, title=None, level=0):
+    """Named destination `key` at page position (`x`, `y`); with a `title`, an outline entry."""
+    canvas.bookmarkHorizontalAbsolute(key, y, left=x)
+    catalog = canvas._doc.Catalog
+    if getattr(catalog, "Names", None) is None:
+        catalog.Names = _Destinations()
+    catalog.Names.dests[key] = canvas._bookmarkReference(key)
+    if title:
+        canvas.addOutlineEntry(title, key, level)
+
+
+class Bookmark(Flowable):
+    """An invisible mark: a named destination here and, with a `title`, an outline entry.
+
+    It takes no room and passes the space after the previous flowable on, so
+    it never moves anything, and it stays on the page of what it follows.
+    """
+    _ZEROSIZE = True
+    _SPACETRANSFER = True
+    def __init__(self, key, title=None, level=0):
+        Flowable.__init__(self)
+        self.key, self.title, self.level = key, title, level
+    def wrap(self, *args): return 0, 0
+    def draw(self):
+        bookmark(self.canv, self.key, *self.canv.absolutePosition(0, 0), self.title, self.level)
+
+
+class CodeBlock(Flowable):
+    """A monospace code listing drawn straight onto the canvas.
+
+    Replaces the old Table-of-Paragraphs code block: one flowable per snippet,
+    height computed from the line count, and splittable between lines.
+    Indentation is preserved. With `highlight` on, Python snippets are drawn
+    as coloured runs from `guidekit.highlight`; otherwise only lines starting
+    with ``##`` are set apart, as comments.
+    """
+
+    HEADER_H = 22                # "python" label strip
+    LEADING = 13
+    ROW_PAD = 1                  # above and below every source line
+    INDENT = 12                  # text inset from the left edge
+    RIGHT_PAD = 8
+    MIN_SPLIT_ROWS = 3           # never leave fewer source lines than this on a page
+
+    def __init__(self, lines, lang="python", header=True, highlight=False, width=None):
+        Flowable.__init__(self)
+        self.lines = [ln.expandtabs(4) for ln in lines]
+        self.lang, self.header, self.highlight = lang, header, highlight
+        self.fixed_width = width         # None: fill the frame
+        self._rows, self._wrapped_w = None, None
+
+    def _wrap_rows(self, width):
+        """Break each source line into visual rows ``(start, end, hang)`` that fit `width`."""
+        limit = max(1, int((width - self.INDENT - self.RIGHT_PAD) / (0.6 * CODE_SIZE)))
+        rows = []
+        for ln in self.lines:
+            indent = len(ln) - len(ln.lstrip())
+            # Continuation rows hang one level deeper than the line they continue.
+            hang = min(indent + 4, limit // 2)
+            parts, start, pad = [], 0, 0
+            while pad + len(ln) - start > limit:
+                room = limit - pad
+                cut = ln.rfind(" ", start, start + room + 1)
+                if cut <= max(start, indent):
+                    cut = start + room
+                end = cut
+                while end > start and ln[end-1] == " ":
+                    end -= 1
+                parts.append((start, end, pad))
+                start = cut
+                while start < len(ln) and ln[start] == " ":
+                    start += 1
+                pad = hang
+            parts.append((start, len(ln), pad))
+            rows.append(parts)
+        return rows
+
+    def _row_h(self, parts):
+        return len(parts) * self.LEADING + 2 * self.ROW_PAD
+
+    def wrap(self, availWidth, availHeight):
+        width = self.fixed_width or availWidth
+        if self._wrapped_w != width:
+            self._rows, self._wrapped_w = self._wrap_rows(width), width
+        self.width = width
+        self.height = (self.HEADER_H if self.header else 0) + sum(map(self._row_h, self._rows))
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        self.wrap(availWidth, availHeight)
+        if self.height <= availHeight:
+            return [self]
+        used = self.HEADER_H if self.header else 0
+        n = 0
+        for parts in self._rows:
+            h = self._row_h(parts)
+            if used + h > availHeight:
+                break
+            used += h
+            n += 1
+        n = min(n, len(self.lines) - self.MIN_SPLIT_ROWS)
+        if n < self.MIN_SPLIT_ROWS:
+            return []
+        return [CodeBlock(self.lines[:n], self.lang, self.header, self.highlight, self.fixed_width),
+                CodeBlock(self.lines[n:], self.lang, False, self.highlight, self.fixed_width)]
+
+    def _runs(self):
+        """Yield ``(line, runs)`` with runs as ``(style, start, end)`` over the whole line."""
+        if self.highlight and self.lang == "python":
+            for ln, runs in zip(self.lines, tokens(self.lines)):
+                yield ln, [(CODE_STYLES[k], s, e) for k, s, e in fill(runs, len(ln))]
+        else:
+            for ln in self.lines:
+                yield ln, [(CODE_CMT if ln.startswith("##") else CODE_TXT, 0, len(ln))]
+
+    def draw(self):
+        c, w, h = self.canv, self.width, self.height
+        c.saveState()
+        clip = c.beginPath()
+        clip.roundRect(0, 0, w, h, 4)
+        c.clipPath(clip, stroke=0, fill=0)
+        c.setFillColor(C_CODE_BG)
+        c.rect(0, 0, w, h, fill=1, stroke=0)
+        top = h
+        tx = c.beginText()
+        if self.header:
+            top -= self.HEADER_H
+            c.setFillColor(C_CODE_HDR)
+            c.rect(0, top, w, self.HEADER_H, fill=1, stroke=0)
+            tx.setTextOrigin(14, h - 5 - 8)
+            tx.setFont("Courier-Bold", 8)
+            tx.setFillColor(C_MUTED)
+            tx.textOut(self.lang)
+        char_w = 0.6 * CODE_SIZE
+        font = color = None
+        for (ln, runs), parts in zip(self._runs(), self._rows):
+            y = top - self.ROW_PAD - CODE_SIZE
+            for start, end, pad in parts:
+                tx.setTextOrigin(self.INDENT + pad * char_w, y)
+                for (name, ink), s, e in runs:
+                    s, e = max(s, start), min(e, end)
+                    if s >= e:
+                        continue
+                    if name != font:
+                        font = name
+                        tx.setFont(name, CODE_SIZE)
+                    if ink is not color:
+                        color = ink
+                        tx.setFillColor(ink)
+                    tx.textOut(ln[s:e])
+                y -= self.LEADING
+            top -= self._row_h(parts)
+        c.drawText(tx)
+        c.restoreState()
+        c.setStrokeColor(C_BORDER)
+        c.setLineWidth(1)
+        c.roundRect(0, 0, w, h, 4, stroke=1, fill=0)
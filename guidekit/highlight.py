@@ -0,0 +1,119 @@
+"""Python syntax highlighting for code blocks.
+
+`tokens(lines)` splits a snippet into coloured runs, one list per source line,
+each run a ``(kind, start, end)`` slice of that line. Snippets are tokenized
+once: results are memoised in-process and stored under ``.guide-cache/tokens``
+keyed by a hash of the snippet and of this module's source, so later builds
+just read them back and any change to the scanner starts the cache afresh.
+
+The scanner is a single regex over each line plus a flag for open triple-quoted
+strings; it does not need the snippet to be valid Python, which guide excerpts
+often are not.
+"""
+import builtins
+import hashlib
+import json
+import keyword
+import os
+import re
+from pathlib import Path
+
+from guidekit.cache import CACHE_DIR
+from guidekit.fingerprint import Memo
+
+TOKEN_DIR = CACHE_DIR / "tokens"
+
+# Run kinds. "text" covers identifiers, operators and whitespace.
+TEXT, KEYWORD, BUILTIN, STRING, NUMBER, COMMENT = "text", "kw", "bi", "str", "num", "cmt"
+
+_KEYWORDS = frozenset(keyword.kwlist) | {"self"}
+_BUILTINS = frozenset(n for n in dir(builtins) if not n.startswith("_")) - _KEYWORDS
+
+_SCAN = re.compile(r"""
+    (?P<cmt>\#.*)
+  | (?P<tq>[rRbBuUfF]{0,2}(?:\"\"\"|'''))
+  | (?P<str>[rRbBuUfF]{0,2}(?:"(?:\\.|[^"\\])*"?|'(?:\\.|[^'\\])*'?))
+  | (?P<num>(?<![\w.])(?:0[xXoObB][0-9a-fA-F_]+|(?:\d[\d_]*\.?\d*|\.\d+)(?:[eE][+-]?\d+)?j?))
+  | (?P<name>[A-Za-z_]\w*)
+""", re.X)
+
+_memo = Memo()
+# Salts the cache key: token streams from an older scanner are never served.
+_SCANNER = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).digest()
+
+
+def _scan(lines):
+    out = []
+    open_q = None                       # closing delimiter of an open triple-quoted string
+    for line in lines:
+        runs, pos = [], 0
+        if open_q:
+            end = line.find(open_q)
+            stop = len(line) if end < 0 else end + 3
+            runs.append((STRING, 0, stop))
+            pos = stop
+            if end >= 0:
+                open_q = None
+        while pos < len(line):
+            m = _SCAN.search(line, pos)
+            if m is None:
+                break
+            kind, (s, e) = m.lastgroup, m.span()
+            if kind == "tq":
+                q = line[e-3:e]
+                close = line.find(q, e)
+                if close < 0:
+                    open_q, e = q, len(line)
+                else:
+                    e = close + 3
+                kind = STRING
+            elif kind == "name":
+                word = line[s:e]
+                kind = KEYWORD if word in _KEYWORDS else BUILTIN if word in _BUILTINS else None
+            if kind:
+                runs.append((kind, s, e))
+            pos = e
+        out.append(runs)
+    return out
+
+
+def _key(lines):
+    h = hashlib.blake2b(_SCANNER, digest_size=16)
+    for ln in lines:
+        h.update(ln.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def tokens(lines):
+    """Return the highlighted runs of each line in `lines`, using the token cache."""
+    key = _key(lines)
+    runs = _memo.get(key)
+    if runs is not None:
+        return runs
+    path = TOKEN_DIR / f"{key}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            runs = [[tuple(r) for r in line] for line in json.load(f)]
+    except (FileNotFoundError, json.JSONDecodeError):
+        runs = _scan(lines)
+        TOKEN_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(runs, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    _memo[key] = runs
+    return runs
+
+
+def fill(runs, length):
+    """Expand sparse `runs` to cover ``0..length`` with TEXT runs in the gaps."""
+    out, pos = [], 0
+    for kind, s, e in runs:
+        if s > pos:
+            out.append((TEXT, pos, s))
+        out.append((kind, s, e))
+        pos = e
+    if pos < length:
+        out.append((TEXT, pos, length))
+    return out
@@ -0,0 +1,249 @@
+"""Format-neutral document model for the guides.
+
+The guides describe their content once, as section generators yielding story
+flowables (see `guidekit.story`). `document(g)` reads a guide's sections into a
+small tree of plain nodes -- sections, headings, paragraphs, code blocks,
+callouts, tables (`Grid`) and visualisers -- that the HTML and Markdown
+backends render without any page layout. The PDF backend is ReportLab itself, laying out the
+same flowables.
+
+Toolkit helpers are recognised by the tag `guidekit.blocks.helper` puts on
+their flowables, so a callout or a visualiser comes through as what it is
+(with the arguments it was called with), not as the table that draws it.
+Paragraph text keeps ReportLab's inline markup (``<b>``, ``<i>``, ``<br/>``,
+``<font>``, ``<super>``, entities); each backend translates it.
+
+Sections, headings and the rows of problem-roadmap tables carry anchors
+(``id``), unique within the document, so every backend links to the same
+names: a section's slug, a heading's slug, ``lc-<number>`` for a problem.
+"""
+import functools
+import re
+from collections import namedtuple
+from html import unescape
+
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_RIGHT
+from reportlab.platypus import Paragraph, Table
+from reportlab.platypus.flowables import Flowable
+
+from guidekit.flowables import CodeBlock, ColorRect, HRule
+
+Document = namedtuple("Document", "name title sections")
+Section = namedtuple("Section", "num title blocks id")
+Heading = namedtuple("Heading", "level text id")
+Para = namedtuple("Para", "text role style")
+Code = namedtuple("Code", "lines lang highlight")
+Callout = namedtuple("Callout", "text color icon")
+Badge = namedtuple("Badge", "text bg fg")
+Rule = namedtuple("Rule", "color")
+Grid = namedtuple("Grid", "rows widths header row_ids")
+Cell = namedtuple("Cell", "blocks bg")
+Visual = namedtuple("Visual", "kind args kw table")
+
+# How a paragraph looks: enough for a backend to approximate an ad-hoc style.
+TextStyle = namedtuple("TextStyle", "mono bold italic size color align")
+
+# Named styles (guidekit.styles) -> paragraph role; sH2/sH3 become headings.
+ROLES = {"sTitle": "title", "sSubtitle": "subtitle", "sAuthor": "author", "sBody": "body",
+         "sBullet": "bullet", "sCode": "code", "sCodeCmt": "code", "sLabel": "label",
+         "sNote": "note", "sFormula": "formula", "sCaption": "caption", "sTOC": "toc",
+         "sTOCSub": "tocsub", "sTag": "tag"}
+HEADINGS = {"sH1": 1, "sH2": 2, "sH3": 3}
+VISUALS = {"pointer_vis", "window_vis", "node_chain", "stack_vis", "queue_vis", "mono_stack_vis"}
+
+_ALIGN = {TA_CENTER: "center", TA_RIGHT: "right", TA_JUSTIFY: "justify"}
+_BR = re.compile(r"<br\s*/?>")
+_TAG = re.compile(r"<[^>]+>")
+
+
+def hex_color(c):
+    """``#rrggbb`` for a ReportLab colour (or None)."""
+    if c is None:
+        return None
+    if isinstance(c, str):
+        return c
+    return "#" + c.hexval()[2:8].lower()
+
+
+def plain(text):
+    """`text` without its markup: tags dropped, entities decoded, whitespace collapsed."""
+    if "<" in text:
+        text = _TAG.sub("", _BR.sub(" ", text))
+    return " ".join(unescape(text).split())
+
+
+def slug(text):
+    """A URL fragment for `text`: lower-case ASCII words joined by hyphens."""
+    return re.sub(r"[^a-z0-9]+", "-", plain(text).lower()).strip("-")
+
+
+def cell_text(cell):
+    """The plain text of a table cell's paragraphs and headings."""
+    return " ".join(plain(b.text) for b in cell.blocks if type(b) in (Para, Heading))
+
+
+def problem_numbers(grid):
+    """The LeetCode number on each row of a problem-roadmap table, else None.
+
+    A roadmap table is one whose first header cell is "#"; its rows start with
+    the problem number (the header row and any other row get None).
+    """
+    if not grid.rows or not grid.rows[0] or cell_text(grid.rows[0][0]) != "#":
+        return None
+    nums = [None]
+    for row in grid.rows[1:]:
+        first = cell_text(row[0]) if row else ""
+        nums.append(int(first) if first.isdigit() else None)
+    return nums
+
+
+@functools.lru_cache(maxsize=None)
+def text_style(style):
+    font = style.fontName
+    return TextStyle(mono=font.startswith("Courier"), bold="Bold" in font,
+                     italic="Oblique" in font or "Italic" in font, size=style.fontSize,
+                     color=hex_color(style.textColor), align=_ALIGN.get(style.alignment))
+
+
+def _paragraph(p):
+    name = p.style.name
+    if name in HEADINGS:
+        return Heading(HEADINGS[name], p.text, None)
+    return Para(p.text, ROLES.get(name), text_style(p.style))
+
+
+def _index(i, n):
+    return i + n if i < 0 else i
+
+
+def _backgrounds(t):
+    """Per-cell background colours from a table's BACKGROUND/ROWBACKGROUNDS commands."""
+    nr, nc = t._nrows, t._ncols
+    bg = [[None] * nc for _ in range(nr)]
+    for cmd in t._bkgrndcmds:
+        op, (c0, r0), (c1, r1), arg = cmd[:4]
+        c0, c1 = _index(c0, nc), _index(c1, nc)
+        r0, r1 = _index(r0, nr), _index(r1, nr)
+        for r in range(r0, min(r1, nr - 1) + 1):
+            for c in range(c0, min(c1, nc - 1) + 1):
+                if op == "BACKGROUND":
+                    bg[r][c] = arg
+                elif op == "ROWBACKGROUNDS" and arg:
+                    bg[r][c] = arg[(r - r0) % len(arg)]
+                elif op == "COLBACKGROUNDS" and arg:
+                    bg[r][c] = arg[(c - c0) % len(arg)]
+    return [[hex_color(c) for c in row] for row in bg]
+
+
+def _table(t, header=False):
+    bg = _backgrounds(t)
+    rows = [[Cell(blocks(v if isinstance(v, (list, tuple)) else [v]), bg[r][c])
+             for c, v in enumerate(row)] for r, row in enumerate(t._cellvalues)]
+    widths = [w if isinstance(w, (int, float)) else None for w in t._argW]
+    return Grid(rows, widths, header, None)
+
+
+def _node(f):
+    helper = getattr(f, "_helper", None)
+    args, kw = getattr(f, "_call", ((), {}))
+    if helper == "section_divider":
+        return None
+    if helper in VISUALS:
+        return Visual(helper, args, kw, _table(f)) if isinstance(f, Table) else None
+    if helper == "callout":
+        if not isinstance(f, Table):
+            return None
+        text = args[0] if args else kw["text"]
+        color = args[1] if len(args) > 1 else kw.get("color", f._linecmds[-1][-1])
+        icon = args[2] if len(args) > 2 else kw.get("icon", "💡")
+        return Callout(text, hex_color(color), icon)
+    if helper == "badge" and isinstance(f, Table):
+        p = f._cellvalues[0][0]
+        return Badge(args[0] if args else p.text, hex_color(f._bkgrndcmds[0][3]),
+                     text_style(p.style).color)
+    if isinstance(f, str):
+        return Para(f.replace("&", "&amp;").replace("<", "&lt;"), None, None)
+    if isinstance(f, Paragraph):
+        return _paragraph(f)
+    if isinstance(f, CodeBlock):
+        return Code(f.lines, f.lang, f.highlight)
+    if isinstance(f, Table):
+        return _table(f, header=helper == "std_table")
+    if isinstance(f, (HRule, ColorRect)):
+        return Rule(hex_color(getattr(f, "color", None)))
+    content = getattr(f, "_content", None)    # KeepTogether and friends
+    if isinstance(content, list):
+        return blocks(content)
+    return None
+
+
+def roadmap(table):
+    """The `Grid` of ReportLab `table` if it is a problem roadmap, else None."""
+    node = _node(table)
+    return node if type(node) is Grid and problem_numbers(node) else None
+
+
+def blocks(flowables):
+    """Convert a run of flowables to model nodes, skipping pure layout (spacers, breaks)."""
+    out = []
+    for f in flowables:
+        if not isinstance(f, (Flowable, str)):
+            continue
+        node = _node(f)
+        if isinstance(node, list):
+            out.extend(node)
+        elif node is not None:
+            out.append(node)
+    return out
+
+
+class Anchors:
+    """Hands out a document's anchors, unique in the order they are asked for.
+
+    Every format names things the same way because every format walks the
+    sections in the same order through one of these: the first "Example"
+    heading is ``example``, the next ``example-2``.
+    """
+
+    def __init__(self):
+        self.seen = set()
+
+    def unique(self, base):
+        anchor, n = base, 2
+        while anchor in self.seen:
+            anchor, n = f"{base}-{n}", n + 1
+        self.seen.add(anchor)
+        return anchor
+
+    def section(self, num, title):
+        return self.unique("cover" if num is None else slug(title) or f"section-{num}")
+
+    def heading(self, text, section_id):
+        return self.unique(slug(text) or section_id)
+
+    def problem(self, num):
+        return self.unique(f"lc-{num}")
+
+
+def _anchored(sections):
+    """`sections` with anchors on themselves, their headings and their roadmap rows."""
+    anchors = Anchors()
+    out = []
+    for num, title, body, _ in sections:
+        sid = anchors.section(num, title)
+        body = list(body)
+        for i, b in enumerate(body):
+            if type(b) is Heading:
+                body[i] = b._replace(id=anchors.heading(b.text, sid))
+            elif type(b) is Grid and (nums := problem_numbers(b)):
+                body[i] = b._replace(row_ids=tuple(n and anchors.problem(n) for n in nums))
+        out.append(Section(num, title, body, sid))
+    return out
+
+
+def document(g, name=None):
+    """Build the model of a guide from its script namespace `g` (as run by `runpy`)."""
+    sections = [Section(sec.num, sec.title, blocks(sec()), None) for sec in g["SECTIONS"]]
+    title = getattr(g.get("add_page_bg"), "footer", None) or (name or "Guide")
+    return Document(name, title, _anchored(sections))
+
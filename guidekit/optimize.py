@@ -0,0 +1,138 @@
+"""Output optimization: a peephole pass over each page's content stream.
+
+Platypus draws every flowable -- and every table cell -- inside its own
+``q ... Q`` pair and sets colours, line width and fonts afresh each time, so a
+page repeats state the renderer already has. `optimize_stream` tracks the
+graphics state across the page's operators and drops
+
+* colour (``rg``/``RG``), line width (``w``) and text-state-only
+  ``BT /F Tf TL ET`` lines that set a value which is already current;
+* ``q ... Q`` groups that only contain a ``cm`` -- the save/translate/restore
+  that platypus emits around spacers and empty cells.
+
+It works line by line on ReportLab's output and leaves any line it does not
+recognise alone (apart from noting the state it sets), so it is always safe to
+run. Use it through a canvas maker, which also Flate-compresses every page
+without ReportLab's default ASCII85 wrapping and writes each distinct page
+resource dictionary once, for the pages to share by reference -- ReportLab
+repeats it inline in every page, the forms each page uses (such as the page
+background, see `guidekit.blocks.page_background`) included::
+
+    doc.build(story, canvasmaker=optimizing())
+    doc.build(story, canvasmaker=optimizing(streaming(rec.canvasmaker)))
+"""
+import re
+
+from reportlab.pdfbase.pdfdoc import PDFResourceDictionary, PDFStream, PDFZCompress
+from reportlab.pdfgen.canvas import Canvas
+
+_COLOR = re.compile(r"(?:-?[\d.]+ ){3}(rg|RG)$")
+_WIDTH = re.compile(r"[\d.]+ w$")
+_TEXT_STATE = re.compile(r"BT (/\S+ [\d.]+) Tf ([\d.]+) TL ET$")
+_CM_ONLY = re.compile(r"(?:-?[\d.]+ ){6}cm$")
+_TOKEN = re.compile(r"\((?:\\.|[^\\)])*\)|<[^>]*>|\[[^\]]*\]|/?[^\s()<>\[\]/]+")
+
+# Operators that change a colour in a way this pass does not model.
+_OTHER_COLOR = {"g": "rg", "k": "rg", "cs": "rg", "sc": "rg", "scn": "rg",
+                "G": "RG", "K": "RG", "CS": "RG", "SC": "RG", "SCN": "RG"}
+
+
+def _note(state, line):
+    """Update `state` with whatever the operators on an unrecognised `line` set."""
+    args = []
+    for tok in _TOKEN.findall(line):
+        if tok in ("rg", "RG"):
+            state[tok] = " ".join(args[-3:])
+        elif tok == "w":
+            state["w"] = args[-1] if args else None
+        elif tok == "Tf":
+            state["Tf"] = " ".join(args[-2:])
+        elif tok == "TL":
+            state["TL"] = args[-1] if args else None
+        elif tok in _OTHER_COLOR:
+            state[_OTHER_COLOR[tok]] = None
+        elif tok == "gs":
+            state.clear()       # an ExtGState may set anything
+        else:
+            args.append(tok)
+            continue
+        args = []
+
+
+def optimize_stream(stream):
+    """Return page content `stream` with redundant state operators removed."""
+    out = []
+    state = {}
+    stack = []              # (index of the "q" line in out, state at the "q")
+    for line in stream.split("\n"):
+        if line == "q":
+            stack.append((len(out), dict(state)))
+        elif line == "Q" and stack:
+            start, state = stack.pop()
+            if all(_CM_ONLY.match(ln) for ln in out[start + 1:]):
+                del out[start:]
+                continue
+        elif (m := _COLOR.match(line)) is not None:
+            value = line[:m.start(1) - 1]
+            if state.get(m.group(1)) == value:
+                continue
+            state[m.group(1)] = value
+        elif _WIDTH.match(line):
+            value = line[:-2]
+            if state.get("w") == value:
+                continue
+            state["w"] = value
+        elif (m := _TEXT_STATE.match(line)) is not None:
+            if state.get("Tf") == m.group(1) and state.get("TL") == m.group(2):
+                continue
+            state["Tf"], state["TL"] = m.groups()
+        else:
+            _note(state, line)
+        out.append(line)
+    return "\n".join(out)
+
+
+def _content(stream):
+    # What PDFPage builds itself, minus the ASCII85 layer that ReportLab adds
+    # by default (rl_config.useA85): it makes every compressed stream 25% larger.
+    s = PDFStream()
+    s.filters = [PDFZCompress]
+    s.content = stream
+    s.__Comment__ = "page stream"
+    return s
+
+
+def _resources(page):
+    # The dictionary PDFPage.check_format would build for a page without
+    # graphics states, shadings or colour spaces.
+    r = PDFResourceDictionary()
+    r.basicFonts()
+    if page.hasImages:
+        r.allProcs()
+    else:
+        r.basicProcs()
+    if page.XObjects:
+        r.XObject = page.XObjects
+    return r
+
+
+def optimizing(canvasmaker=Canvas):
+    """Wrap `canvasmaker` so its canvases write optimized, Flate-compressed pages."""
+    def make(*args, **kw):
+        canvas = canvasmaker(*args, **kw)
+        doc = canvas._doc
+        add_page = doc.addPage
+        shared = {}                 # formatted resource dictionary -> its reference
+
+        def addPage(page):
+            page.Contents = _content(optimize_stream(page.stream))
+            if not (page.Resources or page.ExtGState or page._shadingUsed or page._colorsUsed):
+                # Everything else a page's resources hold is named by `key`.
+                key = page.hasImages, tuple(sorted(page.XObjects.dict)) if page.XObjects else ()
+                if key not in shared:
+                    shared[key] = doc.Reference(_resources(page))
+                page.Resources = shared[key]
+            add_page(page)
+        doc.addPage = addPage
+        return canvas
+    return make
@@ -0,0 +1,62 @@
+"""Atomic output files.
+
+A build never writes its final path in place: it renders into a temporary file
+and renames that over the destination once the file is complete, so readers of
+the output directory see either the previous file or the new one, never a
+half-written PDF. The temporary file can live in a separate scratch directory
+(a tmpfs such as ``/dev/shm``), which is much faster to write than a network
+mount; when scratch and destination are on different filesystems the finished
+file is copied next to the destination first and then renamed into place.
+"""
+import contextlib
+import errno
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _temp_in(directory, name):
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    os.fchmod(fd, 0o666 & ~_UMASK)      # mkstemp creates 0600; outputs get normal permissions
+    os.close(fd)
+    return Path(tmp)
+
+
+def publish(tmp, dest):
+    """Move the finished file `tmp` onto `dest` atomically."""
+    try:
+        os.replace(tmp, dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        staged = _temp_in(dest.parent, dest.name)
+        try:
+            shutil.copyfile(tmp, staged)
+            os.replace(staged, dest)
+        except BaseException:
+            staged.unlink(missing_ok=True)
+            raise
+        os.unlink(tmp)
+
+
+@contextlib.contextmanager
+def atomic_output(dest, scratch=None):
+    """Yield a temporary path to write; on success it replaces `dest`.
+
+    The temporary file is created in `scratch` when given, else beside `dest`.
+    If the block raises, the temporary file is removed and `dest` is untouched.
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _temp_in(Path(scratch) if scratch else dest.parent, dest.name)
+    try:
+        yield tmp
+        publish(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,33 @@
+"""Colour palette and page geometry shared by every guide."""
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+
+# ── Color Palette ──────────────────────────────────────────────────────────────
+C_BG        = colors.HexColor("#0F172A")   # dark navy
+C_ACCENT    = colors.HexColor("#38BDF8")   # sky blue
+C_ACCENT2   = colors.HexColor("#818CF8")   # indigo
+C_GREEN     = colors.HexColor("#34D399")   # emerald
+C_YELLOW    = colors.HexColor("#FBBF24")   # amber
+C_RED       = colors.HexColor("#F87171")   # rose
+C_PURPLE    = colors.HexColor("#C084FC")   # purple
+C_CODE_BG   = colors.HexColor("#1E293B")   # code panel
+C_CODE_FG   = colors.HexColor("#E2E8F0")   # code text
+C_HEADING   = colors.HexColor("#F1F5F9")   # near-white
+C_BODY      = colors.HexColor("#CBD5E1")   # light slate
+C_MUTED     = colors.HexColor("#64748B")   # muted slate
+C_BORDER    = colors.HexColor("#334155")   # subtle border
+C_CARD      = colors.HexColor("#1E293B")   # card bg
+C_HIGHLIGHT = colors.HexColor("#0EA5E9")   # bright blue
+C_ORANGE    = colors.HexColor("#FB923C")
+C_TEAL      = colors.HexColor("#2DD4BF")
+C_DARK2     = colors.HexColor("#141E2E")   # alternate table row
+C_ROSE      = colors.HexColor("#FB7185")
+C_AMBER     = colors.HexColor("#F59E0B")
+C_LIME      = colors.HexColor("#A3E635")
+
+# ── Page geometry ──────────────────────────────────────────────────────────────
+PAGE_W, PAGE_H = letter
+MARGIN_X = 0.65*inch
+MARGIN_Y = 0.75*inch
+CW = PAGE_W - 2*MARGIN_X   # usable content width
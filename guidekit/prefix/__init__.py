@@ -0,0 +1,6 @@
+"""Array engines for the prefix-sum guide's techniques.
+
+The guides publish pure-Python versions for reading; these answer the same
+calls over NumPy buffers. The package needs NumPy, which the guide build does
+not: nothing in the build imports it.
+"""
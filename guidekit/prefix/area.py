@@ -0,0 +1,121 @@
+"""Summed-area tables for large 2-D arrays, built in row tiles.
+
+prefixsum.py's 2-D section builds a summed-area table as a list of lists and
+answers one rectangle per call. `SummedAreaTable` keeps the same table -- a
+zero row and column in front, ``table[i, j]`` the sum of ``image[:i, :j]`` --
+in one NumPy buffer and answers whole batches of rectangles at once::
+
+    from guidekit.prefix.area import SummedAreaTable
+    sat = SummedAreaTable.build(np.load("scan.npy", mmap_mode="r"), out="scan-sat.npy")
+    sat.rect_sum(r1, c1, r2, c2)        # arrays of corners, inclusive
+
+The build reads the image a tile of rows at a time and carries the last
+table row from one tile to the next, so only a tile is ever in memory. With
+`out` the table is written to a ``.npy`` file through a memory map -- via
+`guidekit.output`, so a failed build leaves no partial file -- and
+`SummedAreaTable.open` maps it again later. The image and the table can both
+be larger than RAM.
+
+Integer images accumulate in int64. Before each tile is written its worst
+case is bounded by the running sum of absolute values; a table that could
+pass 2^63 - 1 raises OverflowError rather than wrap. Pass
+``dtype=np.float64`` to accumulate such an image approximately instead.
+"""
+import os
+
+import numpy as np
+
+from guidekit.output import atomic_output
+from guidekit.prefix.vector import _accumulator, _check_bound, rect_sum
+
+TILE_BYTES = 64 << 20        # accumulator bytes per tile, by default
+
+
+def _image(image):
+    """`image` as a 2-D array; a path is opened as a memory-mapped ``.npy`` file."""
+    if isinstance(image, (str, os.PathLike)):
+        image = np.load(image, mmap_mode="r")
+    image = np.asarray(image)               # views a memory map, reads nothing
+    if image.ndim != 2:
+        raise ValueError(f"expected a 2-D array, got {image.ndim}-D")
+    return image
+
+
+def _fill(table, image, tile_rows):
+    """Write the sums of `image` into `table` (zero row and column already in place)."""
+    dtype, (rows, cols) = table.dtype, image.shape
+    checked = dtype.kind == "i"
+    bound, carry = 0.0, np.zeros(cols, dtype)
+    for r0 in range(0, rows, tile_rows):
+        tile = image[r0:r0 + tile_rows]
+        if checked:
+            bound = _check_bound(bound, tile, f"row {r0 + len(tile)}", "build with dtype=np.float64")
+        acc = np.cumsum(tile, axis=1, dtype=dtype)
+        np.cumsum(acc, axis=0, out=acc)
+        acc += carry
+        table[r0 + 1:r0 + 1 + len(tile), 1:] = acc
+        carry = acc[-1]
+
+
+class SummedAreaTable:
+    """A summed-area table: ``table[i, j]`` is the sum of ``image[:i, :j]``.
+
+    `table` is any 2-D array in that layout (a memory map included); `build`
+    makes one from an image.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    @property
+    def shape(self):
+        """The shape of the image the table sums."""
+        return self.table.shape[0] - 1, self.table.shape[1] - 1
+
+    @classmethod
+    def build(cls, image, dtype=None, out=None, tile_rows=None, scratch=None):
+        """The table of `image` (an array, a memory map or a ``.npy`` path).
+
+        `dtype` is the accumulator, int64 or float64 (from the image by
+        default). `out` is a ``.npy`` path to write the table to instead of
+        memory; it is replaced only once the table is complete, and `scratch`
+        is as in `guidekit.output`. `tile_rows` is the rows read per tile
+        (enough for `TILE_BYTES` by default).
+        """
+        image = _image(image)
+        rows, cols = image.shape
+        dtype = np.dtype(dtype) if dtype is not None else _accumulator(image.dtype)
+        if dtype not in (np.dtype(np.int64), np.dtype(np.float64)):
+            raise TypeError(f"accumulator must be int64 or float64, not {dtype}")
+        if tile_rows is None:
+            tile_rows = max(1, TILE_BYTES // max(1, cols * dtype.itemsize))
+        if out is None:
+            table = np.zeros((rows + 1, cols + 1), dtype)
+            _fill(table, image, tile_rows)
+            return cls(table)
+        with atomic_output(out, scratch) as tmp:
+            table = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=(rows + 1, cols + 1))
+            table[0] = 0
+            table[:, 0] = 0
+            _fill(table, image, tile_rows)
+            table.flush()
+            del table
+        return cls.open(out)
+
+    @classmethod
+    def open(cls, path):
+        """The table a `build` with `out` wrote to `path`, memory-mapped read-only."""
+        return cls(np.load(path, mmap_mode="r"))
+
+    def rect_sum(self, r1, c1, r2, c2):
+        """The sum of the rectangle from (`r1`, `c1`) to (`r2`, `c2`), inclusive, for each rectangle."""
+        return rect_sum(self.table, r1, c1, r2, c2)
+
+    def rect_mean(self, r1, c1, r2, c2):
+        """The mean of each rectangle, as `rect_sum` takes them; an empty one is a ValueError."""
+        sums = self.rect_sum(r1, c1, r2, c2)
+        area = (np.asarray(r2) - r1 + 1) * (np.asarray(c2) - c1 + 1)
+        if (area == 0).any():
+            raise ValueError("an empty rectangle has no mean")
+        return sums / area
+
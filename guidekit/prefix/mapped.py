@@ -0,0 +1,113 @@
+"""Out-of-core prefix sums: build from a stream, query through a memory map.
+
+`build_prefix` in prefixsum.py needs the whole input as a list. `MappedPrefix`
+builds the same array -- ``prefix[0] = 0``, ``prefix[i]`` the sum of the first
+i values -- from input it reads a chunk at a time: a binary file (a ``.npy``
+file, or raw values of a given dtype) or any iterable of arrays. It writes
+each chunk's sums straight to a ``.npy`` output file, carrying the running
+total from chunk to chunk, so memory use is one chunk whatever the input
+size::
+
+    from guidekit.prefix.mapped import MappedPrefix
+    MappedPrefix.build("events.u4", "events-prefix.npy", dtype="<u4")
+    p = MappedPrefix.open("events-prefix.npy")
+    p.range_sum(L, R)                   # or arrays of bounds
+
+The output is memory-mapped for queries, so ``range_sum`` reads the two
+entries each answer needs -- the pages holding them -- and nothing else.
+Integer input accumulates in int64 and is checked for overflow the way
+`guidekit.prefix.area` checks it.
+"""
+import os
+from itertools import chain
+
+import numpy as np
+
+from guidekit.output import atomic_output
+from guidekit.prefix.vector import _accumulator, _check_bound, range_sum
+
+CHUNK = 1 << 22             # values read per chunk from a file
+HEADER = 128                # bytes reserved for the .npy header
+
+
+def _chunks(source, dtype, chunk):
+    """The input as 1-D arrays: chunks of a file at path `source`, or `source`'s own items."""
+    if isinstance(source, (str, os.PathLike)):
+        if str(source).endswith(".npy"):
+            data = np.load(source, mmap_mode="r")
+        elif dtype is None:
+            raise TypeError("a raw binary file needs its dtype")
+        else:
+            data = np.memmap(source, dtype=dtype, mode="r")
+        source = (data[i:i + chunk] for i in range(0, len(data), chunk))
+    for c in source:
+        c = np.asarray(c)
+        if c.ndim != 1:
+            raise ValueError(f"expected 1-D chunks, got {c.ndim}-D")
+        if c.size:
+            yield c
+
+
+def _header(dtype, length):
+    """A .npy version 1.0 header for `length` values of `dtype`, padded to `HEADER` bytes."""
+    d = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (length,)}
+    text = repr(d).encode("latin1")
+    room = HEADER - 10 - 1                      # magic, version and length; closing newline
+    if len(text) > room:
+        raise ValueError(f"header for shape ({length},) does not fit")
+    return b"\x93NUMPY\x01\x00" + (room + 1).to_bytes(2, "little") + text.ljust(room) + b"\n"
+
+
+class MappedPrefix:
+    """A prefix-sum array held in a file: ``prefix[i]`` is the sum of the first i values."""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def __len__(self):
+        """The number of values summed (one less than the entries)."""
+        return len(self.prefix) - 1
+
+    @classmethod
+    def build(cls, source, out, dtype=None, chunk=CHUNK, scratch=None):
+        """Write the prefix sums of `source` to ``.npy`` file `out` and map it.
+
+        `source` is a path -- to a ``.npy`` file, or to raw values of `dtype`
+        -- or an iterable of 1-D arrays. `chunk` is the values read per chunk
+        of a file. The output is written through `guidekit.output`, so `out`
+        is replaced only once it is complete; `scratch` is as there.
+        """
+        chunks = _chunks(source, dtype, chunk)
+        first = next(chunks, None)
+        acc = _accumulator(first.dtype) if first is not None else np.dtype(np.int64)
+        acc = acc.newbyteorder("<")
+        if first is not None:
+            chunks = chain([first], chunks)
+        checked, bound = acc.kind == "i", 0.0
+        total, length = acc.type(0), 1
+        with atomic_output(out, scratch) as tmp:
+            with open(tmp, "wb") as f:
+                f.seek(HEADER)
+                f.write(np.zeros(1, acc).data)
+                for c in chunks:
+                    if _accumulator(c.dtype) != acc:
+                        raise TypeError(f"chunk of {c.dtype} in a stream of {first.dtype}")
+                    if checked:
+                        bound = _check_bound(bound, c, f"value {length - 1 + len(c)}",
+                                             "pass float chunks instead")
+                    sums = np.cumsum(c, dtype=acc)
+                    sums += total
+                    f.write(sums.data)
+                    total, length = sums[-1], length + len(c)
+                f.seek(0)
+                f.write(_header(acc, length))
+        return cls.open(out)
+
+    @classmethod
+    def open(cls, path):
+        """The prefix array a `build` wrote to `path`, memory-mapped read-only."""
+        return cls(np.load(path, mmap_mode="r"))
+
+    def range_sum(self, L, R):
+        """The sum of values ``L..R`` (0-indexed, inclusive) for each pair of bounds in `L`, `R`."""
+        return range_sum(self.prefix, L, R)
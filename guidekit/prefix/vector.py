@@ -0,0 +1,133 @@
+"""Vectorised prefix sums: prefixsum.py's functions over NumPy arrays.
+
+The calls and the conventions are the guide's -- a prefix array has a zero
+sentinel in front, so ``prefix[i]`` is the sum of ``arr[:i]`` and
+``range_sum(prefix, L, R)`` is the sum of ``arr[L..R]``, both inclusive -- but
+the builds are single ``cumsum`` / ``bitwise_xor.accumulate`` passes and the
+queries take arrays of bounds, answering every query in one call::
+
+    from guidekit.prefix.vector import build_prefix, range_sum
+    prefix = build_prefix(counts)
+    range_sum(prefix, ls, rs)           # ls, rs: arrays of query bounds
+
+A single bound pair still works and returns one number. Integer input
+accumulates in int64 and floating-point input in float64; like the Python
+version's ``long`` in Java (Edge Case 5), int64 wraps silently if the
+running total exceeds 2^63 - 1. A uint64 value that does not fit in int64
+on its own raises OverflowError instead.
+"""
+import numpy as np
+
+_INT64_MAX = float(np.iinfo(np.int64).max)
+
+
+def _accumulator(dtype):
+    """The type sums of `dtype` values accumulate in: int64 or float64."""
+    if dtype.kind in "biu":
+        return np.dtype(np.int64)
+    if dtype.kind == "f":
+        return np.dtype(np.float64)
+    raise TypeError(f"cannot sum values of type {dtype}")
+
+
+def _check_bound(bound, values, where, remedy):
+    """Add the absolute sum of `values` to running `bound` and return it.
+
+    Raises OverflowError, naming `where` and suggesting `remedy`, once the
+    bound reaches 2^63 - 1: past that, int64 sums of the values seen so far
+    could wrap.
+    """
+    bound += float(np.abs(values).sum(dtype=np.float64))
+    if bound >= _INT64_MAX:
+        raise OverflowError(f"sums up to {where} may exceed int64; {remedy}")
+    return bound
+
+
+def _values(arr, ndim):
+    """`arr` as an int64 or float64 array of `ndim` dimensions."""
+    a = np.asarray(arr)
+    if a.ndim != ndim:
+        raise ValueError(f"expected a {ndim}-D array, got {a.ndim}-D")
+    if a.size == 0:                                 # [] comes in as float64
+        return a.astype(np.int64)
+    if a.dtype.kind == "u" and a.max() > np.iinfo(np.int64).max:
+        raise OverflowError(f"value {a.max()} does not fit in int64")
+    return a.astype(_accumulator(a.dtype), copy=False)
+
+
+def _index(bound):
+    """Query bound(s) `bound` as an intp array; anything but integers is a TypeError."""
+    b = np.asarray(bound)
+    if b.size == 0:                                 # [] comes in as float64
+        return b.astype(np.intp)
+    if b.dtype.kind not in "iu":
+        raise TypeError(f"range bounds must be integers, not {b.dtype}")
+    if b.dtype.kind == "u" and b.max() > np.iinfo(np.intp).max:
+        raise IndexError(f"range bound {b.max()} out of range")
+    return b.astype(np.intp)
+
+
+def _bounds(size, lo, hi):
+    """Check `lo` <= `hi` + 1 within ``[0, size)``; returns both as intp arrays."""
+    lo, hi = _index(lo), _index(hi)
+    if lo.size and (lo.min() < 0 or hi.max() >= size or (lo > hi + 1).any()):
+        raise IndexError(f"range outside [0, {size}) or reversed")
+    return lo, hi
+
+
+def build_prefix(arr):
+    """The 1-based prefix sums of `arr`: ``prefix[0] = 0``, ``prefix[i] = arr[0] + ... + arr[i-1]``."""
+    a = _values(arr, 1)
+    prefix = np.zeros(len(a) + 1, a.dtype)
+    np.cumsum(a, out=prefix[1:])
+    return prefix
+
+
+def range_sum(prefix, L, R):
+    """The sum of ``arr[L..R]`` (0-indexed, inclusive) for each pair of bounds in `L`, `R`."""
+    L, R = _bounds(len(prefix) - 1, L, R)
+    return prefix[R + 1] - prefix[L]
+
+
+def build_2d_prefix(matrix):
+    """The summed-area table of `matrix`: ``prefix[i][j]`` sums ``matrix[:i, :j]``."""
+    m = _values(matrix, 2)
+    prefix = np.zeros((m.shape[0] + 1, m.shape[1] + 1), m.dtype)
+    np.cumsum(m, axis=0, out=prefix[1:, 1:])
+    np.cumsum(prefix[1:, 1:], axis=1, out=prefix[1:, 1:])
+    return prefix
+
+
+def rect_sum(prefix, r1, c1, r2, c2):
+    """The sum of the rectangle from (`r1`, `c1`) to (`r2`, `c2`), inclusive, for each rectangle."""
+    rows, cols = prefix.shape[0] - 1, prefix.shape[1] - 1
+    r1, r2 = _bounds(rows, r1, r2)
+    c1, c2 = _bounds(cols, c1, c2)
+    return (prefix[r2 + 1, c2 + 1]
+            - prefix[r1, c2 + 1]
+            - prefix[r2 + 1, c1]
+            + prefix[r1, c1])
+
+
+def build_suffix(arr):
+    """The suffix sums of `arr`: ``suffix[i] = arr[i] + ... + arr[n-1]``, ``suffix[n] = 0``."""
+    a = _values(arr, 1)
+    suffix = np.zeros(len(a) + 1, a.dtype)
+    np.cumsum(a[::-1], out=suffix[-2::-1])
+    return suffix
+
+
+def build_xor_prefix(arr):
+    """The 1-based prefix XORs of integer array `arr` (``xor_prefix[0] = 0``)."""
+    a = _values(arr, 1)
+    if a.dtype.kind != "i":
+        raise TypeError(f"cannot XOR values of type {a.dtype}")
+    xor_prefix = np.zeros(len(a) + 1, a.dtype)
+    np.bitwise_xor.accumulate(a, out=xor_prefix[1:])
+    return xor_prefix
+
+
+def xor_range(xor_prefix, L, R):
+    """The XOR of ``arr[L..R]`` (inclusive) for each pair of bounds in `L`, `R`."""
+    L, R = _bounds(len(xor_prefix) - 1, L, R)
+    return xor_prefix[R + 1] ^ xor_prefix[L]
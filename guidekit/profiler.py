@@ -0,0 +1,180 @@
+"""Opt-in build profiler: where does ``doc.build`` spend its time?
+
+`Profiler.instrument(story)` wraps the ``wrap``, ``split`` and ``drawOn`` methods
+of every top-level flowable (on the instance, so nothing global is patched) and
+records the time and memory each call takes. Nested flowables -- the Paragraphs
+inside a Table -- are charged to the top-level flowable that contains them, and
+the pieces a flowable splits into stay charged to it.
+
+Samples are aggregated two ways:
+
+* by section: the run of flowables after each ``section_divider`` (anything
+  before the first divider is the front matter);
+* by helper: the toolkit function that produced the flowable (``code_block``,
+  ``std_table``, ``node_chain`` ...), or its class name when it was built inline.
+
+`Profiler.write(out_dir, guide)` produces ``<guide>.json`` (every aggregate,
+sortable) and ``<guide>.txt`` (the top sections and helpers by total time).
+Memory is measured with tracemalloc, which roughly doubles layout time, so use
+the reported numbers to compare flowables with each other, not with a normal build.
+"""
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from guidekit.story import LazyStory, iter_flowables
+
+FRONT_MATTER = "(front matter)"
+_PHASES = ("wrap", "split", "draw")
+
+
+class _Stat:
+    __slots__ = ("calls", "wrap", "split", "draw", "alloc", "peak")
+
+    def __init__(self):
+        self.calls = 0
+        self.wrap = self.split = self.draw = 0.0
+        self.alloc = self.peak = 0
+
+    def add(self, phase, seconds, alloc, peak):
+        self.calls += 1
+        setattr(self, phase, getattr(self, phase) + seconds)
+        self.alloc += alloc
+        self.peak = max(self.peak, peak)
+
+    @property
+    def total(self):
+        return self.wrap + self.split + self.draw
+
+    def as_dict(self, **extra):
+        return dict(extra, total=self.total, wrap=self.wrap, split=self.split, draw=self.draw,
+                    calls=self.calls, alloc_bytes=self.alloc, peak_bytes=self.peak)
+
+
+class Profiler:
+    """Instruments a story and collects per-flowable wrap/split/draw samples."""
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.sections = {}          # section title -> _Stat
+        self.helpers = {}           # helper name -> _Stat
+        self.flowables = {}         # (section, index) -> (helper, _Stat)
+        self.build_seconds = 0.0
+        self._depth = 0
+
+    # ── instrumentation ───────────────────────────────────────────────────────
+    def instrument(self, story):
+        """Yield the flowables of `story` with each one's layout methods timed.
+
+        `story` is a flowable iterable or a guide's list of section generators.
+        """
+        section = FRONT_MATTER
+        for i, f in enumerate(iter_flowables(story)):
+            section = getattr(f, "_section", section)
+            self._attach(f, section, i)
+            yield f
+
+    def _attach(self, f, section, index):
+        name = getattr(f, "_helper", type(f).__name__)
+        stat = self.flowables.setdefault((section, index), (name, _Stat()))[1]
+        targets = (self.sections.setdefault(section, _Stat()),
+                   self.helpers.setdefault(name, _Stat()), stat)
+        self._hook(f, targets)
+
+    def _hook(self, f, targets):
+        if f.__dict__.get("_profiled"):
+            return
+        f._profiled = True
+        for phase, method in (("wrap", "wrap"), ("split", "split"), ("draw", "drawOn")):
+            setattr(f, method, self._timed(phase, getattr(f, method), targets))
+
+    def _timed(self, phase, fn, targets):
+        def timed(*args, **kw):
+            if self._depth:             # nested call (split -> wrap): charged to the caller
+                return fn(*args, **kw)
+            self._depth += 1
+            if self.memory:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            t0 = time.perf_counter()
+            try:
+                out = fn(*args, **kw)
+            finally:
+                dt = time.perf_counter() - t0
+                self._depth -= 1
+            alloc = peak = 0
+            if self.memory:
+                now, top = tracemalloc.get_traced_memory()
+                alloc, peak = max(0, now - before), max(0, top - before)
+            for t in targets:
+                t.add(phase, dt, alloc, peak)
+            if phase == "split":
+                # The pieces are laid out later; keep charging them to this flowable.
+                for piece in out:
+                    self._hook(piece, targets)
+            return out
+        return timed
+
+    # ── build ─────────────────────────────────────────────────────────────────
+    def build(self, doc, story, **kw):
+        """Instrument `story` and run ``doc.build`` on it, timing the whole build."""
+        story = self.instrument(story)
+        started = self.memory and not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        try:
+            doc.build(LazyStory(story), **kw)
+        finally:
+            self.build_seconds = time.perf_counter() - t0
+            if started:
+                tracemalloc.stop()
+
+    # ── reporting ─────────────────────────────────────────────────────────────
+    def report(self, guide):
+        by_total = lambda d: d["total"]
+        flowables = [s.as_dict(section=sec, index=i, helper=name)
+                     for (sec, i), (name, s) in self.flowables.items() if s.calls]
+        measured = sum(s.total for s in self.sections.values())
+        return {
+            "guide": guide,
+            "build_seconds": self.build_seconds,
+            "measured_seconds": measured,
+            "other_seconds": max(0.0, self.build_seconds - measured),
+            "memory": self.memory,
+            "sections": sorted((s.as_dict(section=k) for k, s in self.sections.items() if s.calls),
+                               key=by_total, reverse=True),
+            "helpers": sorted((s.as_dict(helper=k) for k, s in self.helpers.items() if s.calls),
+                              key=by_total, reverse=True),
+            "flowables": sorted(flowables, key=by_total, reverse=True),
+        }
+
+    def write(self, out_dir, guide, top=10):
+        """Write ``<guide>.json`` and ``<guide>.txt`` under `out_dir`; returns the report."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        rep = self.report(guide)
+        with open(out_dir / f"{guide}.json", "w", encoding="utf-8") as f:
+            json.dump(rep, f, indent=1)
+        (out_dir / f"{guide}.txt").write_text(format_summary(rep, top), encoding="utf-8")
+        return rep
+
+
+def format_summary(rep, top=10):
+    """Render a profiler report as the plain-text summary written next to the JSON."""
+    ms = lambda s: f"{s*1000:9.1f}"
+    kb = lambda b: f"{b/1024:9.0f}"
+    head = f"{'':<44} {'total ms':>9} {'wrap':>9} {'split':>9} {'draw':>9} {'calls':>6} {'peak KB':>9}"
+    def rows(items, key):
+        out = [head.replace(" " * 44, f"{key:<44}", 1)]
+        for d in items[:top]:
+            out.append(f"{str(d[key])[:44]:<44} {ms(d['total'])} {ms(d['wrap'])} {ms(d['split'])} "
+                       f"{ms(d['draw'])} {d['calls']:>6} {kb(d['peak_bytes'])}")
+        return out
+    lines = [f"{rep['guide']}: build {rep['build_seconds']*1000:.0f} ms, "
+             f"{rep['measured_seconds']*1000:.0f} ms in flowables, "
+             f"{rep['other_seconds']*1000:.0f} ms page handling/output", ""]
+    lines += rows(rep["sections"], "section") + [""]
+    lines += rows(rep["helpers"], "helper")
+    return "\n".join(lines) + "\n"
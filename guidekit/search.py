@@ -0,0 +1,125 @@
+"""Client-side search index for the static site.
+
+The index maps search terms to entries -- sections, headings, roadmap problems
+and the code under each heading -- so the site can search without a server.
+It is built from the document model of each guide:
+
+* section titles and headings, by word;
+* roadmap problems, by number (``303`` and ``lc303``) and by title;
+* code identifiers (``prefix``, ``build_prefix``, ``defaultdict``), pointing
+  at the heading the code block sits under.
+
+Each guide's part (a *shard*) is cached under ``.guide-cache/search/`` keyed by
+a hash of the guide's page, so a rebuild re-indexes only the guides that
+changed and merges the rest from the cache. The merged index is written as
+gzipped JSON -- about a fifth of its raw size -- and fetched by the page only
+when the search box is first used, so it costs nothing on first page load::
+
+    {"pages": [[file, title], ...],
+     "docs":  [[page, anchor, label], ...],
+     "terms": {term: [doc, ...], ...}}
+"""
+import builtins
+import gzip
+import json
+import keyword
+import re
+
+from guidekit import cache
+from guidekit.model import Code, Grid, Heading, cell_text, plain, problem_numbers
+
+SHARD_DIR = cache.CACHE_DIR / "search"
+
+_WORD = re.compile(r"[a-z0-9_]+")
+_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_STOP = frozenset("a an and are as at be by for from how in is it of on or the to vs with".split())
+_NOT_IDENTS = frozenset(keyword.kwlist) | frozenset(dir(builtins)) | {"self", "cls"}
+
+
+def words(text):
+    """The search terms in (markup-free) `text`."""
+    return [w for w in _WORD.findall(text.lower()) if w not in _STOP]
+
+
+def identifiers(lines):
+    """The distinct identifiers a code block defines or uses, keywords and builtins aside."""
+    found = set()
+    for line in lines:
+        code = line.split("#", 1)[0]
+        found.update(m for m in _IDENT.findall(code) if len(m) > 1 and m not in _NOT_IDENTS)
+    return {m.lower() for m in found}
+
+
+def shard(doc):
+    """Index one guide: ``{"docs": [[anchor, label]], "terms": {term: [doc]}}``."""
+    docs, terms = [], {}
+
+    def entry(anchor, label, *term_sets):
+        n = len(docs)
+        docs.append([anchor, label])
+        for ts in term_sets:
+            for t in ts:
+                postings = terms.setdefault(t, [])
+                if not postings or postings[-1] != n:
+                    postings.append(n)
+        return n
+
+    for sec in doc.sections:
+        if sec.num is None:
+            continue
+        current = entry(sec.id, sec.title, words(sec.title))
+        for b in sec.blocks:
+            if type(b) is Heading:
+                text = plain(b.text)
+                current = entry(b.id, f"{sec.title} › {text}", words(text))
+            elif type(b) is Code:
+                for t in identifiers(b.lines):
+                    postings = terms.setdefault(t, [])
+                    if not postings or postings[-1] != current:
+                        postings.append(current)
+            elif type(b) is Grid and b.row_ids:
+                for row, anchor, num in zip(b.rows, b.row_ids, problem_numbers(b)):
+                    if anchor:
+                        title = cell_text(row[1]) if len(row) > 1 else ""
+                        entry(anchor, f"LC {num} · {title}", (str(num), f"lc{num}"), words(title))
+    for postings in terms.values():
+        postings.sort()
+    return {"docs": docs, "terms": terms}
+
+
+def cached_shard(doc, key, shard_dir=SHARD_DIR):
+    """`shard(doc)`, reused from the cache while the guide's `key` is unchanged.
+
+    Returns the shard and whether it had to be rebuilt.
+    """
+    path = shard_dir / f"{doc.name}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["shard"], False
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    part = shard(doc)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "shard": part}, f, separators=(",", ":"))
+    return part, True
+
+
+def merge(pages):
+    """Combine per-guide shards, given as ``[(file, title, shard)]``, into one index."""
+    index = {"pages": [], "docs": [], "terms": {}}
+    for p, (file, title, part) in enumerate(pages):
+        base = len(index["docs"])
+        index["pages"].append([file, title])
+        index["docs"].extend([p, anchor, label] for anchor, label in part["docs"])
+        for term, postings in part["terms"].items():
+            index["terms"].setdefault(term, []).extend(base + n for n in postings)
+    return index
+
+
+def compress(index):
+    """The gzipped JSON bytes of `index` (reproducible: no timestamp in the header)."""
+    raw = json.dumps(index, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return gzip.compress(raw.encode("utf-8"), compresslevel=9, mtime=0)
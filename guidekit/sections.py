@@ -0,0 +1,230 @@
+"""Section-level layout cache.
+
+Every guide separates its sections with a top-level ``PageBreak``, so each
+section starts on a fresh page and lays out independently of the others. The
+cache records the PDF drawing operators each section's flowables emit on every
+page it fills, keyed by a fingerprint of those flowables. On the next build an
+unchanged section is replayed from the cache instead of being wrapped and split
+again; only the page template (`add_page_bg`) is redrawn, so page numbers stay
+correct wherever the section lands.
+
+Anything a flowable adds to the document besides page content -- a named
+destination, a link, a form -- goes through a `replayable` action, which the
+cache stores with the page and repeats on replay.
+"""
+import functools
+import importlib
+import json
+import os
+import re
+from pathlib import Path
+
+import reportlab
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak
+from reportlab.platypus.doctemplate import ActionFlowable
+from reportlab.platypus.flowables import Flowable
+
+from guidekit.cache import CACHE_DIR
+from guidekit.fingerprint import fingerprint
+
+SECTION_DIR = CACHE_DIR / "sections"
+
+# Font selection inside captured operators: "/F3 9 Tf". Internal font names are
+# allocated per document in first-use order, so they are remapped on replay.
+_FONT_OP = re.compile(r"/(F\d+)( [-\d.]+ Tf)")
+
+
+def split_sections(story):
+    """Split a story at its top-level page breaks into (flowables, break) pairs."""
+    chunks, cur = [], []
+    for f in story:
+        if type(f) is PageBreak:
+            chunks.append((cur, f))
+            cur = []
+        else:
+            cur.append(f)
+    chunks.append((cur, None))
+    return chunks
+
+
+class SectionCache:
+    """On-disk store of captured section pages, one JSON file per section key."""
+
+    def __init__(self, root=SECTION_DIR):
+        self.root = Path(root)
+
+    def _path(self, key):
+        return self.root / f"{key}.json"
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, key, entry):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self._path(key).with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, self._path(key))
+
+
+# ── Replayable actions ─────────────────────────────────────────────────────────
+_ACTIONS = {}       # (module, qualified name) -> action
+
+
+def replayable(fn):
+    """Declare `fn(canvas, *args)` a canvas action that replaying a section repeats.
+
+    Captured pages keep only their content operators; destinations, link
+    annotations and forms live elsewhere in the document. Calls made while a
+    section is captured are stored with its page (so the arguments must be
+    JSON values, with positions in absolute page coordinates) and made again,
+    on whatever page the section lands, when it is replayed.
+    """
+    key = (fn.__module__, fn.__qualname__)
+    _ACTIONS[key] = fn
+
+    @functools.wraps(fn)
+    def action(canvas, *args):
+        recorder = getattr(canvas, "_recorder", None)
+        if recorder is not None:
+            recorder.record(key, args)
+        return fn(canvas, *args)
+    return action
+
+
+def _action(module, name):
+    if (module, name) not in _ACTIONS:
+        importlib.import_module(module)      # registers its actions
+    return _ACTIONS[module, name]
+
+
+# ── Story markers ──────────────────────────────────────────────────────────────
+class _SectionStart(ActionFlowable):
+    """Zero-size marker: pages from here to the next marker belong to `key`."""
+
+    def __init__(self, recorder, key):
+        ActionFlowable.__init__(self)
+        self.recorder, self.key = recorder, key
+
+    def apply(self, doc):
+        self.recorder.begin(self.key)
+
+
+class ReplayPage(Flowable):
+    """Re-emits one cached page of section content at its original page position."""
+
+    def __init__(self, ops, fonts, forms=(), actions=()):
+        Flowable.__init__(self)
+        self.ops, self.fonts, self.forms, self.actions = ops, fonts, forms, actions
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        # Captured operators are in absolute page coordinates: no translation.
+        doc = canvas._doc
+        names = {old: doc.getInternalFontName(ps)[1:] for old, ps in self.fonts.items()}
+        rename = lambda m: f"/{names[m.group(1)]}{m.group(2)}"
+        canvas._code.extend(_FONT_OP.sub(rename, op) for op in self.ops)
+        canvas._formsinuse.extend(self.forms)
+        for module, name, args in self.actions:
+            _action(module, name)(canvas, *args)
+
+
+# ── Recorder ───────────────────────────────────────────────────────────────────
+class SectionRecorder:
+    """Rewrites a story to replay cached sections and captures the rest.
+
+    Usage::
+
+        rec = SectionRecorder(doc)
+        story = rec.prepare(story)
+        doc.build(story, onFirstPage=rec.on_page(add_page_bg),
+                  onLaterPages=rec.on_page(add_page_bg), canvasmaker=rec.canvasmaker)
+        rec.commit()
+    """
+
+    def __init__(self, doc, cache=None):
+        self.doc = doc
+        self.cache = cache or SectionCache()
+        self.geometry = (reportlab.Version, doc.pagesize, doc.leftMargin, doc.rightMargin,
+                         doc.topMargin, doc.bottomMargin)
+        self.captured = {}      # key -> {"pages", "fonts", "forms", "actions"}; see end_page
+        self._key = None
+        self._mark = self._forms = 0
+        self._actions = []      # replayable actions on the current page
+        self.hits = self.misses = 0
+
+    def prepare(self, story):
+        out = []
+        for flowables, brk in split_sections(story):
+            if flowables:
+                key = fingerprint(self.geometry, flowables)
+                entry = self.cache.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    out.append(_SectionStart(self, None))
+                    none = [[] for _ in entry["pages"]]
+                    pages = zip(entry["pages"], entry.get("forms", none), entry.get("actions", none))
+                    for i, (ops, forms, actions) in enumerate(pages):
+                        if i:
+                            out.append(PageBreak())
+                        out.append(ReplayPage(ops, entry["fonts"], forms, actions))
+                else:
+                    self.misses += 1
+                    out.append(_SectionStart(self, key))
+                    out.extend(flowables)
+            if brk is not None:
+                out.append(brk)
+        return out
+
+    def begin(self, key):
+        self._key = key
+        if key is not None:
+            self.captured[key] = {"pages": [], "fonts": {}, "forms": [], "actions": []}
+
+    def record(self, action, args):
+        if self._key is not None:
+            self._actions.append([*action, list(args)])
+
+    def on_page(self, draw_page):
+        """Wrap a page-template callback so capture starts after the page background."""
+        def on_page(canvas, doc):
+            draw_page(canvas, doc)
+            self._mark, self._forms = len(canvas._code), len(canvas._formsinuse)
+            self._actions = []
+        return on_page
+
+    def end_page(self, canvas):
+        if self._key is None:
+            return
+        # Per page: the content operators, the forms they draw and the actions.
+        ops = canvas._code[self._mark:]
+        entry = self.captured[self._key]
+        entry["pages"].append(ops)
+        entry["forms"].append(canvas._formsinuse[self._forms:])
+        entry["actions"].append(self._actions)
+        inverse = {v[1:]: k for k, v in canvas._doc.fontMapping.items()}
+        for m in _FONT_OP.finditer("".join(ops)):
+            entry["fonts"][m.group(1)] = inverse[m.group(1)]
+
+    def canvasmaker(self, *args, **kw):
+        canvas = _RecordingCanvas(*args, **kw)
+        canvas._recorder = self
+        return canvas
+
+    def commit(self):
+        for key, entry in self.captured.items():
+            if entry["pages"]:
+                self.cache.put(key, entry)
+
+
+class _RecordingCanvas(Canvas):
+    def showPage(self):
+        self._recorder.end_page(self)
+        Canvas.showPage(self)
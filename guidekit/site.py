@@ -0,0 +1,171 @@
+"""Static HTML site: every guide as a page, an index page and client-side search.
+
+    python -m guidekit --site -o build/site
+
+The guide pages are the HTML export (`guidekit.export.html`, visualisers as
+inline SVG) linking one shared stylesheet instead of embedding it. Every page
+has a search box; `search.js` fetches the gzipped index (`guidekit.search`)
+the first time the box is focused. Files whose content has not changed are
+left untouched, so a rebuild rewrites only what a guide edit affected.
+"""
+import hashlib
+import time
+from html import escape
+from pathlib import Path
+
+from guidekit import search
+from guidekit.driver import OUT_DIR, _peak_rss_kb, run_guide
+from guidekit.export import html
+from guidekit.model import document
+from guidekit.output import atomic_output
+
+SITE_DIR = OUT_DIR / "site"
+INDEX_FILE = "search.json.gz"
+
+SITE_CSS = """\
+header.site{position:sticky;top:0;z-index:1;background:var(--code-hdr);border-bottom:1px solid var(--border)}
+header.site .bar{max-width:820px;margin:0 auto;padding:8px 20px;display:flex;gap:16px;align-items:center}
+header.site a.home{color:var(--heading);font-weight:bold;text-decoration:none;white-space:nowrap}
+.search{position:relative;flex:1}
+.search input{width:100%;padding:6px 10px;border-radius:4px;border:1px solid var(--border);
+background:var(--card);color:var(--heading);font:14px Helvetica,Arial,sans-serif}
+.search ol{position:absolute;left:0;right:0;margin:2px 0 0;padding:4px 0;list-style:none;
+background:var(--card);border:1px solid var(--border);border-radius:4px;max-height:60vh;overflow-y:auto}
+.search ol:empty{display:none}
+.search li a{display:block;padding:4px 10px;color:var(--body);text-decoration:none}
+.search li a:hover,.search li a:focus{background:var(--dark2);color:var(--accent)}
+.search li small{color:var(--muted);margin-left:.6em}
+ul.guides{list-style:none;padding:0}
+ul.guides li{margin:0 0 18px}
+ul.guides a{color:var(--heading);font-size:18px;font-weight:bold}
+ul.guides p{margin:4px 0 0;color:var(--muted);font-size:13px}
+"""
+
+SEARCH_JS = """\
+(function () {
+  "use strict";
+  var box = document.getElementById("q"), list = document.getElementById("hits"), index = null, loading = null;
+
+  function load() {
+    if (!loading) {
+      loading = fetch(box.dataset.index).then(function (r) { return r.arrayBuffer(); }).then(function (buf) {
+        var b = new Uint8Array(buf);
+        if (b[0] === 0x1f && b[1] === 0x8b) {        // not already decoded by the server
+          var s = new Blob([buf]).stream().pipeThrough(new DecompressionStream("gzip"));
+          return new Response(s).json();
+        }
+        return JSON.parse(new TextDecoder().decode(buf));
+      }).then(function (j) { index = j; index.keys = Object.keys(j.terms); });
+    }
+    return loading;
+  }
+
+  function lookup(word) {
+    var exact = index.terms[word] || [], hits = new Map();
+    index.keys.forEach(function (k) {
+      if (k.startsWith(word)) index.terms[k].forEach(function (d) { hits.set(d, 1); });
+    });
+    exact.forEach(function (d) { hits.set(d, 2); });
+    return hits;
+  }
+
+  function run() {
+    var words = box.value.toLowerCase().match(/[a-z0-9_]+/g) || [], scores = null;
+    words.forEach(function (w) {
+      var hits = lookup(w), next = new Map();
+      hits.forEach(function (s, d) {
+        if (!scores) next.set(d, s); else if (scores.has(d)) next.set(d, scores.get(d) + s);
+      });
+      scores = next;
+    });
+    var ranked = scores ? Array.from(scores).sort(function (a, b) { return b[1] - a[1] || a[0] - b[0]; }) : [];
+    list.innerHTML = "";
+    ranked.slice(0, 20).forEach(function (hit) {
+      var doc = index.docs[hit[0]], page = index.pages[doc[0]];
+      var li = document.createElement("li"), a = document.createElement("a"), small = document.createElement("small");
+      a.href = page[0] + "#" + doc[1];
+      a.textContent = doc[2];
+      small.textContent = page[1];
+      a.appendChild(small);
+      li.appendChild(a);
+      list.appendChild(li);
+    });
+  }
+
+  box.addEventListener("focus", load, {once: true});
+  box.addEventListener("input", function () { load().then(run); });
+  document.addEventListener("keydown", function (e) {
+    if (e.key === "/" && document.activeElement !== box) { e.preventDefault(); box.focus(); }
+    if (e.key === "Escape") list.innerHTML = "";
+  });
+})();
+"""
+
+
+def _head():
+    return ('<link rel="stylesheet" href="site.css">'
+            '<script src="search.js" defer></script>')
+
+
+def _header(home):
+    return ('<header class="site"><div class="bar">'
+            f'<a class="home" href="index.html">{escape(home)}</a>'
+            '<div class="search"><input id="q" type="search" placeholder="Search titles, LC numbers, code  ( / )" '
+            f'autocomplete="off" data-index="{INDEX_FILE}"><ol id="hits"></ol></div></div></header>')
+
+
+def index_page(title, guides):
+    """The landing page: every guide with its sections. `guides` is ``[(file, doc)]``."""
+    out = ["<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\">"
+           '<meta name="viewport" content="width=device-width,initial-scale=1">'
+           f"<title>{escape(title)}</title>{_head()}</head><body>{_header(title)}"
+           '<main><ul class="guides">']
+    for file, doc in guides:
+        sections = " · ".join(escape(s.title) for s in doc.sections if s.num)
+        out.append(f'<li><a href="{escape(file)}">{escape(doc.title)}</a><p>{sections}</p></li>')
+    out.append("</ul></main></body></html>\n")
+    return "".join(out)
+
+
+def _publish(path, data, scratch):
+    """Write `data` (bytes) to `path` unless it already holds exactly that; True if written."""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    with atomic_output(path, scratch) as tmp:
+        tmp.write_bytes(data)
+    return True
+
+
+def build_site(paths, out_dir=SITE_DIR, scratch=None, title="Zero to Hero Guides"):
+    """Build the site for the guides in `paths` into `out_dir`; returns one result per guide.
+
+    The results have the shape `guidekit.driver.build_all` returns, with
+    ``skipped`` set for a page that was already up to date.
+    """
+    out_dir = Path(out_dir).resolve()
+    results, guides, parts = [], [], []
+    for path in map(Path, paths):
+        t0 = time.perf_counter()
+        try:
+            g = run_guide(path)
+            doc = document(g, path.stem)
+            file = Path(g["doc"].filename).with_suffix(html.SUFFIX).name
+            page = html.render(doc, head=_head(), header=_header(title)).encode("utf-8")
+            part, _ = search.cached_shard(doc, hashlib.sha256(page).hexdigest())
+            written = _publish(out_dir / file, page, scratch)
+        except Exception as exc:
+            results.append({"guide": path.stem, "error": repr(exc)})
+            continue
+        guides.append((file, doc))
+        parts.append((file, doc.title, part))
+        results.append({"guide": path.stem, "output": str(out_dir / file), "skipped": not written,
+                        "seconds": time.perf_counter() - t0, "rss_kb": _peak_rss_kb(),
+                        "pages": "-"})
+    _publish(out_dir / "index.html", index_page(title, guides).encode("utf-8"), scratch)
+    _publish(out_dir / "site.css", (html.CSS + SITE_CSS).encode("utf-8"), scratch)
+    _publish(out_dir / "search.js", SEARCH_JS.encode("utf-8"), scratch)
+    _publish(out_dir / INDEX_FILE, search.compress(search.merge(parts)), scratch)
+    return results
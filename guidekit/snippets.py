@@ -0,0 +1,252 @@
+"""Snippet library: the guides' published code as importable Python modules.
+
+    python -m guidekit --snippets            # writes build/snippets/<guide>.py
+
+The algorithms exist only as the lines handed to ``code_block([...])``. This
+stage reads every Python code block of a guide (through the document model),
+turns the guides' ``##`` comment marker back into ``#`` and writes the
+definitions -- functions, classes and imports -- into one module per guide,
+in the order the guide publishes them. Example calls and other top-level
+statements around them are left out, so importing a module runs nothing.
+The complexity a snippet is labelled with -- a ``Time: O(n)`` docstring
+line, a ``## ─── Sliding Window: O(n) ───`` banner above the function or a
+``## Total: O(n)`` comment in it -- is kept as well.
+
+Each snippet must parse on its own. One that does not (a Java aside, a
+deliberately unfinished fragment) is left out and reported, not fatal. The
+finished module must compile and import, or the stage fails for that guide.
+
+The snippets are written for LeetCode's environment, which imports the usual
+modules (``collections``, ``heapq``, ``typing``, ...) for you; every module
+starts with the same imports. ``SOURCES`` maps each definition to the section
+and heading it was published under, ``COMPLEXITY`` each labelled function to
+its label::
+
+    from guidekit.snippets import load
+    sw = load("sliding-window")
+    sw.sliding_max([1, 3, -1, -3, 5, 3, 6, 7], 3)     # [3, 3, 5, 5, 6, 7]
+    sw.SOURCES["sliding_max"]                         # ('Advanced: Sliding Window Maximum', 'The Monotonic Deque (Decreasing)')
+    sw.COMPLEXITY["sliding_max"]                      # 'O(n)'
+"""
+import ast
+import importlib.util
+import io
+import re
+import sys
+import time
+import tokenize
+from collections import namedtuple
+from pathlib import Path
+
+from guidekit.driver import OUT_DIR, _peak_rss_kb, run_guide, select_guides
+from guidekit.model import Code, Heading, document, plain
+from guidekit.output import atomic_output
+
+SNIPPET_DIR = OUT_DIR / "snippets"
+PACKAGE = "snippets"        # import name of the generated package
+
+PRELUDE = """\
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+from collections import Counter, OrderedDict, defaultdict, deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+"""
+
+_FUNCTIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_DEFINITIONS = _FUNCTIONS + (ast.Import, ast.ImportFrom)
+_BIG_O = r"O\([^()]*(?:\([^()]*\)[^()]*)*\)"
+_TIME = re.compile(rf"Time:\s*({_BIG_O})")
+_TOTAL = re.compile(rf"Total:\s*({_BIG_O})")
+_BANNER = re.compile(rf"({_BIG_O})(?!\s*(?:extra\s+)?space)")       # time, not space
+
+Snippet = namedtuple("Snippet", "section heading lines")
+
+
+class SnippetError(Exception):
+    """A guide's snippet module does not compile or import."""
+
+
+def module_name(guide):
+    """The module name for guide `guide` (``sliding-window`` -> ``sliding_window``)."""
+    return guide.replace("-", "_")
+
+
+def to_python(lines):
+    """The source of code-block `lines`, with ``##`` comments turned into ``#`` comments."""
+    lines = list(lines)
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO("\n".join(lines) + "\n").readline))
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        tokens = []                 # not Python: the parse will say so
+    for tok in tokens:
+        if tok.type == tokenize.COMMENT and tok.string.startswith("##"):
+            row, col = tok.start
+            ln = lines[row - 1]
+            lines[row - 1] = ln[:col] + ln[col + 1:]
+    return "\n".join(lines) + "\n"
+
+
+def extract(doc):
+    """The `Snippet` of every Python code block in model document `doc`, in order."""
+    out = []
+    for sec in doc.sections:
+        heading = None
+        for b in sec.blocks:
+            if type(b) is Heading:
+                heading = plain(b.text)
+            elif type(b) is Code and b.lang == "python":
+                out.append(Snippet(sec.title, heading, b.lines))
+    return out
+
+
+def _comments(source):
+    """``[(row, col, text)]`` for every comment in `source` (which parses)."""
+    return [(t.start[0], t.start[1], t.string)
+            for t in tokenize.generate_tokens(io.StringIO(source).readline)
+            if t.type == tokenize.COMMENT]
+
+
+def _label(node, start, after, comments):
+    """The complexity function `node` is labelled with, or None.
+
+    In order: a ``Time:`` line in its docstring, the last top-level comment
+    naming one between line `after` and its first line `start`, a ``Total:``
+    comment in its body.
+    """
+    m = _TIME.search(ast.get_docstring(node) or "")
+    if m:
+        return m.group(1)
+    for row, col, text in reversed(comments):
+        if after < row < start and col == 0 and (m := _BANNER.search(text)):
+            return m.group(1)
+    for row, _, text in comments:
+        if start <= row <= node.end_lineno and (m := _TOTAL.search(text)):
+            return m.group(1)
+    return None
+
+
+def definitions(source):
+    """The top-level definitions in `source`; raises SyntaxError.
+
+    Returns ``[(name or None, text, label)]``: `label` is the complexity a
+    function or class is labelled with (see `_label`), None for imports.
+    """
+    tree = ast.parse(source)
+    lines, comments = source.splitlines(), _comments(source)
+    out, after = [], 0
+    for node in tree.body:
+        if not isinstance(node, _DEFINITIONS):
+            continue
+        start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", ())])
+        name, label = getattr(node, "name", None), None
+        if isinstance(node, _FUNCTIONS):
+            label = _label(node, start, after, comments)
+            after = node.end_lineno
+        out.append((name, "\n".join(lines[start - 1:node.end_lineno]), label))
+    return out
+
+
+def module_source(guide, snippets):
+    """The module for `guide`'s `snippets`; returns ``(source, names, skipped)``.
+
+    `skipped` lists ``(snippet, reason)`` for the snippets that do not parse.
+    """
+    parts, sources, labels, skipped = [], {}, {}, []
+    for n, snip in enumerate(snippets, 1):
+        try:
+            defs = definitions(to_python(snip.lines))
+        except SyntaxError as exc:
+            skipped.append((snip, f"line {exc.lineno}: {exc.msg}"))
+            continue
+        if not defs:
+            continue
+        where = " › ".join(filter(None, (snip.section, snip.heading)))
+        parts.append(f"# ── {n}. {where}\n" + "\n\n".join(text for _, text, _ in defs))
+        for name, _, label in defs:
+            if name is not None:
+                sources[name] = (snip.section, snip.heading)
+                labels.pop(name, None)          # a later definition replaces an earlier one
+                if label:
+                    labels[name] = label
+    names = sorted(sources)
+    head = (f'"""The code published in {guide}.py, one definition per snippet.\n\n'
+            'Generated by guidekit.snippets; do not edit.\n"""\n')
+    body = "\n\n\n".join(parts)
+    tail = (f"__all__ = {names!r}\n\n"
+            "SOURCES = {\n" + "".join(f"    {k!r}: {sources[k]!r},\n" for k in names) + "}\n\n"
+            "COMPLEXITY = {\n" + "".join(f"    {k!r}: {labels[k]!r},\n" for k in sorted(labels)) + "}\n")
+    return f"{head}{PRELUDE}\n\n{body}\n\n\n{tail}", names, skipped
+
+
+def check(source, filename):
+    """Compile and run module `source` in a fresh namespace; raises SnippetError."""
+    try:
+        code = compile(source, str(filename), "exec")
+        exec(code, {"__name__": f"{PACKAGE}._check", "__file__": str(filename)})
+    except Exception as exc:
+        raise SnippetError(f"{filename}: {exc!r}") from exc
+
+
+def _write(path, text, scratch=None):
+    """Write `text` to `path` unless it already holds exactly that; True if written."""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    with atomic_output(path, scratch) as tmp:
+        tmp.write_bytes(data)
+    return True
+
+
+def build_snippets(paths, out_dir=SNIPPET_DIR, scratch=None):
+    """Write the snippet module of every guide in `paths` into `out_dir` (a package).
+
+    Returns one result per guide, shaped like `guidekit.driver.build_all`'s,
+    with ``skipped`` set for a module that was already up to date and a
+    ``note`` counting the definitions and any snippet left out.
+    """
+    out_dir = Path(out_dir).resolve()
+    results = []
+    for path in map(Path, paths):
+        t0 = time.perf_counter()
+        output = out_dir / f"{module_name(path.stem)}.py"
+        try:
+            snippets = extract(document(run_guide(path), path.stem))
+            source, names, skipped = module_source(path.stem, snippets)
+            check(source, output)
+            written = _write(output, source, scratch)
+        except Exception as exc:
+            results.append({"guide": path.stem, "error": repr(exc)})
+            continue
+        note = f"{len(names)} definitions"
+        if skipped:
+            note += "; left out: " + ", ".join(
+                f"{s.heading or s.section} ({reason})" for s, reason in skipped)
+        results.append({"guide": path.stem, "output": str(output), "skipped": not written,
+                        "seconds": time.perf_counter() - t0, "rss_kb": _peak_rss_kb(),
+                        "pages": "-", "note": note})
+    modules = sorted(p.stem for p in out_dir.glob("*.py") if p.stem != "__init__")
+    init = ('"""The guides\' published code (see guidekit.snippets)."""\n'
+            f"__all__ = {modules!r}\n")
+    _write(out_dir / "__init__.py", init, scratch)
+    return results
+
+
+def load(guide, out_dir=SNIPPET_DIR):
+    """Build and import `guide`'s snippet module (``"prefixsum"`` or a script path)."""
+    path = Path(guide) if str(guide).endswith(".py") else select_guides([guide])[0]
+    result, = build_snippets([path], out_dir)
+    if "error" in result:
+        raise SnippetError(result["error"])
+    name = f"{PACKAGE}.{module_name(path.stem)}"
+    spec = importlib.util.spec_from_file_location(name, result["output"])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
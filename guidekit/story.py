@@ -0,0 +1,135 @@
+"""Lazy guide stories.
+
+A guide is a list of section generator functions instead of one module-level
+``story`` list. Each section yields its flowables when iterated, so importing a
+guide costs nothing beyond defining functions -- `toc(SECTIONS)` lists its
+sections without creating a single flowable -- and a build only holds the
+flowables it has not laid out yet::
+
+    @section(1, "The Core Philosophy")
+    def core_philosophy():
+        yield P("...", sBody)
+        yield from code_block([...])
+
+    SECTIONS = [cover, contents, core_philosophy, ...]
+    doc.build(LazyStory(SECTIONS), onFirstPage=add_page_bg, onLaterPages=add_page_bg)
+"""
+import functools
+
+from reportlab.platypus import PageBreak
+
+from guidekit.blocks import section_divider
+from guidekit.flowables import Bookmark
+from guidekit.model import Anchors, plain
+from guidekit.toc import ROADMAP, Target, walk
+
+
+def section(num, title):
+    """Declare a section generator; it opens with ``section_divider(num, title)``.
+
+    `num` is None for pages without a divider (the cover).
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def flowables():
+            if num is not None:
+                yield from section_divider(num, title)
+            yield from fn()
+        flowables.num, flowables.title = num, title
+        return flowables
+    return decorate
+
+
+def iter_story(sections):
+    """Yield every section's flowables in order, with a page break between sections.
+
+    Each numbered section's start and each of its H2 headings is followed by
+    a `guidekit.toc.Target`, the destination the table of contents links to,
+    and the number cell of each problem-roadmap row gets a `Bookmark`. All of
+    them are outline entries too: sections at the top level, H2 headings
+    under their section, problems under their heading. The destinations are
+    named by the document's anchors (``lc-239``), so a link such as
+    ``Sliding_Window_Zero_To_Hero.pdf#lc-239`` opens at the row.
+    """
+    anchors = Anchors()
+    for i, sec in enumerate(sections):
+        if i:
+            yield PageBreak()
+        under = 1                   # outline level of roadmap rows
+        for f, key, level in walk(sec, anchors):
+            if sec.num is None:
+                if f is not None:
+                    yield f
+            elif level == 0:
+                label = f"{sec.num:02d} · {sec.title}" if sec.num else sec.title
+                yield Target(key, label, 0)
+            elif level == 2:
+                yield f
+                yield Target(key, plain(f.text), 1, heading=f)
+                under = 2
+            elif level == ROADMAP:
+                for r, anchor, label in key:
+                    cell = f._cellvalues[r][0]
+                    cell = list(cell) if isinstance(cell, (list, tuple)) else [cell]
+                    f._cellvalues[r][0] = [Bookmark(anchor, label, under), *cell]
+                yield f
+            else:
+                yield f
+
+
+def iter_flowables(story):
+    """Iterate a story given either as flowables or as a list of section generators."""
+    if isinstance(story, (list, tuple)) and story and callable(story[0]):
+        return iter_story(story)
+    return iter(story)
+
+
+def build_story(sections):
+    """The whole story as a list, for callers that need to see all of it at once."""
+    return list(iter_story(sections))
+
+
+def toc(sections):
+    """``(num, title)`` of every section that has a divider, without building any."""
+    return [(s.num, s.title) for s in sections if s.num is not None]
+
+
+class LazyStory(list):
+    """A story list that pulls flowables from a generator as ``doc.build`` consumes it.
+
+    ``BaseDocTemplate.build`` only ever looks at the front of its flowable list:
+    it reads ``flowables[0]``, deletes it, and pushes split remainders back in
+    front. This list keeps just that front buffered. `len()` is the number of
+    buffered flowables, which is non-zero exactly while anything is left.
+    """
+
+    def __init__(self, sections_or_flowables):
+        list.__init__(self)
+        self._source = iter_flowables(sections_or_flowables)
+
+    def _pull(self, upto=1):
+        """Buffer at least `upto` flowables, plus any keep-with-next run at the end."""
+        src = self._source
+        while src is not None:
+            n = list.__len__(self)
+            if n >= upto and not (n and list.__getitem__(self, n - 1).getKeepWithNext()):
+                return
+            try:
+                self.append(next(src))
+            except StopIteration:
+                self._source = None
+                return
+
+    def __len__(self):
+        self._pull()
+        return list.__len__(self)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, int) and index >= 0:
+            self._pull(index + 1)
+        elif not isinstance(index, int):
+            self._pull(list.__len__(self))
+        return list.__getitem__(self, index)
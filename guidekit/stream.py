@@ -0,0 +1,143 @@
+"""Streaming PDF output: write each page to the file as soon as it is closed.
+
+ReportLab's `PDFDocument` keeps every page -- its content stream included --
+until `save()`, then formats the whole file in one go. `StreamingDocument`
+formats a page and its content stream the moment the canvas closes the page,
+writes them to the output and drops them, keeping only each object's file
+offset for the xref table. Objects that can still change while later pages are
+drawn (the page tree, fonts, catalog, outlines) are written at the end as
+usual, so the finished file has the same objects, just in a different order.
+A page that uses a form not defined yet (see `guidekit.toc`) cannot be
+formatted when it closes; it stays in memory and is written at the end too.
+
+Use it through a canvas maker::
+
+    doc.build(story, canvasmaker=streaming())
+    doc.build(story, canvasmaker=streaming(rec.canvasmaker))   # wrap another maker
+
+Encrypted and digitally signed documents are not supported: both need every
+object to pass through ReportLab's own formatting loop.
+"""
+from reportlab import rl_config
+from reportlab.pdfbase.pdfdoc import (
+    NoEncryption, PDFCrossReferenceTable, PDFDocument, PDFIndirectObject, PDFTrailer,
+    __InternalName__, pdfdocEnc,
+)
+from reportlab.pdfgen.canvas import Canvas
+
+
+class _Flushed:
+    """Stands in the document's object table for an object already on disk."""
+    __slots__ = ()
+
+_FLUSHED = _Flushed()
+
+
+class _Sink:
+    """Write-through replacement for `PDFFile` that tracks the file offset."""
+
+    def __init__(self, f, pdf_version):
+        self.f = f
+        self.offset = 0
+        self.add(pdfdocEnc("%%PDF-%s.%s" % pdf_version)
+                 + b"\n%\223\214\213\236 ReportLab Generated PDF document (opensource)\n")
+
+    def add(self, s):
+        s = pdfdocEnc(s)
+        at = self.offset
+        self.f.write(s)
+        self.offset = at + len(s)
+        return at
+
+
+class StreamingDocument(PDFDocument):
+    """A `PDFDocument` that writes finished pages out during the build."""
+
+    @classmethod
+    def adopt(cls, doc, filename):
+        """Turn a canvas's freshly made `PDFDocument` into a streaming one writing to `filename`.
+
+        The canvas constructs its document itself, so the instance is converted
+        in place rather than replaced.
+        """
+        if not isinstance(doc.encrypt, NoEncryption):
+            raise ValueError("streaming output does not support encryption")
+        doc.__class__ = cls
+        if hasattr(getattr(filename, "write", None), "__call__"):
+            doc._out, doc._own = filename, False
+        else:
+            doc._out, doc._own = open(filename, "wb"), True
+        doc._sink = _Sink(doc._out, doc._pdfVersion)
+        return doc
+
+    # ── streaming ──────────────────────────────────────────────────────────────
+    def _write(self, oid):
+        obj = self.idToObject[oid]
+        out = PDFIndirectObject(oid, obj).format(self)
+        if not rl_config.invariant and rl_config.pdfComments:
+            self._sink.add("%% %s: class %s \n" % (ascii(oid), obj.__class__.__name__[:50]))
+        self.idToOffset[oid] = self._sink.add(out)
+        self.idToObject[oid] = _FLUSHED
+
+    def addPage(self, page):
+        mark = self.objectcounter
+        PDFDocument.addPage(self, page)
+        name = page.__InternalName__
+        try:
+            self._write(name)
+        except KeyError:        # a forward reference: format the page at the end
+            written = False
+        else:
+            written = True
+        # Formatting the page registered its content stream (and, the first
+        # time, the page tree); the stream is final, the page tree is not.
+        for n in range(mark + 1, self.objectcounter + 1):
+            oid = self.numberToId[n]
+            if oid != name and self.idToObject[oid] is not self.Pages:
+                self._write(oid)
+        if written:
+            # The page tree only needs the page's name to reference it.
+            page.__dict__ = {__InternalName__: name}
+
+    # ── finishing ──────────────────────────────────────────────────────────────
+    def format(self):
+        """Write the objects still in memory, then the xref table and trailer."""
+        cat, info = self.Catalog, self.info
+        self.Reference(cat)
+        self.Reference(info)
+        if getattr(self, "_digiSigs", None):
+            raise ValueError("streaming output does not support digital signatures")
+        ids, n = [], 0
+        # Formatting may register new objects, so walk the numbers until they run out.
+        while n + 1 in self.numberToId:
+            n += 1
+            oid = self.numberToId[n]
+            if self.idToObject[oid] is not _FLUSHED:
+                self._write(oid)
+            ids.append(oid)
+        xref = PDFCrossReferenceTable()
+        xref.addsection(0, ids)
+        at = self._sink.add(xref.format(self))
+        trailer = PDFTrailer(startxref=at, Size=n + 1, Root=self.Reference(cat),
+                             Info=self.Reference(info), ID=self.ID())
+        self._sink.add(trailer.format(self))
+        return b""
+
+    def SaveToFile(self, filename, canvas):
+        if getattr(self, "_savedToFile", False):
+            raise RuntimeError("class %s instances can only be saved once" % self.__class__.__name__)
+        self._savedToFile = True
+        try:
+            self.GetPDFData(canvas)
+        finally:
+            if self._own:
+                self._out.close()
+
+
+def streaming(canvasmaker=Canvas):
+    """Wrap `canvasmaker` so the canvases it makes stream their pages to disk."""
+    def make(filename, *args, **kw):
+        canvas = canvasmaker(filename, *args, **kw)
+        StreamingDocument.adopt(canvas._doc, filename)
+        return canvas
+    return make
@@ -0,0 +1,89 @@
+"""Interned paragraph styles.
+
+The guides build a style for nearly every table cell and visualiser label, e.g.
+``S("_", fontName="Courier", fontSize=9, textColor=c)``; almost all of those are
+repeats. `S` returns one shared, frozen style per distinct parameter set, so a
+roadmap table reuses a handful of style objects instead of allocating hundreds.
+"""
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.styles import ParagraphStyle
+
+from guidekit.fingerprint import Memo
+from guidekit.palette import (
+    C_ACCENT, C_ACCENT2, C_BG, C_BODY, C_CODE_BG, C_CODE_FG, C_GREEN, C_HEADING,
+    C_MUTED, C_YELLOW,
+)
+
+_registry = Memo()
+
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """A ParagraphStyle that refuses mutation once constructed.
+
+    Interned styles are shared between unrelated cells, so changing one in place
+    would silently restyle the others. Copies (ReportLab deep-copies a style
+    before adjusting it when splitting paragraphs) are ordinary, mutable styles.
+    """
+
+    def __init__(self, name, parent=None, **kw):
+        ParagraphStyle.__init__(self, name, parent, **kw)
+        self.__dict__["_frozen"] = True
+
+    def __setattr__(self, key, value):
+        if self.__dict__.get("_frozen"):
+            raise TypeError(f"interned style {self.name!r} is read-only; build a new one with S()")
+        ParagraphStyle.__setattr__(self, key, value)
+
+    def __delattr__(self, key):
+        raise TypeError(f"interned style {self.name!r} is read-only")
+
+    def __copy__(self):
+        clone = ParagraphStyle(self.name)
+        clone.__dict__.update((k, v) for k, v in self.__dict__.items() if k != "_frozen")
+        return clone
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+
+def _freeze(value):
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return ("~", repr(value))
+
+
+def S(name, parent=None, **kw):
+    """Return the canonical style for `name`, `parent` and `kw`, creating it once."""
+    key = (name, id(parent) if parent is not None else None,
+           tuple(sorted((k, _freeze(v)) for k, v in kw.items())))
+    style = _registry.get(key)
+    if style is None:
+        style = _registry[key] = FrozenParagraphStyle(name, parent, **kw)
+    return style
+
+
+def registry_size():
+    """Number of distinct styles interned so far."""
+    return len(_registry)
+
+
+# ── Named styles ───────────────────────────────────────────────────────────────
+sTitle   = S("sTitle",   fontName="Helvetica-Bold",    fontSize=32, leading=40, textColor=C_HEADING, alignment=TA_CENTER, spaceAfter=6)
+sSubtitle= S("sSubtitle",fontName="Helvetica",         fontSize=13, leading=18, textColor=C_ACCENT,  alignment=TA_CENTER, spaceAfter=4)
+sAuthor  = S("sAuthor",  fontName="Helvetica-Oblique", fontSize=10, textColor=C_MUTED, alignment=TA_CENTER, spaceAfter=20)
+sH1      = S("sH1",      fontName="Helvetica-Bold",    fontSize=20, leading=26, textColor=C_ACCENT,  spaceBefore=18, spaceAfter=8)
+sH2      = S("sH2",      fontName="Helvetica-Bold",    fontSize=14, leading=19, textColor=C_ACCENT2, spaceBefore=12, spaceAfter=5)
+sH3      = S("sH3",      fontName="Helvetica-Bold",    fontSize=11, leading=15, textColor=C_GREEN,   spaceBefore=8,  spaceAfter=4)
+sBody    = S("sBody",    fontName="Helvetica",         fontSize=10, leading=15, textColor=C_BODY,    spaceAfter=6, alignment=TA_JUSTIFY)
+sBullet  = S("sBullet",  fontName="Helvetica",         fontSize=10, leading=14, textColor=C_BODY,    spaceAfter=3, leftIndent=16, bulletIndent=4)
+sCode    = S("sCode",    fontName="Courier",           fontSize=8.5,leading=13, textColor=C_CODE_FG, spaceAfter=2, leftIndent=12, backColor=C_CODE_BG)
+sCodeCmt = S("sCodeCmt", fontName="Courier-Oblique",   fontSize=8.5,leading=13, textColor=C_MUTED,   spaceAfter=2, leftIndent=12, backColor=C_CODE_BG)
+sLabel   = S("sLabel",   fontName="Helvetica-Bold",    fontSize=9,  textColor=C_YELLOW, spaceAfter=2)
+sNote    = S("sNote",    fontName="Helvetica-Oblique", fontSize=9,  leading=13, textColor=C_YELLOW, spaceAfter=4)
+sFormula = S("sFormula", fontName="Courier-Bold",      fontSize=10, leading=14, textColor=C_GREEN,   alignment=TA_CENTER, spaceBefore=4, spaceAfter=4)
+sCaption = S("sCaption", fontName="Helvetica-Oblique", fontSize=8.5,textColor=C_MUTED, alignment=TA_CENTER, spaceAfter=6)
+sTOC     = S("sTOC",     fontName="Helvetica",         fontSize=10, leading=16, textColor=C_BODY)
+sTOCSub  = S("sTOCSub",  fontName="Helvetica",         fontSize=9,  leading=14, textColor=C_MUTED,   leftIndent=18)
+sTag     = S("sTag",     fontName="Helvetica-Bold",    fontSize=8,  textColor=C_BG, spaceAfter=2)
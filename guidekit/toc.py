@@ -0,0 +1,232 @@
+"""Automatic table of contents with page numbers.
+
+A guide's contents page lists what the guide actually contains -- every
+section with a divider and every H2 heading in it -- instead of a hand-kept
+copy::
+
+    @section(0, "Table of Contents")
+    def contents():
+        yield from table_of_contents(SECTIONS)
+
+Each entry links to its target and shows its page number. The numbers are
+not known when the contents page is laid out, near the front, and rather than
+laying the guide out a second time each contents page draws one form XObject
+holding all of its numbers. The entries note where their numbers go, the
+targets note the pages they land on, and the form is defined as soon as the
+last target it needs is drawn. A PDF may reference a form defined further on
+in the file, so one layout pass resolves every number. `guidekit.story.iter_story`
+places the targets; a section replayed from the layout cache repeats the
+entries' and targets' actions, so the numbers are right wherever it lands.
+
+Laying out the contents page does not build the sections it lists: the
+headings are read from the section functions' source (see `headings`).
+"""
+import ast
+import inspect
+import textwrap
+
+from reportlab.lib.colors import toColor
+from reportlab.platypus import Paragraph, Spacer, Table
+
+from guidekit.flowables import Bookmark, LazyParagraph, bookmark
+from guidekit.model import HEADINGS, Anchors, cell_text, problem_numbers, roadmap
+from guidekit.sections import replayable
+from guidekit.styles import sTOC, sTOCSub
+
+NUMBER_W = 30               # room kept at the right of an entry for its page number
+NUMBER_FONT = ("Helvetica", 9)
+ROADMAP = "roadmap"         # `walk` level of a problem-roadmap table
+
+
+def _form(key):
+    return f"toc-{key}"
+
+
+def headings(sec):
+    """``(text, level)`` of every heading section generator `sec` yields, in order.
+
+    They are read from the function's source, where a heading is a yielded
+    call with a literal text and a heading style: ``yield P("...", sH2)``.
+    Returns None when a heading-styled call does not have a literal text;
+    the section has to be built to find its headings then.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(inspect.unwrap(sec))))
+    except (OSError, TypeError, SyntaxError):
+        return None
+    found = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Yield) and isinstance(node.value, ast.Call)):
+            continue
+        args = node.value.args
+        if len(args) < 2 or not (isinstance(args[1], ast.Name) and args[1].id in HEADINGS):
+            continue
+        text, style = args[0], args[1]
+        if not (isinstance(text, ast.Constant) and isinstance(text.value, str)):
+            return None
+        found.append(((node.lineno, node.col_offset), text.value, HEADINGS[style.id]))
+    return [(text, level) for _, text, level in sorted(found)]
+
+
+def walk(sec, anchors):
+    """Yield ``(flowable, anchor, level)`` for section generator `sec`.
+
+    The first item is the section start, ``(None, anchor, 0)``; then every
+    flowable: headings with their anchor and level (1-3), a problem roadmap
+    with level `ROADMAP` and ``[(row, anchor, label)]`` for its problem rows
+    in place of the anchor, anything else with ``None, None``. The anchors
+    come from `anchors` (a `guidekit.model.Anchors` shared by the whole
+    document), so they are the ones the other formats use.
+    """
+    sid = anchors.section(sec.num, sec.title)
+    yield None, sid, 0
+    for f in sec():
+        if isinstance(f, Paragraph) and f.style.name in HEADINGS:
+            yield f, anchors.heading(f.text, sid), HEADINGS[f.style.name]
+        elif isinstance(f, Table) and (grid := roadmap(f)) is not None:
+            rows = [(r, anchors.problem(n), f"LC {n} · {cell_text(row[1]) if len(row) > 1 else ''}")
+                    for r, (row, n) in enumerate(zip(grid.rows, problem_numbers(grid))) if n]
+            yield f, rows, ROADMAP
+        else:
+            yield f, None, None
+
+
+# ── Actions ────────────────────────────────────────────────────────────────────
+def _numbers(canvas):
+    """The canvas's page-number bookkeeping: target pages and each form's unfilled slots."""
+    state = canvas.__dict__.get("_toc")
+    if state is None:
+        state = canvas._toc = {"pages": {}, "forms": {}}
+    return state
+
+
+@replayable
+def number_slot(canvas, form, key, x, y, color):
+    """Note that form `form` shows `key`'s page number right-aligned at page point (`x`, `y`)."""
+    _numbers(canvas)["forms"].setdefault(form, []).append((key, x, y, color))
+
+
+@replayable
+def page_number(canvas, key):
+    """Note the current page as `key`'s, and define every form this completes."""
+    state = _numbers(canvas)
+    pages, forms = state["pages"], state["forms"]
+    pages[key] = canvas.getPageNumber()
+    font, size = NUMBER_FONT
+    for form, slots in list(forms.items()):
+        if any(k not in pages for k, *_ in slots):
+            continue
+        del forms[form]
+        canvas.beginForm(form)
+        canvas.setFont(font, size)
+        for k, x, y, color in slots:
+            canvas.setFillColor(toColor(color))
+            canvas.drawRightString(x, y, str(pages[k]))
+        canvas.endForm()
+
+
+@replayable
+def link(canvas, key, x0, y0, x1, y1):
+    """A borderless link from the page rectangle (`x0`, `y0`, `x1`, `y1`) to destination `key`."""
+    canvas.linkAbsolute("", key, (x0, y0, x1, y1), thickness=0)
+
+
+# ── Flowables ──────────────────────────────────────────────────────────────────
+class Target(Bookmark):
+    """A contents entry's target: its named destination and its page number.
+
+    Placed after a `heading`, it puts the destination at the heading's top.
+    """
+    def __init__(self, key, title=None, level=0, heading=None):
+        Bookmark.__init__(self, key, title, level)
+        self.heading = heading
+
+    def draw(self):
+        h = self.heading
+        up = h.height + h.getSpaceAfter() if h is not None else 0
+        bookmark(self.canv, self.key, *self.canv.absolutePosition(0, up), self.title, self.level)
+        page_number(self.canv, self.key)
+
+
+class TocEntry(LazyParagraph):
+    """One contents line: the text, linked to `key`, and the target's page number at the right.
+
+    To everything but the layout it is a plain paragraph in `style`.
+    """
+    def __init__(self, key, text, style):
+        LazyParagraph.__init__(self, text, style)
+        self.key = key
+
+    def wrap(self, availWidth, availHeight):
+        w, h = LazyParagraph.wrap(self, availWidth - NUMBER_W, availHeight)
+        return w + NUMBER_W, h
+
+    def split(self, availWidth, availHeight):
+        return []                           # a line or two: moves to the next page whole
+
+    def draw(self):
+        LazyParagraph.draw(self)
+        c, style = self.canv, self.style
+        state = _numbers(c)
+        if state.get("page") != c.getPageNumber():
+            # The page's first entry draws its numbers form, in page coordinates.
+            state["page"], state["form"] = c.getPageNumber(), _form(self.key)
+            a, b, cc, d, e, f = c._currentMatrix
+            det = a * d - b * cc
+            c.saveState()
+            c.transform(d / det, -b / det, -cc / det, a / det,
+                        (cc * f - d * e) / det, (b * e - a * f) / det)
+            c.doForm(state["form"])
+            c.restoreState()
+        baseline = self.height - style.fontSize - (len(self.blPara.lines) - 1) * style.leading
+        x, y = c.absolutePosition(self.width + NUMBER_W, baseline)
+        number_slot(c, state["form"], self.key, x, y, style.textColor.hexval())
+        x0, y0 = c.absolutePosition(0, 0)
+        x1, y1 = c.absolutePosition(self.width + NUMBER_W, self.height)
+        link(c, self.key, x0, y0, x1, y1)
+
+
+def front_matter(sections):
+    """The sections before the first numbered one: the cover and the contents page."""
+    out = []
+    for sec in sections:
+        if sec.num:
+            break
+        out.append(sec)
+    return out
+
+
+def table_of_contents(sections):
+    """The contents entries for a guide's `sections` (its ``SECTIONS`` list).
+
+    Every section with a divider is listed, those numbered 0 without a
+    number, apart from the front matter (see `front_matter`). The sections
+    are not built unless `headings` cannot read one's headings.
+    """
+    anchors = Anchors()
+    front = front_matter(sections)
+    for sec in sections:
+        if sec in front:
+            anchors.section(sec.num, sec.title)
+            continue
+        label = f"{sec.num:02d} &nbsp; {sec.title}" if sec.num else sec.title
+        for text, key, level in _outline(sec, anchors):
+            if level == 0:
+                yield TocEntry(key, f"<b>{label}</b>", sTOC)
+            elif level == 2:
+                yield TocEntry(key, f"&nbsp;&nbsp;&nbsp;&nbsp;› &nbsp;{text}", sTOCSub)
+        yield Spacer(1, 3)
+
+
+def _outline(sec, anchors):
+    """``(text, anchor, level)`` of `sec`'s start and headings, as `walk` names them."""
+    found = headings(sec)
+    if found is None:
+        for f, key, level in walk(sec, anchors):
+            if level == 0 or level in HEADINGS.values():
+                yield (f.text if f is not None else None), key, level
+        return
+    sid = anchors.section(sec.num, sec.title)
+    yield None, sid, 0
+    for text, level in found:
+        yield text, anchors.heading(text, sid), level
@@ -0,0 +1,340 @@
+"""Snippet verification: ``python -m guidekit.verify [guide ...] [--max-n N] [--seed S]``.
+
+Runs the guides' published code (`guidekit.snippets`) against a brute-force
+twin and measures how it scales:
+
+* correctness -- each checked function is called on random inputs of a few
+  small sizes and must agree with its twin: the brute force the guide
+  publishes next to it (``max_sum_brute`` for ``max_sum_sliding``), one from
+  another guide, or a plain reference written here when the guide has none;
+* growth -- the function is timed on one random input per size from
+  n = 10^2 to ``--max-n`` (10^6 by default), and a least-squares line through
+  log(time) against log(n) gives the growth exponent.
+
+The complexity a function is held to is the one the guide labels it with
+(the module's ``COMPLEXITY``), not one written here. A function labelled
+linear whose exponent exceeds `LINEAR_LIMIT` fails, as does any disagreement
+with its twin, and the command exits non-zero. So does a function labelled
+linear that has no check in `CHECKS`: a bound the guide publishes is either
+measured or reported missing. Other labels are measured and reported only.
+
+``python -m guidekit --snippets`` runs the same checks after writing the
+modules (see `verify_guides`), so the snippet build fails with them.
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from collections import namedtuple
+from itertools import accumulate
+
+from guidekit.driver import _peak_rss_kb, select_guides
+from guidekit.snippets import SNIPPET_DIR, load
+
+LINEAR = ("O(n)", "O(n + Q)")
+LINEAR_LIMIT = 1.3          # n log n over 10^2..10^6 fits about 1.1, n² about 2
+SMALL = (0, 1, 2, 5, 17, 60)
+TRIALS = 20                 # random inputs per small size
+MIN_TIME = 0.02             # seconds each timing sample runs for, at least
+MIN_MAX_N = 10 ** 3         # the smallest max_n that gives two sizes to fit a line through
+
+# `twin`: a name in the same module, "guide.name" in another guide's, or a callable.
+# `gen(rng, n)` returns the arguments for a random input of size n; `agree(args,
+# got, want)` replaces ``got == want`` where several answers are right.
+Check = namedtuple("Check", "guide name twin gen agree", defaults=(None,))
+
+
+# ── Inputs ─────────────────────────────────────────────────────────────────────
+def _ints(rng, n, lo=-100, hi=100):
+    return [rng.randint(lo, hi) for _ in range(n)]
+
+
+def _window(rng, n):
+    """An array and a window size 1 <= k <= len(arr), as the window functions assume."""
+    n = max(n, 1)
+    return _ints(rng, n), rng.randint(1, min(n, 50))
+
+
+def _missing_pair(rng, n):
+    """Even numbers and an odd target: no pair exists, so the search scans everything."""
+    nums = [2 * x for x in _ints(rng, n, -10 * n, 10 * n)]
+    return nums, 2 * rng.randint(-n, n) + 1
+
+
+def _pair(rng, n):
+    # Small inputs often hold a pair, to check the answer; timed ones never do.
+    return (_ints(rng, n, -20, 20), rng.randint(-40, 40)) if n < 100 else _missing_pair(rng, n)
+
+
+def _sorted_pair(rng, n):
+    nums, target = _pair(rng, n)
+    return sorted(nums), target
+
+
+def _sums(rng, n):
+    return _ints(rng, n, -5, 5), rng.randint(-5, 5)
+
+
+def _string(rng, n):
+    return ("".join(rng.choice("abcdefghij") for _ in range(n)),)
+
+
+def _words(rng, n):
+    return (["".join(rng.choice("abc") for _ in range(rng.randint(0, 4))) for _ in range(n)],)
+
+
+def _updates(rng, n):
+    """An array length and as many ``(L, R, val)`` range updates."""
+    n = max(n, 1)
+    ups = []
+    for _ in range(n):
+        lo = rng.randrange(n)
+        ups.append((lo, rng.randrange(lo, n), rng.randint(-9, 9)))
+    return n, ups
+
+
+class _Node:
+    """A bare list node: all the list functions use is ``val`` and ``next``."""
+    __slots__ = ("val", "next")
+
+    def __init__(self, val, next=None):
+        self.val, self.next = val, next
+
+
+def _nth_node(rng, n):
+    """A linked list of n nodes and the index of its last node (the longest walk)."""
+    n = max(n, 1)
+    head = None
+    for v in reversed(_ints(rng, n)):
+        head = _Node(v, head)
+    return head, n - 1
+
+
+# ── References (where the guides publish no brute force) ───────────────────────
+def _next_greater(arr):
+    return [next((y for y in arr[i + 1:] if y > x), -1) for i, x in enumerate(arr)]
+
+
+def _count_subarrays(arr, k):
+    return sum(sum(arr[i:j]) == k for i in range(len(arr)) for j in range(i + 1, len(arr) + 1))
+
+
+def _longest_unique(s):
+    return max((j - i for i in range(len(s)) for j in range(i + 1, len(s) + 1)
+                if len(set(s[i:j])) == j - i), default=0)
+
+
+def _longest_run(nums):
+    best, run, prev = 0, 0, None
+    for x in sorted(set(nums)):
+        run = run + 1 if prev is not None and x == prev + 1 else 1
+        best, prev = max(best, run), x
+    return best
+
+
+def _prefix(arr):
+    return [0, *accumulate(arr)]
+
+
+def _range_updates(n, updates):
+    out = [0] * n
+    for lo, hi, val in updates:
+        for i in range(lo, hi + 1):
+            out[i] += val
+    return out
+
+
+def _anagram_groups(words):
+    groups = {}
+    for w in words:
+        groups.setdefault("".join(sorted(w)), []).append(w)
+    return list(groups.values())
+
+
+def _nth(head, n):
+    for _ in range(n):
+        head = head.next
+    return head
+
+
+def _same_groups(args, got, want):
+    """The same groups, in any order."""
+    return sorted(map(sorted, got)) == sorted(map(sorted, want))
+
+
+def _valid_pair(args, got, want):
+    """Both find no pair, or both find a pair summing to the target."""
+    nums, target = args
+    if not want:
+        return not got
+    return bool(got) and got[0] != got[1] and nums[got[0]] + nums[got[1]] == target
+
+
+CHECKS = (
+    Check("sliding-window", "max_sum_sliding", "max_sum_brute", _window),
+    Check("sliding-window", "sliding_max", "sliding_max_brute", _window),
+    Check("sliding-window", "length_of_longest_substring", _longest_unique, _string),
+    Check("hashing-patterns", "two_sum", "two_sum_brute", _pair, _valid_pair),
+    Check("hashing-patterns", "longest_consecutive", _longest_run, lambda rng, n: (_ints(rng, n, -n, n),)),
+    Check("hashing-patterns", "subarray_sum", _count_subarrays, _sums),
+    Check("hashing-patterns", "group_anagrams_v2", _anagram_groups, _words, _same_groups),
+    Check("linked-list", "get_nth", _nth, _nth_node),
+    Check("twopointers", "two_pointer_pair", "brute_force_pair", _sorted_pair, _valid_pair),
+    Check("stack-queue", "next_greater_element", _next_greater, lambda rng, n: (_ints(rng, n),)),
+    Check("stack-queue", "sliding_window_max", "sliding-window.sliding_max_brute", _window),
+    Check("prefixsum", "count_subarrays_with_sum_k", _count_subarrays, _sums),
+    Check("prefixsum", "build_prefix", _prefix, lambda rng, n: (_ints(rng, n),)),
+    Check("prefixsum", "range_updates", _range_updates, _updates),
+)
+
+
+# ── Measurement ────────────────────────────────────────────────────────────────
+def _resolve(twin, module, modules):
+    if callable(twin):
+        return twin
+    guide, _, name = twin.rpartition(".")
+    return getattr(modules[guide] if guide else module, name)
+
+
+def disagreement(fn, twin, gen, agree=None, seed=0):
+    """The first small input on which `fn` and `twin` disagree, as ``(args, got, want)``, or None."""
+    rng = random.Random(seed)
+    for n in SMALL:
+        for _ in range(TRIALS):
+            args = gen(rng, n)
+            got, want = fn(*args), twin(*args)
+            if not (agree(args, got, want) if agree else got == want):
+                return args, got, want
+    return None
+
+
+def _time(fn, args):
+    """Seconds per call of ``fn(*args)``: the best of three samples of at least `MIN_TIME`."""
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        elapsed = time.perf_counter() - t0
+        if elapsed >= MIN_TIME:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(100, math.ceil(1.2 * MIN_TIME / elapsed)))
+    best = elapsed / number
+    for _ in range(2):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+
+def sizes(max_n):
+    """n = 10^2, 10^3, ... up to `max_n`, which must be at least `MIN_MAX_N`."""
+    if max_n < MIN_MAX_N:
+        raise ValueError(f"max_n must be at least {MIN_MAX_N} to fit a growth exponent, not {max_n}")
+    out, n = [], 100
+    while n <= max_n:
+        out.append(n)
+        n *= 10
+    return out
+
+
+def growth(fn, gen, ns, seed=0):
+    """The fitted exponent k of time ~ n^k for `fn` over the input sizes `ns`, and the timings."""
+    rng = random.Random(seed)
+    times = [_time(fn, gen(rng, n)) for n in ns]
+    xs, ys = [math.log(n) for n in ns], [math.log(t) for t in times]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = (sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+             / sum((x - mx) ** 2 for x in xs))
+    return slope, times
+
+
+def verify(guides, max_n=10 ** 6, seed=0, out_dir=SNIPPET_DIR, checks=CHECKS):
+    """Run the `checks` on `guides` (names); returns one result dict per check.
+
+    A function of `guides` labelled linear that no check covers gets a
+    result too. ``"error"`` is set on every failure.
+    """
+    ns = sizes(max_n)
+    modules, results = {}, []
+
+    def module(guide):
+        if guide not in modules:
+            modules[guide] = load(select_guides([guide])[0], out_dir)
+        return modules[guide]
+
+    covered = set()
+    for check in checks:
+        if check.guide not in guides:
+            continue
+        covered.add((check.guide, check.name))
+        mod = module(check.guide)
+        if isinstance(check.twin, str) and "." in check.twin:
+            module(check.twin.rpartition(".")[0])
+        fn, twin = getattr(mod, check.name), _resolve(check.twin, mod, modules)
+        label = getattr(mod, "COMPLEXITY", {}).get(check.name)
+        r = {"guide": check.guide, "name": check.name, "label": label}
+        bad = disagreement(fn, twin, check.gen, check.agree, seed)
+        if bad is not None:
+            args, got, want = bad
+            r["error"] = f"disagrees with its twin on {args!r}: {got!r} != {want!r}"
+            results.append(r)
+            continue
+        r["exponent"], r["times"] = growth(fn, check.gen, ns, seed)
+        if label in LINEAR and r["exponent"] > LINEAR_LIMIT:
+            r["error"] = f"labelled {label} but grows as n^{r['exponent']:.2f}"
+        results.append(r)
+    for guide in guides:
+        for name, label in sorted(getattr(module(guide), "COMPLEXITY", {}).items()):
+            if label in LINEAR and (guide, name) not in covered:
+                results.append({"guide": guide, "name": name, "label": label,
+                                "error": f"labelled {label} but has no check in CHECKS"})
+    return results
+
+
+def verify_guides(paths, out_dir=SNIPPET_DIR, max_n=10 ** 6, seed=0):
+    """`verify` the guides in `paths`, summarised as one `guidekit.driver` result per guide."""
+    out = []
+    for path in paths:
+        t0 = time.perf_counter()
+        results = verify([path.stem], max_n, seed, out_dir)
+        failed = [f"{r['name']}: {r['error']}" for r in results if "error" in r]
+        if failed:
+            out.append({"guide": path.stem, "error": "; ".join(failed)})
+            continue
+        checked = ", ".join(f"{r['name']} n^{r['exponent']:.2f}" for r in results)
+        out.append({"guide": path.stem, "skipped": False, "seconds": time.perf_counter() - t0,
+                    "rss_kb": _peak_rss_kb(), "pages": "-",
+                    "note": f"verified: {checked}" if checked else "nothing to verify"})
+    return out
+
+
+def format_results(results):
+    lines = [f"{'guide':<18} {'function':<28} {'label':<10} {'exponent':>8}"]
+    for r in results:
+        exponent = f"{r['exponent']:.2f}" if "exponent" in r else "-"
+        line = f"{r['guide']:<18} {r['name']:<28} {r['label'] or '-':<10} {exponent:>8}"
+        lines.append(f"{line}  FAILED  {r['error']}" if "error" in r else line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m guidekit.verify",
+        description="Check the guides' published code against brute force and measure its growth.")
+    ap.add_argument("guides", nargs="*", help="guide names (default: all)")
+    ap.add_argument("--max-n", type=int, default=10 ** 6,
+        help=f"largest input size timed (at least {MIN_MAX_N})")
+    ap.add_argument("--seed", type=int, default=0, help="random seed for the inputs")
+    args = ap.parse_args(argv)
+    if args.max_n < MIN_MAX_N:
+        ap.error(f"--max-n must be at least {MIN_MAX_N}")
+
+    results = verify([p.stem for p in select_guides(args.guides)], args.max_n, args.seed)
+    print(format_results(results))
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Diagram helpers that draw arrays, lists, stacks and queues as styled tables."""
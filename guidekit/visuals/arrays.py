@@ -0,0 +1,106 @@
+"""Array visualisers: two-pointer positions and sliding windows."""
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.units import inch
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from guidekit.blocks import P, helper
+from guidekit.palette import (
+    C_ACCENT, C_ACCENT2, C_BODY, C_BORDER, C_CARD, C_GREEN, C_HEADING, C_MUTED, C_ORANGE,
+    CW, PAGE_W,
+)
+from guidekit.styles import S
+
+
+@helper
+def pointer_vis(cells, left_idx=0, right_idx=None, labels=None, mid_idx=None, extra_idx=None):
+    """Render a visual array showing pointer positions."""
+    n = len(cells)
+    if right_idx is None:
+        right_idx = n - 1
+
+    col_w = min(52, int((PAGE_W - 1.5*inch) / n))
+
+    # Value row
+    val_row = []
+    for i, v in enumerate(cells):
+        if i == left_idx:
+            fg = C_ACCENT
+        elif i == right_idx and right_idx != left_idx:
+            fg = C_ACCENT2
+        elif mid_idx is not None and i == mid_idx:
+            fg = C_GREEN
+        elif extra_idx is not None and i == extra_idx:
+            fg = C_ORANGE
+        else:
+            fg = C_BODY
+        val_row.append(P(f"<b>{v}</b>", S("_", fontName="Courier-Bold", fontSize=11, textColor=fg, alignment=TA_CENTER)))
+
+    # Index row
+    idx_row = [P(str(i), S("_", fontName="Courier", fontSize=8, textColor=C_MUTED, alignment=TA_CENTER)) for i in range(n)]
+
+    # Pointer label row
+    ptr_row = []
+    for i in range(n):
+        pts = []
+        if i == left_idx:
+            pts.append(labels[0] if labels else "L")
+        if i == right_idx and right_idx != left_idx:
+            pts.append(labels[1] if labels and len(labels) > 1 else "R")
+        if mid_idx is not None and i == mid_idx:
+            pts.append(labels[2] if labels and len(labels) > 2 else "M")
+        if extra_idx is not None and i == extra_idx:
+            pts.append(labels[3] if labels and len(labels) > 3 else "E")
+        label_txt = "/".join(pts) if pts else ""
+        clr = C_ACCENT if (i == left_idx) else (C_ACCENT2 if i == right_idx else (C_GREEN if i == mid_idx else C_ORANGE))
+        ptr_row.append(P(f"<b>{label_txt}</b>", S("_", fontName="Helvetica-Bold", fontSize=8, textColor=clr, alignment=TA_CENTER)))
+
+    tbl = Table([ptr_row, val_row, idx_row],
+        colWidths=[col_w]*n,
+        style=TableStyle([
+            ('BACKGROUND', (0,1), (-1,1), C_CARD),
+            ('BOX', (0,1), (-1,1), 1, C_BORDER),
+            ('INNERGRID', (0,1), (-1,1), 0.5, C_BORDER),
+            ('BACKGROUND', (left_idx,1), (left_idx,1), colors.HexColor("#0A2E3A")),
+            ('BACKGROUND', (right_idx,1), (right_idx,1), colors.HexColor("#1A1040")),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('TOPPADDING', (0,1), (-1,1), 8), ('BOTTOMPADDING', (0,1), (-1,1), 8),
+            ('TOPPADDING', (0,0), (-1,0), 2), ('BOTTOMPADDING', (0,0), (-1,0), 2),
+            ('TOPPADDING', (0,2), (-1,2), 2), ('BOTTOMPADDING', (0,2), (-1,2), 2),
+        ]))
+    return [tbl, Spacer(1, 6)]
+
+
+@helper
+def window_vis(cells, left, right, highlight_color=C_ACCENT, labels=("left","right"), extra=None):
+    """Render array with highlighted window [left..right]."""
+    n = len(cells)
+    col_w = min(50, int(CW / n))
+    ptr_row, val_row, idx_row = [], [], []
+    for i, v in enumerate(cells):
+        in_win = left <= i <= right
+        is_left  = i == left
+        is_right = i == right
+        is_extra = extra is not None and i == extra
+
+        pts = []
+        if is_left:  pts.append(labels[0])
+        if is_right and not (is_left and left == right): pts.append(labels[1])
+        if is_extra: pts.append("mid")
+        ptr_label = "/".join(pts)
+        ptr_color = C_ACCENT if is_left else (C_ACCENT2 if is_right else C_GREEN)
+
+        fg = C_HEADING if in_win else C_MUTED
+        ptr_row.append(P(f"<b>{ptr_label}</b>", S("_", fontName="Helvetica-Bold", fontSize=7.5, textColor=ptr_color, alignment=TA_CENTER)))
+        val_row.append(P(f"<b>{v}</b>",          S("_", fontName="Courier-Bold",   fontSize=11, textColor=fg, alignment=TA_CENTER)))
+        idx_row.append(P(str(i),                  S("_", fontName="Courier",         fontSize=8,  textColor=C_MUTED, alignment=TA_CENTER)))
+
+    tbl = Table([ptr_row, val_row, idx_row], colWidths=[col_w]*n,
+        style=TableStyle([
+            ("BOX",(0,1),(-1,1),1,C_BORDER),("INNERGRID",(0,1),(-1,1),0.5,C_BORDER),
+            ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+            ("TOPPADDING",(0,1),(-1,1),7),("BOTTOMPADDING",(0,1),(-1,1),7),
+            ("TOPPADDING",(0,0),(-1,0),2),("BOTTOMPADDING",(0,0),(-1,0),2),
+            ("TOPPADDING",(0,2),(-1,2),2),("BOTTOMPADDING",(0,2),(-1,2),2),
+        ]))
+    return [tbl, Spacer(1,5)]
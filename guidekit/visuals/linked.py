@@ -0,0 +1,115 @@
+"""Linked-list visualiser: a chain of nodes joined by arrows."""
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from guidekit.blocks import P, helper
+from guidekit.palette import (
+    C_ACCENT, C_ACCENT2, C_BODY, C_BORDER, C_CARD, C_GREEN, C_HEADING, C_MUTED, C_ORANGE,
+    C_PURPLE, C_RED, C_TEAL, C_YELLOW,
+)
+from guidekit.styles import S, sCaption
+
+
+@helper
+def node_chain(values, highlight=None, null_end=True, labels=None,
+               null_label="None", pointer_labels=None):
+    """
+    Renders a horizontal linked-list chain as a table.
+    values: list of node data values (strings or ints)
+    highlight: list of indices to colour differently
+    labels: list of label strings shown above each node (e.g. 'head', 'curr')
+    pointer_labels: dict {index: label} shown BELOW nodes
+    """
+    highlight = highlight or []
+    n = len(values)
+    node_w = 52
+    arrow_w = 28
+    null_w  = 46
+
+    cols = []
+    col_ws = []
+    for i in range(n):
+        cols.append(i)
+        col_ws.append(node_w)
+        if i < n - 1:
+            cols.append(f"a{i}")
+            col_ws.append(arrow_w)
+    if null_end:
+        cols.append("null")
+        col_ws.append(null_w)
+
+    # Row 1: pointer labels above
+    top_row = []
+    for c in cols:
+        if isinstance(c, int):
+            lbl = (labels[c] if labels and c < len(labels) else "")
+            clr = C_ACCENT if c == 0 else (C_ACCENT2 if c == n-1 else C_GREEN)
+            top_row.append(P(f"<b>{lbl}</b>", S("_", fontName="Helvetica-Bold",
+                fontSize=7.5, textColor=clr if lbl else C_MUTED, alignment=TA_CENTER)))
+        else:
+            top_row.append(P("", sCaption))
+
+    # Row 2: node boxes and arrows
+    mid_row = []
+    for c in cols:
+        if isinstance(c, int):
+            v = str(values[c])
+            bg_key = c in highlight
+            fg = C_HEADING if bg_key else C_BODY
+            mid_row.append(P(f"<b>{v}</b>", S("_", fontName="Courier-Bold",
+                fontSize=11, textColor=fg, alignment=TA_CENTER)))
+        elif c == "null":
+            mid_row.append(P(f"<b>{null_label}</b>", S("_", fontName="Courier-Bold",
+                fontSize=9, textColor=C_MUTED, alignment=TA_CENTER)))
+        else:
+            mid_row.append(P("→", S("_", fontName="Helvetica-Bold",
+                fontSize=14, textColor=C_ACCENT, alignment=TA_CENTER)))
+
+    # Row 3: pointer labels below
+    bot_row = []
+    ptr_lbl = pointer_labels or {}
+    for c in cols:
+        if isinstance(c, int) and c in ptr_lbl:
+            lbl = ptr_lbl[c]
+            clrs = {"slow": C_GREEN, "fast": C_RED, "prev": C_ACCENT,
+                    "curr": C_ACCENT2, "next": C_YELLOW, "left": C_ACCENT,
+                    "right": C_ACCENT2, "dummy": C_PURPLE, "head": C_ACCENT,
+                    "mid": C_GREEN, "p1": C_ORANGE, "p2": C_TEAL,
+                    "k-group": C_PURPLE}
+            clr = clrs.get(lbl.lower().split("/")[0], C_MUTED)
+            bot_row.append(P(f"<b>{lbl}</b>", S("_", fontName="Helvetica-Bold",
+                fontSize=7.5, textColor=clr, alignment=TA_CENTER)))
+        else:
+            bot_row.append(P("", sCaption))
+
+    tbl_data = [top_row, mid_row, bot_row]
+
+    # Build background highlights for mid_row
+    style_cmds = [
+        ("BACKGROUND",(0,1),(-1,1), C_CARD),
+        ("BOX",(0,1),(-1,1), 1, C_BORDER),
+        ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+        ("TOPPADDING",(0,1),(-1,1),7),("BOTTOMPADDING",(0,1),(-1,1),7),
+        ("TOPPADDING",(0,0),(-1,0),2),("BOTTOMPADDING",(0,0),(-1,0),2),
+        ("TOPPADDING",(0,2),(-1,2),2),("BOTTOMPADDING",(0,2),(-1,2),2),
+    ]
+    # highlight node cells
+    col_pos = 0
+    node_col_positions = []
+    for c in cols:
+        if isinstance(c, int):
+            node_col_positions.append((c, col_pos))
+            if c in highlight:
+                style_cmds.append(("BACKGROUND",(col_pos,1),(col_pos,1), colors.HexColor("#0A2E3A")))
+        col_pos += 1
+
+    # draw node borders
+    col_pos = 0
+    for c in cols:
+        if isinstance(c, int):
+            style_cmds.append(("BOX",(col_pos,1),(col_pos,1),1,C_BORDER))
+        col_pos += 1
+
+    tbl = Table(tbl_data, colWidths=col_ws, style=TableStyle(style_cmds))
+    return [tbl, Spacer(1,6)]
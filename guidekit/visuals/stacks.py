@@ -0,0 +1,112 @@
+"""Stack, queue and monotonic-stack visualisers."""
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.platypus import Spacer, Table, TableStyle
+
+from guidekit.blocks import P, helper
+from guidekit.palette import (
+    C_ACCENT, C_BODY, C_BORDER, C_CARD, C_DARK2, C_GREEN, C_MUTED, C_YELLOW, CW,
+)
+from guidekit.styles import S, sCaption
+
+
+@helper
+def stack_vis(items, label="Stack", highlight_top=True, direction="vertical"):
+    """Render a vertical stack with top-of-stack indicated."""
+    if not items:
+        tbl = Table([[P("(empty)", S("_", fontName="Courier-Oblique", fontSize=9,
+            textColor=C_MUTED, alignment=TA_CENTER))]],
+            colWidths=[90], style=TableStyle([
+                ("BOX",(0,0),(-1,-1),1,C_BORDER),("BACKGROUND",(0,0),(-1,-1),C_CARD),
+                ("TOPPADDING",(0,0),(-1,-1),8),("BOTTOMPADDING",(0,0),(-1,-1),8)]))
+        return [tbl, Spacer(1,4)]
+
+    rows = []
+    for i, v in enumerate(reversed(items)):
+        is_top = (i == 0)
+        fg  = C_ACCENT if (is_top and highlight_top) else C_BODY
+        lbl_txt = " ← top" if (is_top and highlight_top) else ""
+        rows.append([
+            P(f"<b>{v}</b>", S("_", fontName="Courier-Bold", fontSize=11, textColor=fg, alignment=TA_CENTER)),
+            P(lbl_txt, S("_", fontName="Helvetica", fontSize=8, textColor=C_ACCENT))
+        ])
+    tbl = Table(rows, colWidths=[70, 60], style=TableStyle([
+        ("BACKGROUND",(0,0),(-1,-1),C_CARD),
+        ("BACKGROUND",(0,0),(1,0), colors.HexColor("#0A2E3A")) if highlight_top else ("BACKGROUND",(0,0),(0,0),C_CARD),
+        ("BOX",(0,0),(-1,-1),1,C_BORDER),("INNERGRID",(0,0),(-1,-1),0.5,C_BORDER),
+        ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+        ("TOPPADDING",(0,0),(-1,-1),6),("BOTTOMPADDING",(0,0),(-1,-1),6),
+        ("LEFTPADDING",(0,0),(-1,-1),8)]))
+    return [tbl, Spacer(1,4)]
+
+@helper
+def queue_vis(items, label="Queue"):
+    """Render a horizontal queue with front/rear indicated."""
+    if not items:
+        tbl = Table([[P("(empty)", S("_", fontName="Courier-Oblique", fontSize=9,
+            textColor=C_MUTED, alignment=TA_CENTER))]],
+            colWidths=[100], style=TableStyle([
+                ("BOX",(0,0),(-1,-1),1,C_BORDER),("BACKGROUND",(0,0),(-1,-1),C_CARD),
+                ("TOPPADDING",(0,0),(-1,-1),8),("BOTTOMPADDING",(0,0),(-1,-1),8)]))
+        return [tbl, Spacer(1,4)]
+
+    n = len(items)
+    col_w = min(55, int(CW / (n + 2)))
+    lbl_row, val_row = [], []
+
+    for i, v in enumerate(items):
+        is_front = (i == 0)
+        is_rear  = (i == n - 1)
+        fg  = C_ACCENT if is_front else (C_GREEN if is_rear else C_BODY)
+        lbl = "front" if is_front else ("rear" if is_rear else "")
+        lbl_row.append(P(f"<b>{lbl}</b>", S("_", fontName="Helvetica-Bold", fontSize=7.5, textColor=fg, alignment=TA_CENTER)))
+        val_row.append(P(f"<b>{v}</b>",   S("_", fontName="Courier-Bold",   fontSize=11, textColor=fg, alignment=TA_CENTER)))
+
+    tbl = Table([lbl_row, val_row], colWidths=[col_w]*n, style=TableStyle([
+        ("BOX",(0,1),(-1,1),1,C_BORDER),("INNERGRID",(0,1),(-1,1),0.5,C_BORDER),
+        ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+        ("TOPPADDING",(0,1),(-1,1),7),("BOTTOMPADDING",(0,1),(-1,1),7),
+        ("TOPPADDING",(0,0),(-1,0),2),("BOTTOMPADDING",(0,0),(-1,0),2)]))
+    return [tbl, Spacer(1,4)]
+
+@helper
+def mono_stack_vis(stack_vals, current=None, action="", result_map=None, arr=None, arr_highlight=None):
+    """Show monotonic stack state with current element and action."""
+    rows = []
+    # Array context row
+    if arr is not None:
+        hl = arr_highlight or []
+        arr_cells = []
+        for i, v in enumerate(arr):
+            fg = C_YELLOW if i in hl else C_MUTED
+            arr_cells.append(P(str(v), S("_", fontName="Courier-Bold", fontSize=9, textColor=fg, alignment=TA_CENTER)))
+        arr_tbl = Table([arr_cells], colWidths=[28]*len(arr), style=TableStyle([
+            ("BOX",(0,0),(-1,-1),0.5,C_BORDER),("INNERGRID",(0,0),(-1,-1),0.5,C_BORDER),
+            ("BACKGROUND",(0,0),(-1,-1),C_DARK2),
+            ("TOPPADDING",(0,0),(-1,-1),4),("BOTTOMPADDING",(0,0),(-1,-1),4)]))
+        rows.append([arr_tbl, P("", sCaption), P("", sCaption)])
+
+    # Stack row
+    if stack_vals:
+        s_cells = [P(str(v), S("_", fontName="Courier-Bold", fontSize=10,
+            textColor=C_ACCENT, alignment=TA_CENTER)) for v in stack_vals]
+        s_tbl = Table([s_cells], colWidths=[30]*len(stack_vals), style=TableStyle([
+            ("BOX",(0,0),(-1,-1),1,C_BORDER),("INNERGRID",(0,0),(-1,-1),0.5,C_BORDER),
+            ("BACKGROUND",(0,0),(-1,-1),colors.HexColor("#0A1E3A")),
+            ("TOPPADDING",(0,0),(-1,-1),5),("BOTTOMPADDING",(0,0),(-1,-1),5)]))
+        stack_label = P("stack →", S("_", fontName="Helvetica", fontSize=8, textColor=C_MUTED))
+    else:
+        s_tbl = P("stack: []", S("_", fontName="Courier", fontSize=9, textColor=C_MUTED))
+        stack_label = P("", sCaption)
+
+    curr_p = P(f"curr={current}" if current is not None else "",
+        S("_", fontName="Courier-Bold", fontSize=9, textColor=C_YELLOW))
+    act_p  = P(action, S("_", fontName="Helvetica", fontSize=9, textColor=C_GREEN))
+
+    tbl = Table([[stack_label, s_tbl, curr_p, act_p]],
+        colWidths=[50, min(len(stack_vals)*30+10 if stack_vals else 60, 200), 70, CW-50-min(len(stack_vals)*30+10 if stack_vals else 60, 200)-70],
+        style=TableStyle([
+            ("VALIGN",(0,0),(-1,-1),"MIDDLE"),
+            ("TOPPADDING",(0,0),(-1,-1),3),("BOTTOMPADDING",(0,0),(-1,-1),3),
+            ("LEFTPADDING",(0,0),(-1,-1),0)]))
+    return [tbl, Spacer(1,3)]
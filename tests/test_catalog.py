@@ -0,0 +1,17 @@
+"""The cached catalog is rebuilt when the guides or the extraction code change."""
+from guidekit import catalog
+from guidekit.driver import select_guides
+
+
+def test_cache_keyed_on_toolkit(tmp_path, monkeypatch):
+    paths, path = select_guides(["prefixsum"]), tmp_path / "catalog.json"
+    builds = []
+    build = catalog.build
+    monkeypatch.setattr(catalog, "build", lambda paths: builds.append(1) or build(paths))
+    first = catalog.load(paths, path)
+    assert catalog.load(paths, path).problems == first.problems
+    assert len(builds) == 1
+    monkeypatch.setattr(catalog, "toolkit_digest", lambda: "another toolkit")
+    catalog.load(paths, path)
+    assert len(builds) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["catalog.json"]
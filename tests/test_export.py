@@ -0,0 +1,15 @@
+"""The HTML page has one table of contents: its own nav, not the guide's contents page."""
+import pytest
+
+from guidekit.driver import run_guide, select_guides
+from guidekit.export import html
+from guidekit.model import document
+
+
+@pytest.mark.parametrize("path", select_guides([]), ids=lambda p: p.stem)
+def test_html_has_one_contents(path):
+    page = html.render(document(run_guide(path), path.stem))
+    assert page.count('<nav class="toc">') == 1
+    assert 'class="toc"' not in page.replace('<nav class="toc">', "")
+    assert 'class="tocsub"' not in page
+    assert "Table of Contents" not in page
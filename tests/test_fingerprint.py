@@ -0,0 +1,72 @@
+"""Fingerprints change with everything that shapes the output: code, class constants,
+globals and the toolkit sources."""
+import functools
+
+import pytest
+
+from guidekit import cache, flowables, sections
+from guidekit import fingerprint as fingerprint_mod
+from guidekit.driver import build_guide, run_guide, select_guides
+from guidekit.fingerprint import fingerprint, guide_fingerprint, source_digest
+from guidekit.flowables import CodeBlock
+from guidekit.story import build_story
+
+
+@pytest.fixture
+def block():
+    return CodeBlock(["def f(x):", "    return x  ## identity"], highlight=True)
+
+
+def test_stable(block):
+    assert fingerprint(block) == fingerprint(CodeBlock(list(block.lines), highlight=True))
+
+
+def test_class_constant(block, monkeypatch):
+    before = fingerprint(block)
+    monkeypatch.setattr(CodeBlock, "LEADING", 20)
+    assert fingerprint(block) != before
+
+
+def test_module_global_read_by_method(block, monkeypatch):
+    before = fingerprint(block)
+    monkeypatch.setattr(flowables, "CODE_SIZE", 11)
+    assert fingerprint(block) != before
+
+
+def test_nested_global_value(block, monkeypatch):
+    before = fingerprint(block)
+    monkeypatch.setitem(flowables.CODE_STYLES, "kw", ("Courier", flowables.C_GREEN))
+    assert fingerprint(block) != before
+
+
+def test_incremental_build_rebuilds_after_constant_edit(tmp_path, monkeypatch):
+    monkeypatch.setattr(sections, "SectionCache",
+                        functools.partial(sections.SectionCache, tmp_path / "sections"))
+    path = select_guides(["prefixsum"])[0]
+    manifest = {}
+    first = build_guide(path, tmp_path, manifest)
+    cache.record(manifest, first)
+    assert build_guide(path, tmp_path, manifest)["skipped"]
+
+    monkeypatch.setattr(CodeBlock, "LEADING", 20)
+    again = build_guide(path, tmp_path, manifest)
+    assert not again["skipped"]
+    hits, total = again["sections"]
+    assert hits < total                 # sections with code blocks are laid out again
+
+
+def test_source_digest(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("X = 1\n")
+    before = source_digest(tmp_path)
+    assert source_digest(tmp_path) == before
+    (tmp_path / "pkg" / "mod.py").write_text("X = 2\n")
+    assert source_digest(tmp_path) != before
+
+
+def test_guide_fingerprint_covers_toolkit(monkeypatch):
+    g = run_guide(select_guides(["prefixsum"])[0])
+    story = build_story(g["SECTIONS"])
+    before = guide_fingerprint(g, story)
+    monkeypatch.setattr(fingerprint_mod, "toolkit_digest", lambda: "edited")
+    assert guide_fingerprint(g, story) != before
@@ -0,0 +1,10 @@
+"""The token cache never serves runs from another version of the scanner."""
+from guidekit import highlight
+
+
+def test_key_is_salted_with_scanner(monkeypatch):
+    lines = ["x = 1  # one"]
+    before = highlight._key(lines)
+    assert highlight._key(lines) == before
+    monkeypatch.setattr(highlight, "_SCANNER", b"another scanner")
+    assert highlight._key(lines) != before
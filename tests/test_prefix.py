@@ -0,0 +1,73 @@
+"""The NumPy prefix-sum engines: bounds, overflow and partial output."""
+import numpy as np
+import pytest
+
+from guidekit.prefix.area import SummedAreaTable
+from guidekit.prefix.mapped import MappedPrefix
+from guidekit.prefix.vector import build_2d_prefix, build_prefix, range_sum, rect_sum
+
+
+def test_area_matches_brute_force(tmp_path):
+    image = np.arange(35).reshape(5, 7) % 4
+    for sat in (SummedAreaTable.build(image, tile_rows=2),
+                SummedAreaTable.build(image, out=tmp_path / "sat.npy", tile_rows=2)):
+        assert sat.rect_sum(1, 2, 3, 5) == image[1:4, 2:6].sum()
+    assert np.array_equal(SummedAreaTable.open(tmp_path / "sat.npy").table, sat.table)
+
+
+def test_area_overflow_leaves_no_file(tmp_path):
+    out = tmp_path / "sat.npy"
+    image = np.full((4, 2), 2 ** 62, dtype=np.int64)
+    with pytest.raises(OverflowError):
+        SummedAreaTable.build(image, out=out, tile_rows=1)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.uint64, np.float32])
+def test_area_rejects_narrow_accumulators(dtype):
+    with pytest.raises(TypeError):
+        SummedAreaTable.build(np.ones((2, 2)), dtype=dtype)
+
+
+def test_range_sum_bounds():
+    prefix = build_prefix([3, 1, 4, 1, 5])
+    assert range_sum(prefix, 1, 3) == 6
+    assert range_sum(prefix, [], []).shape == (0,)
+    assert list(range_sum(prefix, [0, 2], [4, 2])) == [14, 4]
+    assert rect_sum(build_2d_prefix([[1, 2], [3, 4]]), [], [], [], []).shape == (0,)
+    for lo, hi in [(-1, 2), (0, 5), (3, 1), ([0, 4], [1, 5])]:
+        with pytest.raises(IndexError):
+            range_sum(prefix, lo, hi)
+
+
+def test_mapped_overflow_leaves_no_file(tmp_path):
+    out = tmp_path / "prefix.npy"
+    with pytest.raises(OverflowError, match="value 3"):
+        MappedPrefix.build([np.ones(1, np.int64), np.full(2, 2 ** 62, dtype=np.int64)], out)
+    assert list(tmp_path.iterdir()) == []
+    assert MappedPrefix.build([np.arange(2), np.arange(2, 5)], out).range_sum(1, 3) == 6
+
+
+def test_range_sum_rejects_non_integer_bounds():
+    prefix = build_prefix([1, 2, 3, 4])
+    assert range_sum(prefix, np.uint8(1), np.int32(2)) == 5
+    for lo, hi in [([0.5], [2]), (0, 2.0), ([True], [True])]:
+        with pytest.raises(TypeError):
+            range_sum(prefix, lo, hi)
+    with pytest.raises(IndexError):
+        range_sum(prefix, 0, np.uint64(2 ** 64 - 1))
+
+
+def test_build_prefix_rejects_uint64_past_int64():
+    big = np.array([1, 2 ** 63 + 5], dtype=np.uint64)
+    with pytest.raises(OverflowError):
+        build_prefix(big)
+    assert list(build_prefix(np.array([2 ** 63 - 1], dtype=np.uint64))) == [0, 2 ** 63 - 1]
+
+
+def test_rect_mean_rejects_empty_rectangles():
+    sat = SummedAreaTable.build(np.arange(12).reshape(3, 4))
+    assert sat.rect_mean(0, 0, 1, 1) == 2.5
+    assert sat.rect_sum(1, 0, 0, 3) == 0
+    with pytest.raises(ValueError):
+        sat.rect_mean([0, 1], [0, 0], [1, 0], [1, 3])
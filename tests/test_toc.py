@@ -0,0 +1,27 @@
+"""The contents page links to the targets the story places, without building the sections."""
+import pytest
+
+from guidekit.driver import run_guide, select_guides
+from guidekit.model import Anchors
+from guidekit.story import iter_story
+from guidekit.toc import Target, TocEntry, front_matter, headings, table_of_contents, walk
+
+
+@pytest.fixture(params=select_guides([]), ids=lambda p: p.stem)
+def sections(request):
+    return run_guide(request.param)["SECTIONS"]
+
+
+def test_headings_read_from_source(sections):
+    for sec in sections:
+        if sec in front_matter(sections):
+            continue
+        built = [(f.text, level) for f, _, level in walk(sec, Anchors()) if level in (1, 2, 3)]
+        assert headings(sec) == built
+
+
+def test_entries_match_targets(sections):
+    entries = [f.key for f in table_of_contents(sections) if isinstance(f, TocEntry)]
+    targets = {f.key for f in iter_story(sections) if isinstance(f, Target)}
+    assert entries and set(entries) <= targets
+
@@ -0,0 +1,36 @@
+"""A function the guide labels linear is either checked or reported unchecked."""
+import pytest
+
+from guidekit import __main__ as cli
+from guidekit.driver import select_guides
+from guidekit.snippets import build_snippets
+from guidekit.verify import CHECKS, LINEAR, MIN_MAX_N, main, sizes, verify
+
+
+def test_every_linear_label_is_checked(tmp_path):
+    build_snippets(select_guides([]), tmp_path)
+    results = verify([p.stem for p in select_guides([])], max_n=1000, out_dir=tmp_path)
+    assert [r for r in results if "error" in r] == []
+
+
+def test_unchecked_label_fails(tmp_path):
+    build_snippets(select_guides(["prefixsum"]), tmp_path)
+    results = verify(["prefixsum"], max_n=1000, out_dir=tmp_path,
+                     checks=[c for c in CHECKS if c.name != "range_updates"])
+    unchecked = [r for r in results if r["name"] == "range_updates"]
+    assert len(unchecked) == 1 and unchecked[0]["label"] in LINEAR
+    assert "no check" in unchecked[0]["error"]
+
+
+@pytest.mark.parametrize("max_n", [0, 50, 500, MIN_MAX_N - 1])
+def test_small_max_n_is_rejected(max_n, tmp_path):
+    with pytest.raises(ValueError, match="at least"):
+        sizes(max_n)
+    with pytest.raises(ValueError, match="at least"):
+        verify(["prefixsum"], max_n=max_n, out_dir=tmp_path)
+    with pytest.raises(SystemExit):
+        main(["prefixsum", "--max-n", str(max_n)])
+    if max_n:
+        with pytest.raises(SystemExit):
+            cli.main(["--snippets", "-o", str(tmp_path), "--verify-max-n", str(max_n)])
+    assert len(sizes(MIN_MAX_N)) == 2